@@ -0,0 +1,241 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+""" Canonical labeling (canonical.py)
+
+Atoms are ranked by iterative refinement of atom classes (Morgan's
+algorithm, or 1-dimensional Weisfeiler-Lehman): each class is split by the
+sorted classes of neighbors and bond orders until the number of classes
+stops increasing. Remaining ties are broken by individualizing each atom of
+the first tied class and refining again, recursively, and the smallest
+canonical form of the discrete orders found is taken (the search tree of
+nauty and bliss). Only the branches of the smallest refinement results are
+searched, and branches equivalent by automorphisms found in the search
+(same forms of different orders) are pruned.
+
+The canonical form (atom labels in the canonical order and bonds between
+ranks) identifies the structure, and its digest can be used as a
+dictionary key for exact match lookup and deduplication of a library.
+Molecules have the same hash if and only if they have the same structure.
+The refinement digest (CanonicalLabel.invariant) is also the same for the
+same structure, but may be the same for different structures.
+"""
+
+from collections import Counter
+import hashlib
+
+from chorus import molutil
+
+
+def digest(obj):
+    return hashlib.blake2b(repr(obj).encode(), digest_size=16).hexdigest()
+
+
+def refine(colors, adj):
+    """Refine atom classes until the number of classes stops increasing
+
+    Args:
+        colors (dict): atom index -> class (comparable)
+        adj (dict): atom index -> list of (neighbor, bond type)
+
+    Returns:
+        tuple: (colors, history) colors: atom index -> class rank,
+        history: list of class signatures and counts of each iteration
+    """
+    classes = len(set(colors.values()))
+    history = []
+    while True:
+        sigs = {k: (c, tuple(sorted((b, colors[n]) for n, b in adj[k])))
+                for k, c in colors.items()}
+        counts = sorted(Counter(sigs.values()).items())
+        # the previous class is the first item of the signature, so the
+        # order of classes is kept and they are only split
+        rank = {s: i for i, (s, _) in enumerate(counts)}
+        colors = {k: rank[s] for k, s in sigs.items()}
+        history.append(counts)
+        if len(counts) == classes:
+            return colors, history
+        classes = len(counts)
+
+
+def orbit(k, autos):
+    """Atoms mapped from the atom by the automorphisms"""
+    res = {k}
+    stack = [k]
+    while stack:
+        n = stack.pop()
+        for auto in autos:
+            if auto[n] not in res:
+                res.add(auto[n])
+                stack.append(auto[n])
+    return res
+
+
+def search(colors, labels, adj, bonds):
+    """Search discrete orders given by individualization of each atom of the
+    first tied class and refinement, recursively (depth first), and return
+    the smallest form
+
+    Args:
+        colors (dict): refined atom classes (see refine)
+        labels (dict): atom index -> atom label
+        adj (dict): atom index -> list of (neighbor, bond type)
+        bonds (list): (atom index, atom index, bond type)
+
+    Returns:
+        tuple: (form, colors) the smallest form (see CanonicalLabel) and the
+        discrete colors (atom index -> rank) which give the form
+    """
+    leaves = {}  # "first", "best" -> (form, colors, path)
+    autos = []  # automorphisms found (atom index -> atom index)
+
+    def leaf(colors, path):
+        # Returns depth of the search to go back to
+        keys = sorted(colors, key=colors.get)
+        bs = []
+        for u, v, b in bonds:
+            ru, rv = sorted((colors[u], colors[v]))
+            bs.append((ru, rv, b))
+        form = (tuple(labels[k] for k in keys), tuple(sorted(bs)))
+        if not leaves:
+            leaves["first"] = leaves["best"] = (form, colors, path)
+            return len(path)
+        if form < leaves["best"][0]:
+            leaves["best"] = (form, colors, path)
+            return len(path)
+        refs = [leaves["first"]]
+        if leaves["best"] is not leaves["first"]:
+            refs.append(leaves["best"])
+        for ref_form, ref_colors, ref_path in refs:
+            if form != ref_form:
+                continue
+            auto = {k: keys[c] for k, c in ref_colors.items()}
+            autos.append(auto)
+            d = 0
+            while path[d] == ref_path[d]:
+                d += 1
+            if all(auto[ref_path[i]] == path[i] for i in range(d + 1)):
+                # The automorphism maps the searched branch of the reference
+                # to the current branch, so the rest of the branch is same
+                return d
+        return len(path)
+
+    def node(colors, path):
+        # Returns depth of the search to go back to
+        classes = Counter(colors.values())
+        if len(classes) == len(colors):
+            return leaf(colors, path)
+        tied = min(c for c, cnt in classes.items() if cnt > 1)
+        children = []
+        for k in sorted(k for k, c in colors.items() if c == tied):
+            res = refine({n: (c, n != k) for n, c in colors.items()}, adj)
+            children.append((res[1], k, res[0]))
+        # Branches of larger refinement results are not searched
+        trace = min(c[0] for c in children)
+        searched = set()
+        for history, k, child in children:
+            if history != trace:
+                continue
+            # Atoms mapped by automorphisms which fix the path give
+            # equivalent branches
+            fixing = [a for a in autos if all(a[p] == p for p in path)]
+            if searched.intersection(orbit(k, fixing)):
+                continue
+            searched.add(k)
+            depth = node(child, path + [k])
+            if depth < len(path):
+                return depth
+        return len(path)
+
+    node(colors, [])
+    form, colors, _ = leaves["best"]
+    return form, colors
+
+
+class CanonicalLabel(object):
+    """ Canonical labeling of a molecule
+
+    Atoms are labeled by symbol, pi electrons and (optionally) charge, and
+    bonds by order as given. Aromatic flags are not used because ring
+    perception of fused ring systems depends on the atom numbering.
+
+    Args:
+        mol: Compound
+        charge (bool): distinguish charges of atoms
+        bond_order (bool): distinguish bond orders
+
+    Attributes:
+        ranks (dict): atom index -> canonical rank (from 0)
+        keys (list): atom indices in the canonical order
+        form (tuple): (atom labels in the canonical order, sorted bonds as
+            (rank, rank, bond order))
+        hash (str): digest of the form
+        invariant (str): digest of the refinement before ties are broken
+        discrete (bool): whether the refinement ranked all atoms without
+            ties (the canonical order is unique then)
+    """
+    def __init__(self, mol, charge=True, bond_order=True):
+        labels = {}
+        for k, a in mol.atoms_iter():
+            labels[k] = (a.symbol, int(a.pi), a.charge if charge else 0)
+        adj = {}
+        for k, nbrs in mol.neighbors_iter():
+            adj[k] = [(n, b.order if bond_order else 1)
+                      for n, b in nbrs.items()]
+        colors, history = refine(labels, adj)
+        self.invariant = digest(history)
+        self.discrete = len(set(colors.values())) == len(colors)
+        bonds = [(u, v, b.order if bond_order else 1)
+                 for u, v, b in mol.bonds_iter()]
+        self.form, self.ranks = search(colors, labels, adj, bonds)
+        self.keys = sorted(self.ranks, key=self.ranks.get)
+        self.hash = digest(self.form)
+
+    def mapping(self, other):
+        """Atom mapping (dict: atom index -> atom index of the other) by the
+        canonical order, or None if the canonical forms are different"""
+        if self.form != other.form:
+            return None
+        return dict(zip(self.keys, other.keys))
+
+
+def canonical_label(mol, largest_only=True, ignore_hydrogen=True,
+                    charge=True, bond_order=True):
+    """ CanonicalLabel of the molecule (the molecule is not modified)
+    Args:
+      largest_only, ignore_hydrogen: see substructure.equal
+      charge, bond_order: see CanonicalLabel
+    """
+    if largest_only:
+        mol = molutil.largest_graph(mol)
+    if ignore_hydrogen:
+        mol = molutil.make_Hs_implicit(mol)
+    return CanonicalLabel(mol, charge, bond_order)
+
+
+def canonical_hash(mol, largest_only=True, ignore_hydrogen=True,
+                   charge=True, bond_order=True):
+    """ Hash of the canonical form of the molecule (see canonical_label) """
+    return canonical_label(
+        mol, largest_only, ignore_hydrogen, charge, bond_order).hash
+
+
+def deduplicate(mols, largest_only=True, ignore_hydrogen=True,
+                charge=True, bond_order=True):
+    """ Group molecules of the same structure by the canonical hash
+    Args:
+      mols: iterable of Compound
+      largest_only, ignore_hydrogen, charge, bond_order: see canonical_label
+    Returns:
+      dict: canonical hash -> list of indices of the molecules, in order of
+      the first appearance (unique molecules are the first ones)
+    """
+    groups = {}
+    for i, mol in enumerate(mols):
+        h = canonical_hash(mol, largest_only, ignore_hydrogen, charge,
+                           bond_order)
+        groups.setdefault(h, []).append(i)
+    return groups
@@ -8,15 +8,18 @@ from Cython.Compiler import Options
 
 Options.annotate = True
 
-if sys.platform.startswith("darwin"):  # clang (Mac OS X)
-    ext = Extension(
-        "mcsdr", sources=["mcsdr.pyx"], language="c++",
-        extra_compile_args=["-std=c++11", "-stdlib=libc++"],
-        extra_link_args=["-std=c++11", "-stdlib=libc++"]
-    )
-else:  # gcc
-    ext = Extension(
-        "mcsdr", sources=["mcsdr.pyx"], language="c++"
-    )
+exts = []
+for name in ("mcsdr", "vf2"):
+    if sys.platform.startswith("darwin"):  # clang (Mac OS X)
+        ext = Extension(
+            name, sources=[name + ".pyx"], language="c++",
+            extra_compile_args=["-std=c++11", "-stdlib=libc++"],
+            extra_link_args=["-std=c++11", "-stdlib=libc++"]
+        )
+    else:  # gcc
+        ext = Extension(
+            name, sources=[name + ".pyx"], language="c++"
+        )
+    exts.append(ext)
 
-setup(cmdclass={'build_ext': build_ext}, ext_modules=[ext])
+setup(cmdclass={'build_ext': build_ext}, ext_modules=exts)
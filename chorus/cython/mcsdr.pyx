@@ -1,4 +1,4 @@
-# cython: boundscheck=False, wraparound=False, langage_level=3, profile=True
+# cython: boundscheck=False, wraparound=False, language_level=3, profile=True
 
 #
 # (C) 2014-2017 Seiji Matsuoka
@@ -6,92 +6,423 @@
 # http://opensource.org/licenses/MIT
 #
 
+import time
+
 import cython
+import numpy as np
 
+from cython.operator cimport dereference as deref
+from libc.stdint cimport int64_t, uint64_t
+from libcpp.algorithm cimport sort
+from libcpp.unordered_map cimport unordered_map
+from libcpp.utility cimport pair
 from libcpp.vector cimport vector
-from libc.time cimport clock_t, clock, CLOCKS_PER_SEC
 
+# The kernels work on C arrays without the GIL, so pair comparisons can run
+# concurrently in threads (see mcsdrbatch).
 
-@cython.cdivision(True)
-def comparison_graph(arr1, arr2, double timeout):
-    cdef clock_t t0 = clock()
-    cdef clock_t expire = t0 + <clock_t>(timeout * CLOCKS_PER_SEC)
+
+DEF MATCH_CHUNK = 1 << 16  # number of descriptor matches per timeout check
+DEF MAX_BITSET_WORDS = 1 << 24  # larger adjacency uses set-based search
+
+ctypedef pair[int64_t, int] keyed  # (descriptor, row index)
+
+
+cdef extern from *:
+    """
+    #include <chrono>
+    static double steady_seconds(void) {
+        return std::chrono::duration<double>(
+            std::chrono::steady_clock::now().time_since_epoch()).count();
+    }
+    """
+    # Portable monotonic clock (its epoch may differ from time.monotonic)
+    double monotonic "steady_seconds" () nogil
+
+
+cdef struct Expiry:
+    double expire  # monotonic time
+    unsigned char* cancel  # cancellation flag (NULL: not cancellable)
+
+
+@cython.profile(False)
+cdef inline bint expired(Expiry* e) nogil:
+    return (e.cancel != NULL and e.cancel[0]) or monotonic() >= e.expire
+
+
+cdef Expiry to_expiry(timeout, unsigned char[::1] flag):
+    """timeout: seconds or mcsdr.Deadline (flag: its cancellation flag)"""
+    cdef Expiry e
+    if flag is None:
+        e.expire = monotonic() + timeout
+        e.cancel = NULL
+    else:
+        # the deadline is converted to the clock of the kernels
+        e.expire = monotonic() + (timeout.expire - time.monotonic())
+        e.cancel = &flag[0]
+    return e
+
+
+def deadline_flag(timeout):
+    """Cancellation flag buffer of mcsdr.Deadline (None for seconds)"""
+    return getattr(timeout, "flag", None)
+
+
+@cython.profile(False)
+cdef bint join_descriptors(
+        long long[:, ::1] t1, long long[:, ::1] t2, long long width,
+        Expiry* expiry, vector[long long]& nodes,
+        vector[int]& edges) nogil:
+    """Sort-merge join of descriptors (returns True if timed out)"""
+    cdef vector[keyed] s1, s2
+    cdef unordered_map[long long, int] node_id
+    cdef unordered_map[long long, int].iterator it
+    cdef int i, j, i_end, j_end, a, b, r1, r2, id1, id2
+    cdef long long c, k1, k2
+    cdef long count = 0
+    for i in range(t1.shape[0]):
+        if t1[i, 0] < t1[i, 1]:
+            s1.push_back(keyed(t1[i, 2], i))
+    for j in range(t2.shape[0]):
+        s2.push_back(keyed(t2[j, 2], j))
+    sort(s1.begin(), s1.end())
+    sort(s2.begin(), s2.end())
+    if expired(expiry):
+        return True
+    # Node (u1, u2) is encoded as u1 * width + u2. Node IDs are looked up
+    # in a hash map, so the memory scales with the number of matches.
+    i = j = 0
+    while i < <int>s1.size() and j < <int>s2.size():
+        if s1[i].first < s2[j].first:
+            i += 1
+        elif s1[i].first > s2[j].first:
+            j += 1
+        else:
+            c = s1[i].first
+            i_end = i + 1
+            while i_end < <int>s1.size() and s1[i_end].first == c:
+                i_end += 1
+            j_end = j + 1
+            while j_end < <int>s2.size() and s2[j_end].first == c:
+                j_end += 1
+            count += <long>(i_end - i) * (j_end - j)
+            i = i_end
+            j = j_end
+    node_id.reserve(2 * count)
+    count = 0
+    i = j = 0
+    while i < <int>s1.size() and j < <int>s2.size():
+        if s1[i].first < s2[j].first:
+            i += 1
+            continue
+        if s1[i].first > s2[j].first:
+            j += 1
+            continue
+        c = s1[i].first
+        i_end = i + 1
+        while i_end < <int>s1.size() and s1[i_end].first == c:
+            i_end += 1
+        j_end = j + 1
+        while j_end < <int>s2.size() and s2[j_end].first == c:
+            j_end += 1
+        for a in range(i, i_end):
+            r1 = s1[a].second
+            for b in range(j, j_end):
+                r2 = s2[b].second
+                k1 = t1[r1, 0] * width + t2[r2, 0]
+                k2 = t1[r1, 1] * width + t2[r2, 1]
+                it = node_id.find(k1)
+                if it == node_id.end():
+                    id1 = node_id[k1] = nodes.size()
+                    nodes.push_back(k1)
+                else:
+                    id1 = deref(it).second
+                it = node_id.find(k2)
+                if it == node_id.end():
+                    id2 = node_id[k2] = nodes.size()
+                    nodes.push_back(k2)
+                else:
+                    id2 = deref(it).second
+                edges.push_back(id1)
+                edges.push_back(id2)
+                count += 1
+                if count % MATCH_CHUNK == 0 and expired(expiry):
+                    return True
+        i = i_end
+        j = j_end
+    return False
+
+
+def comparison_graph(arr1, arr2, timeout):
+    """Generate comparison graph (modular product of molecule edges)
+
+    Args:
+        arr1, arr2: sequence of (u, v, descriptor) or numpy.ndarray of them
+        timeout: timeout in seconds or mcsdr.Deadline
+
+    Descriptors of both arrays are sorted and joined group by group, so the
+    cost scales with the number of matches instead of len(arr1) * len(arr2).
+    Only the pairs with u1 < v1 are joined because the reversed pair gives
+    the same undirected edge. The join runs without the GIL.
+
+    Returns:
+        dict: edges: numpy.ndarray of node index pairs, decoder: dict of
+        node index to the pair of line graph nodes (u1, u2), elapsed_time,
+        timeout
+    """
+    cdef double t0 = monotonic()
+    cdef unsigned char[::1] flag = deadline_flag(timeout)
+    cdef Expiry expiry = to_expiry(timeout, flag)
     result = {
-        "edges": [],
+        "edges": np.empty((0, 2), dtype=np.int64),
         "decoder": {},
         "elapsed_time": 0,
         "timeout": False
     }
-    u1a, v1a, c1a = zip(*arr1)
-    u2a, v2a, c2a = zip(*arr2)
-    cdef vector[int] u1 = u1a
-    cdef vector[int] v1 = v1a
-    cdef vector[long long] c1 = c1a
-    cdef vector[int] u2 = u2a
-    cdef vector[int] v2 = v2a
-    cdef vector[long long] c2 = c2a
-    cdef int i, j
-    cdef int i_max = c1.size()
-    cdef int j_max = c2.size()
-    cdef tuple node1, node2
-    encoder = {}
-    for i in range(i_max):
-        for j in range(j_max):
-            if c1[i] == c2[j]:
-                node1 = (u1[i], u2[j])
-                if node1 not in encoder:
-                    encoder[node1] = len(encoder)
-                idx1 = encoder[node1]
-                node2 = (v1[i], v2[j])
-                if node2 not in encoder:
-                    encoder[node2] = len(encoder)
-                idx2 = encoder[node2]
-                result["edges"].append((idx1, idx2))
-                if clock() >= expire:
-                    result["timeout"] = True
-                    break
-        else:
-            continue
-        break
-    result["decoder"] = {v: k for k, v in encoder.items()}
-    result["elapsed_time"] = <double>(clock() - t0) / CLOCKS_PER_SEC
+    t1 = np.ascontiguousarray(arr1, dtype=np.int64).reshape(-1, 3)
+    t2 = np.ascontiguousarray(arr2, dtype=np.int64).reshape(-1, 3)
+    cdef long long[:, ::1] v1 = t1
+    cdef long long[:, ::1] v2 = t2
+    cdef long long width
+    cdef vector[long long] nodes
+    cdef vector[int] edges
+    cdef bint tout = False
+    if len(t1) and len(t2):
+        width = t2[:, :2].max() + 1
+        with nogil:
+            tout = join_descriptors(v1, v2, width, &expiry, nodes, edges)
+    if edges.size():
+        result["edges"] = np.asarray(
+            <int[:edges.size()]>edges.data(), dtype=np.int64).reshape(-1, 2)
+        result["decoder"] = {i: (k // width, k % width)
+                             for i, k in enumerate(nodes)}
+    result["timeout"] = tout
+    result["elapsed_time"] = monotonic() - t0
     return result
 
 
+cdef extern from *:
+    int ctz64 "__builtin_ctzll" (unsigned long long) nogil
+
+
+cdef class BitsetClique:
+    """Maximum clique search on bitset adjacency
+
+    Branch and bound with greedy coloring bounds (Tomita's MCQ with
+    bitset encoding of San Segundo's BBMC). Vertices are indexed in
+    descending order of degree and the adjacency is a packed uint64 row
+    of each vertex. Candidate sets of depths are allocated after the
+    coloring of the root, which bounds the clique size.
+    """
+    cdef int n, words
+    cdef vector[uint64_t] adj
+    cdef vector[uint64_t] levels  # candidate set of each depth
+    cdef vector[uint64_t] uncolored, colorable  # coloring buffers
+    cdef vector[int] order, color  # branching order stack
+    cdef vector[int] clique, best
+    cdef int best_size
+    cdef long steps
+    cdef Expiry expiry
+    cdef bint timeout
+
+    def __cinit__(self, int n):
+        self.n = n
+        self.words = (n + 63) // 64
+        self.adj.resize(n * self.words)
+        self.levels.resize(self.words)
+        self.uncolored.resize(self.words)
+        self.colorable.resize(self.words)
+        self.clique.resize(n)
+        self.best_size = 0
+        self.steps = 0
+        self.timeout = False
+
+    @cython.profile(False)
+    cdef void connect(self, int u, int v) nogil:
+        if u == v:
+            return
+        self.adj[u * self.words + (v >> 6)] |= <uint64_t>1 << (v & 63)
+        self.adj[v * self.words + (u >> 6)] |= <uint64_t>1 << (u & 63)
+
+    @cython.profile(False)
+    cdef void search(self) nogil:
+        cdef int v
+        for v in range(self.n):
+            self.levels[v >> 6] |= <uint64_t>1 << (v & 63)
+        self.expand(0)
+
+    @cython.profile(False)
+    cdef void expand(self, int depth) nogil:
+        cdef int W = self.words
+        cdef uint64_t* P = &self.levels[depth * W]
+        cdef uint64_t* U = &self.uncolored[0]
+        cdef uint64_t* Q = &self.colorable[0]
+        cdef uint64_t* newP
+        cdef uint64_t* row
+        cdef uint64_t rest
+        cdef int base = self.order.size()
+        cdef int kmin = self.best_size - depth + 1
+        cdef int k = 1
+        cdef int i, v, w, x
+        cdef bint remains = True
+        # Greedy coloring. Vertices colored less than kmin can not extend
+        # the current clique to exceed the best, so they are not branched.
+        for w in range(W):
+            U[w] = P[w]
+        while remains:
+            for w in range(W):
+                Q[w] = U[w]
+            for w in range(W):
+                while Q[w]:
+                    v = (w << 6) + ctz64(Q[w])
+                    Q[w] &= Q[w] - 1
+                    U[w] &= ~(<uint64_t>1 << (v & 63))
+                    row = &self.adj[v * W]
+                    for x in range(w, W):
+                        Q[x] &= ~row[x]
+                    if k >= kmin:
+                        self.order.push_back(v)
+                        self.color.push_back(k)
+            k += 1
+            remains = False
+            for w in range(W):
+                if U[w]:
+                    remains = True
+                    break
+        if depth == 0:
+            # k - 1 colors bound the clique size and so the depth
+            self.levels.resize(k * W)
+            P = &self.levels[0]
+        # Branch on vertices in descending order of colors
+        newP = &self.levels[(depth + 1) * W]
+        for i in range(<int>self.order.size() - 1, base - 1, -1):
+            if depth + self.color[i] <= self.best_size:
+                break
+            v = self.order[i]
+            self.clique[depth] = v
+            row = &self.adj[v * W]
+            rest = 0
+            for w in range(W):
+                newP[w] = P[w] & row[w]
+                rest |= newP[w]
+            if rest:
+                self.expand(depth + 1)
+                if self.timeout:
+                    break
+            elif depth + 1 > self.best_size:
+                self.best_size = depth + 1
+                self.best.assign(self.clique.begin(),
+                                 self.clique.begin() + depth + 1)
+            P[v >> 6] &= ~(<uint64_t>1 << (v & 63))
+            # check timeout once per about 1024 words of coloring work
+            self.steps += W
+            if self.steps >= 1024:
+                self.steps = 0
+                if expired(&self.expiry):
+                    self.timeout = True
+                    break
+        self.order.resize(base)
+        self.color.resize(base)
+
+
 @cython.cdivision(True)
-def find_cliques(nodes, edges, double timeout):
-    # Based on networkX v2.1
+def find_cliques(nodes, edges, timeout):
+    """Find a maximum clique
+
+    Args:
+        nodes: iterable of node keys
+        edges: iterable of node key pairs, or numpy.ndarray of them if
+            the keys are integers
+        timeout: timeout in seconds or mcsdr.Deadline
+
+    Returns:
+        dict: max_clique: list of node keys of the maximum clique (or the
+        largest clique found until timeout), elapsed_time, timeout
+    """
     result = {
         "max_clique": [],
         "elapsed_time": 0,
         "timeout": False
     }
-    if len(nodes) == 0:
+    keys = list(nodes)
+    cdef int n = len(keys)
+    if n == 0:
         return result
-    cdef clock_t t0 = clock()
-    cdef clock_t expire = t0 + <clock_t>(timeout * CLOCKS_PER_SEC)
-    cdef int i, u, q, l
-    adj = {n: set() for n in nodes}
-    for u, v in edges:
-        adj[u].add(v)
-        adj[v].add(u)
+    cdef double t0 = monotonic()
+    cdef unsigned char[::1] flag = deadline_flag(timeout)
+    cdef Expiry expiry = to_expiry(timeout, flag)
+    cdef long long[:, ::1] pairs
+    cdef int i
+    if isinstance(edges, np.ndarray):
+        # key arrays of the nodes (ex. comparison_graph result)
+        key_arr = np.asarray(keys)
+        if np.array_equal(key_arr, np.arange(n)):
+            pos = edges
+            if pos.size and not (0 <= pos.min() and pos.max() < n):
+                raise KeyError("Edges have unknown nodes")
+        else:
+            sorter = np.argsort(key_arr, kind="stable")
+            pos = sorter[np.searchsorted(key_arr, edges, sorter=sorter)
+                         .clip(0, n - 1)]
+            if not np.array_equal(key_arr[pos], edges):
+                raise KeyError("Edges have unknown nodes")
+    else:
+        index = {k: i for i, k in enumerate(keys)}
+        pos = np.array([(index[u], index[v]) for u, v in edges],
+                       dtype=np.int64)
+    pos = pos.reshape(-1, 2)
+    # Relabel vertices in descending order of degree
+    degree = np.bincount(pos.ravel(), minlength=n)
+    ordered = np.argsort(-degree, kind="stable")
+    rank = np.empty(n, dtype=np.int64)
+    rank[ordered] = np.arange(n)
+    pairs = np.ascontiguousarray(rank[pos], dtype=np.int64)
+    if <long long>n * ((n + 63) // 64) > MAX_BITSET_WORDS:
+        # bitset adjacency of a large sparse graph is too large
+        clique, tout = set_clique(n, pairs, &expiry)
+        result["max_clique"] = [keys[v] for v in ordered[clique].tolist()]
+        result["timeout"] = tout
+        result["elapsed_time"] = monotonic() - t0
+        return result
+    cdef BitsetClique bc = BitsetClique(n)
+    bc.expiry = expiry
+    with nogil:
+        for i in range(pairs.shape[0]):
+            bc.connect(pairs[i, 0], pairs[i, 1])
+        bc.search()
+    result["max_clique"] = [keys[v] for v in ordered[bc.best].tolist()]
+    result["timeout"] = bc.timeout
+    result["elapsed_time"] = monotonic() - t0
+    return result
+
+
+cdef set_clique(int n, long long[:, ::1] pairs, Expiry* expiry):
+    """Maximum clique search on adjacency sets (Tomita's maximal clique
+    enumeration with pivoting, based on NetworkX 2.1)
+
+    Returns:
+        tuple: (clique, timeout) clique: list of vertices
+    """
+    cdef int i, u, q
+    adj = [set() for _ in range(n)]
+    for i in range(pairs.shape[0]):
+        if pairs[i, 0] != pairs[i, 1]:
+            adj[pairs[i, 0]].add(pairs[i, 1])
+            adj[pairs[i, 1]].add(pairs[i, 0])
+    best = []
     Q = [None]
-    subg = set(nodes)
-    cand = set(nodes)
+    subg = set(range(n))
+    cand = set(range(n))
     u = max_adj(subg, cand, adj)
     ext_u = cand - adj[u]
     stack = []
-    cdef double elapsed
-    cdef int itcount = 0
-    cdef int max_q = 0
     while True:
         if not ext_u:
             Q.pop()
             if not stack:
-                break
-            if clock() >= expire:
-                result["timeout"] = True
-                break
+                return best, False
+            if expired(expiry):
+                return best, True
             subg, cand, ext_u = stack.pop()
             continue
         q = ext_u.pop()
@@ -100,9 +431,8 @@ def find_cliques(nodes, edges, double timeout):
         adj_q = adj[q]
         subg_q = subg & adj_q
         if not subg_q:
-            if len(Q) > max_q:
-                max_q = len(Q)
-                result["max_clique"] = Q[:]
+            if len(Q) > len(best):
+                best = Q[:]
             continue
         cand_q = cand & adj_q
         if cand_q:
@@ -112,13 +442,11 @@ def find_cliques(nodes, edges, double timeout):
             cand = cand_q
             u = max_adj(subg, cand, adj)
             ext_u = cand - adj[u]
-    result["elapsed_time"] = <double>(clock() - t0) / CLOCKS_PER_SEC
-    return result
 
 
-cdef max_adj(subg, cand, adj):
+cdef int max_adj(subg, cand, adj):
     cdef int maxadj = -1
-    cdef int s, numadj, res
+    cdef int s, numadj, res = -1
     for s in subg:
         numadj = len(cand & adj[s])
         if numadj > maxadj:
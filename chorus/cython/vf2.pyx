@@ -0,0 +1,237 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+import cython
+
+from libcpp.vector cimport vector
+
+# Graphs are given as compact adjacency (CSR: neighbors of node i are
+# indices[indptr[i]:indptr[i + 1]]) with nodes numbered from 0, and bits of
+# nodes (words of node i are atoms[i * w:(i + 1) * w]) and edges (bonds[j]
+# is the edge to indices[j]). Bits of the pattern are masks of allowed bits
+# and a target node (or edge) is compatible if bits & ~mask == 0. See
+# substructure.encode and model.query.
+
+
+cdef class Graph:
+    """Graph converted once for repeated matching
+
+    Args:
+        atoms, indptr, indices, bonds: see above
+    """
+    cdef int n, words
+    cdef vector[unsigned long long] atoms, bonds
+    cdef vector[int] ptr, idx
+
+    def __cinit__(self, atoms, indptr, indices, bonds):
+        self.atoms = atoms
+        self.ptr = indptr
+        self.idx = indices
+        self.bonds = bonds
+        self.n = self.ptr.size() - 1
+        self.words = self.atoms.size() // self.n if self.n else 0
+
+    def __len__(self):
+        return self.n
+
+
+cdef class Matcher:
+    """VF2-style state space search of subgraph isomorphisms
+
+    Compatibility of pattern and target nodes is computed at first, and
+    nodes of the pattern are matched in a fixed order (VF2++/VF3): starting
+    from the node of the fewest compatible target nodes (and the highest
+    degree), the next one is the node with most connections to already
+    ordered nodes, ties are broken by the number of compatible nodes and
+    degree. Candidates of a node connected to ordered nodes are the
+    neighbors of the target node mapped to one of them (parent), so most
+    branches are cut at the first bond.
+
+    Iteration yields each mapping as a list of target node index of
+    pattern node i (same mapping found by networkx GraphMatcher
+    subgraph_isomorphisms_iter, or subgraph_monomorphisms_iter if not
+    induced, but in a different order).
+
+    Args:
+        pattern (Graph): bits are masks
+        target (Graph): bits are features
+        induced (bool): if True, target nodes mapped from pattern nodes
+            have no other edges between them (induced subgraph)
+    """
+    cdef Graph g1, g2
+    cdef int n1, n2
+    cdef bint induced
+    cdef vector[char] compat  # pattern node i and target node j: i * n2 + j
+    cdef vector[int] order  # pattern nodes in matching order
+    cdef vector[int] parent  # ordered neighbor of order[d] (-1: none)
+    cdef vector[int] core1, core2  # pattern -> target, target -> pattern
+    cdef vector[int] cursor  # next candidate position of each depth
+    cdef int depth
+    cdef bint finished
+
+    def __cinit__(self, Graph pattern, Graph target, induced=True):
+        self.g1 = pattern
+        self.g2 = target
+        self.induced = induced
+        self.n1 = pattern.n
+        self.n2 = target.n
+        self.core1.assign(self.n1, -1)
+        self.core2.assign(self.n2, -1)
+        self.cursor.assign(self.n1 + 1, 0)
+        self.depth = 0
+        self.finished = self.n1 == 0 or self.n1 > self.n2
+        if not self.finished:
+            self.finished = not self.compatibility()
+        if not self.finished:
+            self.order_nodes()
+
+    @cython.profile(False)
+    cdef bint compatibility(self):
+        """Compute compatible nodes (False if a pattern node has none)"""
+        cdef int i, j, k, cnt, w = self.g1.words
+        self.compat.assign(self.n1 * self.n2, 0)
+        for i in range(self.n1):
+            cnt = 0
+            for j in range(self.n2):
+                for k in range(w):
+                    if self.g2.atoms[j * w + k] & ~self.g1.atoms[i * w + k]:
+                        break
+                else:
+                    self.compat[i * self.n2 + j] = 1
+                    cnt += 1
+            if not cnt:
+                return False
+        return True
+
+    @cython.profile(False)
+    cdef void order_nodes(self):
+        cdef int i, j, d, best, u
+        cdef vector[int] rarity, conn, deg
+        cdef vector[char] ordered
+        rarity.assign(self.n1, 0)
+        for i in range(self.n1):
+            for j in range(self.n2):
+                rarity[i] += self.compat[i * self.n2 + j]
+            deg.push_back(self.g1.ptr[i + 1] - self.g1.ptr[i])
+        conn.assign(self.n1, 0)
+        ordered.assign(self.n1, 0)
+        for d in range(self.n1):
+            best = -1
+            for i in range(self.n1):
+                if ordered[i]:
+                    continue
+                if best < 0 or conn[i] > conn[best] or (
+                        conn[i] == conn[best] and (
+                            rarity[i] < rarity[best] or (
+                                rarity[i] == rarity[best] and
+                                deg[i] > deg[best]))):
+                    best = i
+            ordered[best] = 1
+            self.order.push_back(best)
+            self.parent.push_back(-1)
+            for j in range(self.g1.ptr[best], self.g1.ptr[best + 1]):
+                u = self.g1.idx[j]
+                conn[u] += 1
+                if ordered[u] and self.parent[d] < 0:
+                    self.parent[d] = u
+
+    @cython.profile(False)
+    cdef bint feasible(self, int u, int v) nogil:
+        """Whether the pattern node u can be mapped to the target node v"""
+        cdef int i, j, p, w, mapped1 = 0, mapped2 = 0
+        cdef bint adjacent
+        if self.core2[v] >= 0 or not self.compat[u * self.n2 + v]:
+            return False
+        if self.g2.ptr[v + 1] - self.g2.ptr[v] < \
+                self.g1.ptr[u + 1] - self.g1.ptr[u]:
+            return False
+        # Mapped neighbors of u are mapped to neighbors of v by compatible
+        # edges
+        for i in range(self.g1.ptr[u], self.g1.ptr[u + 1]):
+            p = self.core1[self.g1.idx[i]]
+            if p < 0:
+                continue
+            mapped1 += 1
+            adjacent = False
+            for j in range(self.g2.ptr[v], self.g2.ptr[v + 1]):
+                if self.g2.idx[j] == p:
+                    adjacent = not (self.g2.bonds[j] & ~self.g1.bonds[i])
+                    break
+            if not adjacent:
+                return False
+        if not self.induced:
+            return True
+        # and v has no other mapped neighbors (induced subgraph)
+        for j in range(self.g2.ptr[v], self.g2.ptr[v + 1]):
+            w = self.g2.idx[j]
+            if self.core2[w] >= 0:
+                mapped2 += 1
+        return mapped1 == mapped2
+
+    @cython.profile(False)
+    cdef bint next_match(self) nogil:
+        """Advance to the next mapping (False if there are no more)"""
+        cdef int u, v, w, c
+        if self.finished:
+            return False
+        if self.depth == self.n1:
+            self.depth -= 1  # resume from the last match
+        while self.depth >= 0:
+            u = self.order[self.depth]
+            if self.core1[u] >= 0:
+                self.core2[self.core1[u]] = -1
+                self.core1[u] = -1
+            # target node of the parent (-1: all nodes are candidates)
+            w = -1
+            if self.parent[self.depth] >= 0:
+                w = self.core1[self.parent[self.depth]]
+            while True:
+                c = self.cursor[self.depth]
+                if w >= 0 and c < self.g2.ptr[w + 1] - self.g2.ptr[w]:
+                    v = self.g2.idx[self.g2.ptr[w] + c]
+                elif w < 0 and c < self.n2:
+                    v = c
+                else:
+                    v = -1
+                    break
+                self.cursor[self.depth] = c + 1
+                if self.feasible(u, v):
+                    break
+            if v < 0:
+                self.cursor[self.depth] = 0
+                self.depth -= 1
+                continue
+            self.core1[u] = v
+            self.core2[v] = u
+            self.depth += 1
+            if self.depth == self.n1:
+                return True
+            self.cursor[self.depth] = 0
+        self.finished = True
+        return False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef bint found
+        with nogil:
+            found = self.next_match()
+        if not found:
+            raise StopIteration
+        return list(self.core1)
+
+    def first(self):
+        """The first mapping found or None"""
+        return next(self, None)
+
+
+def matches(pattern, target, induced=True):
+    """Whether the pattern is isomorphic to a subgraph of the target
+    (arguments are the same as Matcher)"""
+    return Matcher(pattern, target, induced).first() is not None
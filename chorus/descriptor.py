@@ -36,6 +36,8 @@ def assign_rotatable(mol):
     """Assign rotatable bonds (single and not terminal and not in ring)"""
     mol.require("Valence")
     mol.require("Topology")
+    for _, _, bond in mol.bonds_iter():
+        bond.rotatable = 0  # Reset for recalculation
     bs = set([(u, v) for u, v, _ in mol.bonds_iter()])
     for r in mol.rings:
         for a, b in iterator.consecutive(r + [r[0]], 2):
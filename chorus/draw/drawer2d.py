@@ -71,7 +71,7 @@ def draw(canvas, mol):
         if atom.H_count:
             cosnbrs = []
             hrzn = (p[0] + 1, p[1])
-            for nbr in mol.graph.neighbors(n):
+            for nbr in mol.neighbors(n):
                 pnbr = mol.atom(nbr).coords
                 try:
                     cosnbrs.append(gm.dot_product(hrzn, pnbr, p) /
@@ -14,7 +14,11 @@ and for common substructure mapping
 
 """
 
+from contextlib import contextmanager
+from math import isqrt
+import struct
 import time
+import zlib
 
 import networkx as nx
 import numpy as np
@@ -55,6 +59,85 @@ def reachables(G, root, max_dist):
     return visited
 
 
+def csr_neighbors(indptr, indices, rows):
+    """Neighbors of the rows of a compact adjacency (CSR)
+
+    Returns:
+        tuple: (rep, nbrs) numpy.ndarray of the position in rows and the
+        neighbor of each pair
+    """
+    starts = indptr[rows]
+    lens = indptr[rows + 1] - starts
+    rep = np.arange(len(rows)).repeat(lens)
+    offsets = np.arange(lens.sum()) - (np.cumsum(lens) - lens).repeat(lens)
+    return rep, indices[starts.repeat(lens) + offsets]
+
+
+class Deadline(object):
+    """Deadline shared by MCS-DR calculation stages
+
+    The deadline is based on monotonic wall-clock time (time.monotonic).
+    The Cython kernels check the remaining time on their own monotonic
+    clock. It can be cancelled from another thread, and elapsed time of
+    each stage is recorded in timings.
+
+    Args:
+        timeout(float): time limit in seconds (None: no limit)
+
+    Attributes:
+        expire(float): time.monotonic() value of the deadline
+        flag(numpy.ndarray): cancellation flag shared with the kernels
+        timings(dict): stage name -> elapsed time in seconds
+    """
+    def __init__(self, timeout=None):
+        self.start = time.monotonic()
+        if timeout is None:
+            self.expire = float("inf")
+        else:
+            self.expire = self.start + timeout
+        self.flag = np.zeros(1, dtype=np.uint8)
+        self.timings = {}
+
+    def child(self, timeout):
+        """Deadline of a sub-stage which expires in timeout seconds or at
+        this deadline. Cancellation and timings are shared."""
+        d = Deadline(timeout)
+        d.expire = min(d.expire, self.expire)
+        d.flag = self.flag
+        d.timings = self.timings
+        return d
+
+    def cancel(self):
+        """Cancel the calculation (thread-safe)"""
+        self.flag[0] = 1
+
+    @property
+    def cancelled(self):
+        return bool(self.flag[0])
+
+    def expired(self):
+        return self.cancelled or time.monotonic() >= self.expire
+
+    def remaining(self):
+        """Remaining time in seconds (0 if expired or cancelled)"""
+        if self.cancelled:
+            return 0
+        return max(self.expire - time.monotonic(), 0)
+
+    def elapsed(self):
+        return time.monotonic() - self.start
+
+    @contextmanager
+    def stage(self, name):
+        """Record elapsed time of the stage (accumulated by name)"""
+        t = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[name] = \
+                self.timings.get(name, 0) + time.monotonic() - t
+
+
 class DescriptorArray(object):
     """ MCS-DR descriptor array
 
@@ -62,21 +145,30 @@ class DescriptorArray(object):
         molecule(chorus.model.graphmol.Compound):  molecule object
         diameter(int): diameter parameter of MCS-DR
         ignore_hydrogen(bool): ignore all hydrogens (implicit and explicit)
-        timeout(float): timeout of maximum clique detection in seconds
+        timeout(float): timeout of the calculation in seconds
+        deadline(Deadline): shared deadline (timeout is ignored if given).
+            Stage times are recorded as preprocess, line_graph and
+            max_fragment.
 
     Returns:
-        dict of the result. array: comparison_array, max_size: max fragment
+        dict of the result. array: comparison_array (list of (u, v, descriptor)
+        or numpy.ndarray of them if restored by loads), max_size: max fragment
         size of Glaph-based local similarity, int_to_node: dict of line graph
         node index to original bond in tuple of the atom indices, elapsed_time:
         elapsed time, timeout: underwent timeout or not
     """
-    def __init__(self, mol, diameter=8, ignore_hydrogen=True, timeout=5):
+    def __init__(self, mol, diameter=8, ignore_hydrogen=True, timeout=5,
+                 deadline=None):
         mol.require("Valence")
+        if deadline is None:
+            deadline = Deadline(timeout)
+        else:
+            timeout = deadline.remaining()
         self.diam = diameter
         self.ignoreh = ignore_hydrogen
         self.timeout = timeout
         # Results
-        self.array = []
+        self.array = np.empty((0, 3), dtype=np.int64)
         self.max_size = 0
         self.int_to_node = {}
         self.elapsed_time = 0
@@ -85,26 +177,101 @@ class DescriptorArray(object):
             return
         start_time = time.perf_counter()
         self.mol = mol
-        self.preprocess()
-        # Generate line graph and reindexing
-        lg = nx.line_graph(self.mol.graph)
-        node_to_int = {}
-        for i, ln in enumerate(lg.nodes()):
-            node_to_int[ln] = i
-            lg.nodes[ln]["type"] = self.node_desc(ln)
-        self.int_to_node = {v: k for k, v in node_to_int.items()}
-        self.graph = nx.relabel_nodes(lg, node_to_int)
-        # Edges
-        edges = []
-        for u, v, attr in self.edge_gen():
-            edges.append((u, v))
-            self.array.append((u, v, self.edge_desc(attr)))
+        with deadline.stage("preprocess"):
+            self.preprocess()
+        # Stages return early with valid=False if the deadline is expired
+        if deadline.expired():
+            self.elapsed_time = round(time.perf_counter() - start_time, 7)
+            return
+        with deadline.stage("line_graph"):
+            # Line graph nodes (bonds) are indexed in order of bonds_iter
+            bonds = np.array([(u, v) for u, v, _ in self.mol.bonds_iter()],
+                             dtype=np.int64).reshape(-1, 2)
+            types = self.node_desc(bonds)
+            res = self.bond_distances(bonds, deadline)
+        if res is None or deadline.expired():
+            self.elapsed_time = round(time.perf_counter() - start_time, 7)
+            return
+        us, vs, dist = res
+        self.int_to_node = dict(enumerate(map(tuple, bonds.tolist())))
+        self.array = np.column_stack((us, vs, self.edge_desc(
+            dist.astype(np.int64), types[us], types[vs])))
         # Max fragment size determination
-        fcres = find_cliques(self.graph.nodes(), edges, timeout=timeout)
+        with deadline.stage("max_fragment"):
+            fcres = find_cliques(range(len(bonds)),
+                                 np.column_stack((us, vs)), timeout=deadline)
         self.max_size = len(fcres["max_clique"])
         self.elapsed_time = round(time.perf_counter() - start_time, 7)
         self.valid = not fcres["timeout"]
 
+    # magic, diameter, ignore_hydrogen, valid, max_size, number of array
+    # rows, number of line graph nodes, timeout, elapsed_time
+    HEADER = struct.Struct("<4sHBBiiidd")
+    MAGIC = b"MCDA"
+
+    def dumps(self):
+        """Serialize the result into a compact binary
+
+        The comparison array is stored as int32 node pairs and int64
+        descriptors, and int_to_node as int32 atom index pairs. They are
+        compressed by zlib (descriptors are highly redundant).
+
+        Returns:
+            bytes
+        """
+        arr = np.asarray(self.array, dtype=np.int64).reshape(-1, 3)
+        nodes = np.array([self.int_to_node[i]
+                          for i in range(len(self.int_to_node))],
+                         dtype=np.int32).reshape(-1, 2)
+        header = self.HEADER.pack(
+            self.MAGIC, self.diam, self.ignoreh, self.valid, self.max_size,
+            len(arr), len(nodes), self.timeout, self.elapsed_time)
+        payload = b"".join((arr[:, :2].astype(np.int32).tobytes(),
+                            arr[:, 2].tobytes(), nodes.tobytes()))
+        return header + zlib.compress(payload, 1)
+
+    @classmethod
+    def loads(cls, data):
+        """Restore DescriptorArray serialized by dumps
+
+        The comparison array is restored as numpy.ndarray of
+        (u, v, descriptor) rows.
+
+        Raises:
+            ValueError: broken or unsupported data
+        """
+        h = cls.HEADER
+        try:
+            magic, diam, ignoreh, valid, max_size, n, k, timeout, elapsed = \
+                h.unpack_from(data)
+            payload = zlib.decompress(data[h.size:])
+        except (struct.error, zlib.error):
+            raise ValueError("Broken DescriptorArray data")
+        if magic != cls.MAGIC or len(payload) != n * 16 + k * 8:
+            raise ValueError("Broken DescriptorArray data")
+        uv = np.frombuffer(payload, np.int32, n * 2).reshape(n, 2)
+        desc = np.frombuffer(payload, np.int64, n, n * 8)
+        nodes = np.frombuffer(payload, np.int32, k * 2, n * 16)
+        arr = cls.__new__(cls)
+        arr.diam = diam
+        arr.ignoreh = bool(ignoreh)
+        arr.timeout = timeout
+        arr.array = np.column_stack((uv, desc))
+        arr.max_size = max_size
+        arr.int_to_node = dict(enumerate(
+            map(tuple, nodes.reshape(k, 2).tolist())))
+        arr.elapsed_time = elapsed
+        arr.valid = bool(valid)
+        return arr
+
+    def __getstate__(self):
+        # The preprocessed molecule is only used while building the array.
+        # Drop it so that arrays can be sent to worker processes cheaply
+        # (see mcsdrbatch).
+        state = self.__dict__.copy()
+        state.pop("mol", None)
+        return state
+
     def preprocess(self):
         if self.ignoreh:
             self.mol = molutil.make_Hs_implicit(self.mol)  # clone
@@ -114,35 +281,125 @@ class DescriptorArray(object):
         # multivalent coordinated metals notably affect the performance
         remover.remove_coordinated_metal(self.mol)
 
-    def node_desc(self, atoms):
+    def node_desc(self, bonds):
         """default 9 bits descriptor
         7 bits of atomic number (0-127) and 2 bits of pi electrons (0-3)
+
+        Args:
+            bonds: numpy.ndarray of atom index pairs
+
+        Returns:
+            numpy.ndarray of descriptors of two atoms (lower one first)
         """
-        a1 = self.mol.atom(atoms[0])
-        a2 = self.mol.atom(atoms[1])
-        a1t = a1.number << 2 | a1.pi
-        a2t = a2.number << 2 | a2.pi
-        pair = sorted((a1t, a2t))
-        return pair[0] << 9 | pair[1]
-
-    def edge_gen(self):
-        for u in self.graph.nodes:
-            r = reachables(self.graph, u, self.diam)
-            del r[u]
-            for v, d in r.items():
-                attr = {
-                    "dist": d,
-                    "umol": self.graph.nodes[u]["type"],
-                    "vmol": self.graph.nodes[v]["type"]
-                }
-                yield (u, v, attr)
-
-    def edge_desc(self, attr):
+        keys, inv = np.unique(bonds, return_inverse=True)
+        codes = np.array([self.mol.atom(k).number << 2 | self.mol.atom(k).pi
+                          for k in keys.tolist()], dtype=np.int64)
+        pair = codes[inv.reshape(bonds.shape)]
+        return pair.min(axis=1) << 9 | pair.max(axis=1)
+
+    def bond_distances(self, bonds, deadline=None):
+        """Distances between bonds (line graph nodes) within the diameter
+
+        Breadth-first search from all bonds at once on the compact
+        adjacency of the line graph. Each step expands the frontier pairs
+        (source, bond) to the neighbors of the bond, so time and memory are
+        proportional to the number of pairs within the diameter.
+
+        Args:
+            bonds: numpy.ndarray of atom index pairs
+            deadline(Deadline): checked at each step
+
+        Returns:
+            tuple: (us, vs, dist) numpy.ndarray of bond pairs within the
+            diameter (u != v) in order of (u, v) and their distances (uint8),
+            or None if the deadline is expired
+        """
+        m = len(bonds)
+        if not m:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0, dtype=np.uint8)
+        _, inv = np.unique(bonds, return_inverse=True)
+        inv = inv.reshape(-1)
+        # atom -> incident bonds
+        order = np.argsort(inv, kind="stable")
+        aptr = np.searchsorted(inv[order], np.arange(inv.max() + 2))
+        abonds = order // 2
+        # bonds sharing an atom are adjacent
+        rep, nbrs = csr_neighbors(aptr, abonds, inv)
+        src = np.arange(m).repeat(2)[rep]
+        keep = src != nbrs
+        src, nbrs = src[keep], nbrs[keep]
+        order = np.argsort(src, kind="stable")
+        lptr = np.searchsorted(src[order], np.arange(m + 1))
+        lnbrs = nbrs[order]
+        reached = np.arange(m, dtype=np.int64) * (m + 1)  # code: u * m + v
+        found = []
+        fsrc = fnode = np.arange(m, dtype=np.int64)
+        for d in range(1, self.diam + 1):
+            if deadline is not None and deadline.expired():
+                return None
+            rep, nbrs = csr_neighbors(lptr, lnbrs, fnode)
+            codes = np.unique(fsrc[rep] * m + nbrs)
+            codes = codes[~np.isin(codes, reached, assume_unique=True)]
+            if not len(codes):
+                break
+            found.append((codes, d))
+            reached = np.union1d(reached, codes)
+            fsrc, fnode = np.divmod(codes, m)
+        if not found:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0, dtype=np.uint8)
+        codes = np.concatenate([c for c, _ in found])
+        dist = np.concatenate(
+            [np.full(len(c), d, dtype=np.uint8) for c, d in found])
+        order = np.argsort(codes)
+        us, vs = np.divmod(codes[order], m)
+        return us, vs, dist[order]
+
+    def edge_desc(self, dist, utype, vtype):
         """default 42 bits descriptor
         6 bits of distance descriptor (0-31)
         18 bits of bond (9 bits of atom x2) x2
         """
-        return (attr["dist"] << 18 | attr["umol"]) << 18 | attr["vmol"]
+        return (dist << 18 | utype) << 18 | vtype
+
+    def descriptor_counts(self):
+        """Multiset of edge descriptors (cached, see Screening)
+
+        Returns:
+            tuple: (sorted distinct descriptors, counts) in numpy.ndarray
+        """
+        counts = getattr(self, "_desc_counts", None)
+        if counts is None:
+            arr = np.asarray(self.array, dtype=np.int64).reshape(-1, 3)
+            counts = np.unique(arr[:, 2], return_counts=True)
+            self._desc_counts = counts
+        return counts
+
+    def bond_type_counts(self):
+        """Histogram of bond (line graph node) types (cached, see Screening)
+
+        Only bonds which have at least one descriptor array edge are
+        counted because others never appear in the modular product.
+
+        Returns:
+            tuple: (sorted distinct types, counts) in numpy.ndarray
+        """
+        counts = getattr(self, "_type_counts", None)
+        if counts is None:
+            arr = np.asarray(self.array, dtype=np.int64).reshape(-1, 3)
+            _, first = np.unique(arr[:, 0], return_index=True)
+            types = arr[first, 2] >> 18 & 0x3FFFF
+            counts = np.unique(types, return_counts=True)
+            self._type_counts = counts
+        return counts
+
+
+def common_count(counts1, counts2):
+    """Size of the intersection of two multisets given as (values, counts)"""
+    _, i1, i2 = np.intersect1d(counts1[0], counts2[0], assume_unique=True,
+                               return_indices=True)
+    return int(np.minimum(counts1[1][i1], counts2[1][i2]).sum())
 
 
 def comparison_graph_py(arr1, arr2):
@@ -183,7 +440,20 @@ if not CYTHON_AVAILABLE:
 
 
 class McsdrGls(object):
-    def __init__(self, arr1, arr2, timeout=10):
+    """ MCS-DR graph-based local similarity (GLS) of two DescriptorArrays
+
+    Args:
+        arr1, arr2(DescriptorArray): descriptor arrays
+        timeout(float): timeout of the calculation in seconds
+        deadline(Deadline): shared deadline (timeout is ignored if given).
+            Stage times are recorded as mod_product and max_clique. The
+            calculation stops immediately only if the deadline is cancelled.
+        product_timeout(float): if given, the modular product stage is
+            stopped in this time and the maximum clique is searched in the
+            partial product (lower bound of the similarity)
+    """
+    def __init__(self, arr1, arr2, timeout=10, deadline=None,
+                 product_timeout=None):
         # DescriptorArray
         self.max1 = arr1.max_size
         self.max2 = arr2.max_size
@@ -191,25 +461,35 @@ class McsdrGls(object):
         self.map2 = arr2.int_to_node
         self.arr1_time = arr1.elapsed_time
         self.arr2_time = arr2.elapsed_time
+        if deadline is None:
+            deadline = Deadline(timeout)
         # Results
         self.max_clique = []
         self.mod_product_time = None
         self.max_clique_time = None
         self.valid = False
         self.elapsed_time = 0
-        if not (arr1.array and arr2.array) or timeout <= 0:
+        self.timings = deadline.timings
+        if not (len(arr1.array) and len(arr2.array)) or deadline.expired():
             return
         start_time = time.perf_counter()
-        cgout = timeout / 2  # TODO: empirical
-        cgres = comparison_graph(arr1.array, arr2.array, timeout=cgout)
+        cgout = deadline
+        if product_timeout is not None:
+            cgout = deadline.child(product_timeout)
+        with deadline.stage("mod_product"):
+            cgres = comparison_graph(arr1.array, arr2.array, timeout=cgout)
         self.mod_product_time = round(cgres["elapsed_time"], 7)
-        rest = timeout - cgres["elapsed_time"]
-        if rest <= 0:
+        # After the deadline, the clique search stops at the first maximal
+        # clique of the (partial) product, which is a lower bound.
+        if deadline.cancelled:
             self.elapsed_time = round(time.perf_counter() - start_time, 7)
             return
-        fcres = find_cliques(
-            cgres["decoder"].keys(), cgres["edges"], timeout=rest)
-        self.max_clique = fcres["max_clique"]
+        with deadline.stage("max_clique"):
+            fcres = find_cliques(
+                cgres["decoder"].keys(), cgres["edges"], timeout=deadline)
+        # pairs of line graph nodes (arr1 node, arr2 node)
+        decoder = cgres["decoder"]
+        self.max_clique = [decoder[n] for n in fcres["max_clique"]]
         self.max_clique_time = round(fcres["elapsed_time"], 7)
         if arr1.valid and arr2.valid \
                 and not cgres["timeout"] and not fcres["timeout"]:
@@ -228,7 +508,21 @@ class McsdrGls(object):
             sim = 0
         return round(sim, digit)
 
+    def mapping(self):
+        """Matched bonds of the common structure
+
+        Returns:
+            list: (bond of mol1, bond of mol2) in tuples of atom indices
+        """
+        return [(self.map1[n1], self.map2[n2]) for n1, n2 in self.max_clique]
+
     def common_struct(self, mol1):
+        """Common substructure as a part of mol1
+
+        Args:
+            mol1(Compound): molecule of arr1 (DescriptorArray.mol, if
+                hydrogens are ignored)
+        """
         new_mol = Compound()
         edges = [self.map1[n1] for n1, _ in self.max_clique]
         atoms = set()
@@ -241,24 +535,102 @@ class McsdrGls(object):
         return new_mol
 
 
-def from_array(arr1, arr2, timeout=10, gls_cutoff=None, edge_cutoff=None):
-    sm, bg = sorted((arr1.max_size, arr2.max_size))
-    if not sm:
-        return McsdrGls(arr1, arr2, timeout=0)
-    if gls_cutoff is not None and gls_cutoff > sm / bg:
-        return McsdrGls(arr1, arr2, timeout=0)
-    if edge_cutoff is not None and edge_cutoff > sm:
+class Screening(object):
+    """ Cascade of upper bounds of the MCS-DR edge count
+
+    The edge count (maximum clique size of the modular product) k of two
+    DescriptorArrays is bounded by the following stages in order of cost.
+    GLS k / (max1 + max2 - k) increases with k, so a pair whose bound can
+    not reach the cutoffs is eliminated without building the product.
+
+    max_size: k <= min(max1, max2)
+    bond_type: matched bonds have the same type, so k is at most the size of
+        the intersection of the bond type histograms
+    descriptor: each ordered pair of matched bonds consumes a distinct
+        descriptor array row of each molecule with the same descriptor,
+        so k(k - 1) is at most the size of the intersection of the
+        descriptor multisets
+
+    Attributes:
+        eliminated (dict): number of pairs eliminated at each stage
+        passed (int): number of pairs which passed all stages
+    """
+    STAGES = ("max_size", "bond_type", "descriptor")
+
+    def __init__(self):
+        self.eliminated = {s: 0 for s in self.STAGES}
+        self.passed = 0
+
+    def update(self, other):
+        """Add counters of another Screening (ex. results of workers)"""
+        for s in self.STAGES:
+            self.eliminated[s] += other.eliminated[s]
+        self.passed += other.passed
+
+    def bounds(self, arr1, arr2):
+        """Yield stage name and upper bound of the edge count of each stage
+        """
+        yield "max_size", min(arr1.max_size, arr2.max_size)
+        yield "bond_type", common_count(
+            arr1.bond_type_counts(), arr2.bond_type_counts())
+        m = common_count(arr1.descriptor_counts(), arr2.descriptor_counts())
+        # maximum k that satisfies k(k - 1) <= m (no product nodes if m = 0)
+        yield "descriptor", (isqrt(4 * m + 1) + 1) // 2 if m else 0
+
+    def upper_bound(self, arr1, arr2):
+        """The tightest upper bound of the edge count"""
+        return min(b for _, b in self.bounds(arr1, arr2))
+
+    def passes(self, arr1, arr2, gls_cutoff=None, edge_cutoff=None):
+        """Whether the pair may pass the cutoffs
+
+        Args:
+            arr1, arr2(DescriptorArray): descriptor arrays
+            gls_cutoff(float): GLS (not rounded) threshold
+            edge_cutoff(int): edge count threshold
+
+        Returns:
+            bool: False if the pair was proved to fall below the cutoffs
+            or to have no common structure
+        """
+        total = arr1.max_size + arr2.max_size
+        k = total
+        for stage, bound in self.bounds(arr1, arr2):
+            k = min(k, bound)
+            if not k or (gls_cutoff is not None
+                         and gls_cutoff > k / (total - k)) \
+                    or (edge_cutoff is not None and edge_cutoff > k):
+                self.eliminated[stage] += 1
+                return False
+        self.passed += 1
+        return True
+
+
+def from_array(arr1, arr2, timeout=10, gls_cutoff=None, edge_cutoff=None,
+               deadline=None, screening=None):
+    """ MCS-DR GLS of DescriptorArrays with cutoffs
+
+    Pairs eliminated by the upper bounds of Screening are not compared
+    (empty result without elapsed times).
+
+    Args:
+        screening(Screening): if given, elimination counters are updated
+    """
+    if screening is None:
+        screening = Screening()
+    if not screening.passes(arr1, arr2, gls_cutoff, edge_cutoff):
         return McsdrGls(arr1, arr2, timeout=0)
-    return McsdrGls(arr1, arr2, timeout)
+    return McsdrGls(arr1, arr2, timeout, deadline)
 
 
 def from_mol(mol1, mol2, diameter=8, ignore_hydrogen=True,
-             timeout=10, arr_timeout=2):
+             timeout=10, arr_timeout=2, deadline=None):
+    if deadline is None:
+        deadline = Deadline(timeout)
     arr1 = DescriptorArray(mol1, diameter=diameter,
                            ignore_hydrogen=ignore_hydrogen,
-                           timeout=arr_timeout)
+                           deadline=deadline.child(arr_timeout))
     arr2 = DescriptorArray(mol2, diameter=diameter,
                            ignore_hydrogen=ignore_hydrogen,
-                           timeout=arr_timeout)
-    rest = timeout - (arr1.elapsed_time + arr2.elapsed_time)
-    return McsdrGls(arr1, arr2, rest)
+                           deadline=deadline.child(arr_timeout))
+    return McsdrGls(arr1, arr2, deadline=deadline)
@@ -0,0 +1,486 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+""" Batch MCS-DR similarity (mcsdrbatch.py)
+
+All-pairs and nearest neighbor search of MCS-DR graph-based local
+similarity (GLS) over a molecule library.
+
+DescriptorArrays are calculated once per molecule. Pairs which can not
+pass the gls_cutoff/edge_cutoff prefilters of mcsdr.from_array are dropped
+in bulk by using max_size of the arrays, and the rest are screened by the
+upper bounds of mcsdr.Screening and compared in a process pool (or a thread
+pool sharing the arrays, since the Cython kernels of mcsdr release the GIL).
+Results of the all-pairs calculation are streamed to a sparse matrix file
+in Matrix Market coordinate format, which can be read by read_matrix (or
+scipy.io.mmread). The nearest neighbor search uses the k-th best similarity
+found so far as a dynamic gls_cutoff.
+
+DescriptorArrays of a library can be stored in DescriptorArrayStore (SQLite
+file) so that they are calculated only once and reused across runs.
+"""
+
+from contextlib import contextmanager
+import functools
+import heapq
+import multiprocessing
+import multiprocessing.pool
+import sqlite3
+import time
+
+import numpy as np
+
+from chorus import mcsdr
+
+
+MM_HEADER = "%%MatrixMarket matrix coordinate real symmetric"
+SIZE_LINE_WIDTH = 48  # reserved for the size line rewritten at the end
+
+# DescriptorArrays shared with pool workers (see init_worker)
+_ARRAYS = None
+
+
+def mol_to_array(args):
+    """Worker of descriptor_arrays"""
+    mol, diameter, ignore_hydrogen, timeout = args
+    return mcsdr.DescriptorArray(mol, diameter, ignore_hydrogen, timeout)
+
+
+def descriptor_arrays(mols, diameter=8, ignore_hydrogen=True, timeout=5,
+                      processes=None, chunk_size=100):
+    """Calculate DescriptorArrays of molecules in a process pool
+
+    Args:
+        mols (iterable): Compound objects
+        diameter, ignore_hydrogen, timeout: see mcsdr.DescriptorArray
+        processes (int): number of worker processes (default: cpu count,
+            1: calculate in the current process)
+        chunk_size (int): number of molecules sent to a worker at once
+
+    Returns:
+        list: DescriptorArrays in the same order as mols
+    """
+    args = ((m, diameter, ignore_hydrogen, timeout) for m in mols)
+    if processes == 1:
+        return list(map(mol_to_array, args))
+    with multiprocessing.Pool(processes) as pool:
+        return list(pool.imap(mol_to_array, args, chunk_size))
+
+
+def candidates(sizes, i, js, gls_cutoff=None, edge_cutoff=None):
+    """Bulk version of the max_size stage of mcsdr.Screening
+
+    Args:
+        sizes (numpy.ndarray): max_size of DescriptorArrays
+        i (int): index of the array to be compared
+        js (array-like): indices of the arrays to be compared with i
+        gls_cutoff, edge_cutoff: see mcsdr.from_array
+
+    Returns:
+        numpy.ndarray: indices in js which may pass the cutoffs
+    """
+    js = np.asarray(js, dtype=np.intp)
+    sm = np.minimum(sizes[i], sizes[js])
+    bg = np.maximum(sizes[i], sizes[js])
+    keep = sm > 0
+    if gls_cutoff is not None:
+        keep &= sm / np.maximum(bg, 1) >= gls_cutoff
+    if edge_cutoff is not None:
+        keep &= sm >= edge_cutoff
+    return js[keep]
+
+
+class DescriptorArrayStore(object):
+    """Disk-backed store of serialized DescriptorArrays
+
+    Arrays are keyed by compound ID and the DescriptorArray parameters
+    (diameter, ignore_hydrogen).
+
+    Args:
+        path (str): SQLite database file path
+    """
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS arrays ("
+        "id TEXT NOT NULL, diameter INTEGER NOT NULL, "
+        "ignore_hydrogen INTEGER NOT NULL, data BLOB NOT NULL, "
+        "PRIMARY KEY (id, diameter, ignore_hydrogen))"
+    )
+    QUERY_SIZE = 500  # max number of IDs in a query
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(self.SCHEMA)
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM arrays").fetchone()[0]
+
+    def __contains__(self, key):
+        """key: (compound ID, diameter, ignore_hydrogen)"""
+        cid, diameter, ignore_hydrogen = key
+        return self.conn.execute(
+            "SELECT 1 FROM arrays WHERE id=? AND diameter=? "
+            "AND ignore_hydrogen=?",
+            (cid, diameter, ignore_hydrogen)).fetchone() is not None
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, cid, diameter=8, ignore_hydrogen=True):
+        """Get a stored array
+
+        Returns:
+            mcsdr.DescriptorArray, or None if not stored
+        """
+        row = self.conn.execute(
+            "SELECT data FROM arrays WHERE id=? AND diameter=? "
+            "AND ignore_hydrogen=?",
+            (cid, diameter, ignore_hydrogen)).fetchone()
+        if row is None:
+            return None
+        return mcsdr.DescriptorArray.loads(row[0])
+
+    def get_many(self, cids, diameter=8, ignore_hydrogen=True):
+        """Get stored arrays
+
+        Returns:
+            dict: compound ID -> mcsdr.DescriptorArray of stored ones
+        """
+        res = {}
+        cids = list(set(cids))
+        for i in range(0, len(cids), self.QUERY_SIZE):
+            chunk = cids[i:i + self.QUERY_SIZE]
+            cur = self.conn.execute(
+                "SELECT id, data FROM arrays WHERE diameter=? "
+                "AND ignore_hydrogen=? AND id IN ({})".format(
+                    ",".join("?" * len(chunk))),
+                [diameter, ignore_hydrogen] + chunk)
+            for cid, data in cur:
+                res[cid] = mcsdr.DescriptorArray.loads(data)
+        return res
+
+    def put_many(self, items):
+        """Store arrays. Existing arrays with the same key are replaced.
+
+        Args:
+            items (iterable): (compound ID, mcsdr.DescriptorArray)
+        """
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO arrays VALUES (?, ?, ?, ?)",
+            ((cid, arr.diam, arr.ignoreh, arr.dumps()) for cid, arr in items))
+        self.conn.commit()
+
+    def put(self, cid, arr):
+        """Store an array. Existing array with the same key is replaced."""
+        self.put_many([(cid, arr)])
+
+
+def library_arrays(store, items, diameter=8, ignore_hydrogen=True,
+                   timeout=5, processes=None, chunk_size=100):
+    """DescriptorArrays of a library using the store as a cache
+
+    Arrays not found in the store are calculated by descriptor_arrays
+    and stored. Stored arrays which are not valid (ex. timed out) are
+    calculated again if a larger timeout is given.
+
+    Args:
+        store (DescriptorArrayStore): array store
+        items (iterable): (compound ID, Compound)
+        diameter, ignore_hydrogen, timeout: see mcsdr.DescriptorArray
+        processes, chunk_size: see descriptor_arrays
+
+    Returns:
+        list: DescriptorArrays in the same order as items
+    """
+    items = list(items)
+    found = store.get_many([cid for cid, _ in items], diameter,
+                           ignore_hydrogen)
+    for cid, arr in list(found.items()):
+        if not arr.valid and arr.timeout < timeout:
+            del found[cid]
+    missing = [(cid, mol) for cid, mol in items if cid not in found]
+    if missing:
+        arrs = descriptor_arrays(
+            [mol for _, mol in missing], diameter, ignore_hydrogen, timeout,
+            processes, chunk_size)
+        new = list(zip([cid for cid, _ in missing], arrs))
+        store.put_many(new)
+        found.update(new)
+    return [found[cid] for cid, _ in items]
+
+
+def init_worker(arrays):
+    global _ARRAYS
+    _ARRAYS = arrays
+
+
+def compare_arrays(arrays, args):
+    """Compare an array with others
+
+    Args:
+        arrays (list): DescriptorArrays
+        args (tuple): (i, js, timeout, gls_cutoff, edge_cutoff, mapping)
+            indices of the arrays, timeout of each pair, cutoffs of
+            mcsdr.Screening and whether mappings are returned
+
+    Returns:
+        tuple: (results, screening). results: list of (i, j, local_sim,
+        edge_count, valid[, mapping]) of compared pairs (mapping: see
+        mcsdr.McsdrGls.mapping), screening: mcsdr.Screening counters of
+        the pairs
+    """
+    i, js, timeout, gls_cutoff, edge_cutoff, mapping = args
+    screening = mcsdr.Screening()
+    results = []
+    for j in js:
+        if not screening.passes(arrays[i], arrays[j], gls_cutoff,
+                                edge_cutoff):
+            continue
+        res = mcsdr.McsdrGls(arrays[i], arrays[j], timeout)
+        item = (i, int(j), res.local_sim(), res.edge_count(), res.valid)
+        if mapping:
+            item += (res.mapping(),)
+        results.append(item)
+    return results, screening
+
+
+def compare_pairs(args):
+    """Worker of pair comparison in a process pool (see init_worker)"""
+    return compare_arrays(_ARRAYS, args)
+
+
+@contextmanager
+def comparison_pool(arrays, processes=None, threads=False):
+    """Workers of pair comparison tasks
+
+    Args:
+        arrays (list): DescriptorArrays
+        processes (int): number of workers (default: cpu count, 1: run in
+            the current thread)
+        threads (bool): if True, workers are threads which share arrays
+            without pickling. Pairs are compared concurrently because
+            the Cython kernels release the GIL.
+
+    Yields:
+        function: run(tasks, ordered=False) which returns an iterator of
+        results of compare_arrays (in order of tasks if ordered). It can
+        be called repeatedly while the workers are alive.
+    """
+    if processes == 1:
+        def run(tasks, ordered=False):
+            return (compare_arrays(arrays, task) for task in tasks)
+        yield run
+        return
+    if threads:
+        pool = multiprocessing.pool.ThreadPool(processes)
+        func = functools.partial(compare_arrays, arrays)
+    else:
+        pool = multiprocessing.Pool(processes, init_worker, (arrays,))
+        func = compare_pairs
+    with pool:
+        def run(tasks, ordered=False):
+            if ordered:
+                return pool.imap(func, tasks)
+            return pool.imap_unordered(func, tasks)
+        yield run
+
+
+def pair_tasks(tasks, arrays, processes, threads=False, ordered=False):
+    """Run pair comparison tasks and yield results of each task
+
+    Args:
+        tasks (iterable): arguments of compare_arrays
+        arrays, processes, threads: see comparison_pool
+        ordered (bool): yield results in order of tasks
+    """
+    with comparison_pool(arrays, processes, threads) as run:
+        for r in run(tasks, ordered):
+            yield r
+
+
+def split_tasks(i, js, timeout, gls_cutoff, edge_cutoff, chunk_size,
+                mapping=False):
+    for k in range(0, len(js), chunk_size):
+        yield (i, js[k:k + chunk_size], timeout, gls_cutoff, edge_cutoff,
+               mapping)
+
+
+def similarity_matrix(arrays, path, timeout=10, gls_cutoff=None,
+                      edge_cutoff=None, sim_cutoff=None, processes=None,
+                      chunk_size=100, threads=False):
+    """Calculate all-pairs GLS and write it to a sparse matrix file
+
+    The matrix is written in Matrix Market coordinate format (symmetric,
+    1-based lower triangle). Pairs eliminated by the upper bounds and pairs
+    without common structure are not written. Diagonal elements are
+    written as 1 if the molecule has descriptor array edges.
+
+    Args:
+        arrays (list): DescriptorArrays (see descriptor_arrays)
+        path (str): output file path
+        timeout (float): timeout of each pair comparison in seconds
+        gls_cutoff, edge_cutoff: see mcsdr.from_array
+        sim_cutoff (float): if given, similarity values less than this
+            are not written
+        processes (int): number of worker processes (default: cpu count,
+            1: calculate in the current process)
+        chunk_size (int): number of pairs sent to a worker at once
+        threads (bool): use threads instead of processes (see pair_tasks)
+
+    Returns:
+        dict: compared: number of compared pairs, filtered: number of pairs
+        eliminated by the upper bounds, eliminated: dict of the number of
+        pairs eliminated at each stage of mcsdr.Screening, invalid: number
+        of compared pairs which were not valid (timeout), entries: number
+        of written entries, elapsed_time: elapsed time
+    """
+    start_time = time.perf_counter()
+    n = len(arrays)
+    sizes = np.array([a.max_size for a in arrays], dtype=np.int64)
+    stats = {"invalid": 0, "entries": 0}
+    screening = mcsdr.Screening()
+    screened = 0  # pairs sent to workers (counted in the main thread)
+
+    # Tasks are generated by the task feeder thread of the pool, so they
+    # must not update the counters. Pairs which are not sent to workers are
+    # eliminated by the max_size bound (see candidates).
+    def tasks():
+        for i in range(n - 1):
+            js = candidates(sizes, i, np.arange(i + 1, n),
+                            gls_cutoff, edge_cutoff)
+            for t in split_tasks(i, js, timeout, gls_cutoff, edge_cutoff,
+                                 chunk_size):
+                yield t
+
+    with open(path, "w") as f:
+        f.write(MM_HEADER + "\n")
+        size_pos = f.tell()
+        f.write(" " * SIZE_LINE_WIDTH + "\n")
+        for i in np.nonzero(sizes)[0]:
+            f.write("{0} {0} 1\n".format(i + 1))
+            stats["entries"] += 1
+        for results, scr in pair_tasks(tasks(), arrays, processes, threads):
+            screening.update(scr)
+            screened += scr.passed + sum(scr.eliminated.values())
+            for i, j, sim, _, valid in results:
+                if not valid:
+                    stats["invalid"] += 1
+                if not sim or (sim_cutoff is not None and sim < sim_cutoff):
+                    continue
+                f.write("{} {} {}\n".format(j + 1, i + 1, sim))
+                stats["entries"] += 1
+        f.seek(size_pos)
+        f.write("{0} {0} {1}".format(n, stats["entries"])
+                .ljust(SIZE_LINE_WIDTH))
+    screening.eliminated["max_size"] += n * (n - 1) // 2 - screened
+    stats["compared"] = screening.passed
+    stats["filtered"] = sum(screening.eliminated.values())
+    stats["eliminated"] = screening.eliminated
+    stats["elapsed_time"] = round(time.perf_counter() - start_time, 7)
+    return stats
+
+
+def read_matrix(path):
+    """Read a sparse matrix file written by similarity_matrix
+
+    Returns:
+        tuple: (size, rows, cols, values). rows and cols are 0-based
+        indices of the lower triangle (rows >= cols).
+    """
+    with open(path) as f:
+        for line in f:
+            if not line.startswith("%"):
+                break
+        size, _, count = (int(v) for v in line.split())
+        if count:
+            data = np.loadtxt(f, ndmin=2)
+        else:
+            data = np.empty((0, 3))
+    if len(data) != count:
+        raise ValueError("Broken matrix file: {}".format(path))
+    rows = data[:, 0].astype(np.intp) - 1
+    cols = data[:, 1].astype(np.intp) - 1
+    return size, rows, cols, data[:, 2]
+
+
+def nearest(query, arrays, k=10, timeout=10, gls_cutoff=None,
+            edge_cutoff=None, processes=None, chunk_size=100, threads=False,
+            mapping=False):
+    """Find k most similar molecules to the query
+
+    Candidates are compared in descending order of the max_size upper
+    bound of the similarity, in rounds of chunk_size pairs per worker.
+    Once k results are found, the k-th best similarity is used as the
+    gls_cutoff of mcsdr.Screening in the following rounds, and the search
+    stops when no remaining candidate can reach it.
+
+    Args:
+        query (mcsdr.DescriptorArray): query array
+        arrays (list): DescriptorArrays of the library
+        k (int): number of results
+        timeout, gls_cutoff, edge_cutoff, processes, chunk_size, threads:
+            see similarity_matrix
+        mapping (bool): if True, matched bonds of the common structure
+            (see mcsdr.McsdrGls.mapping) are appended to each result. They
+            are taken from the same comparison as the similarity.
+
+    Returns:
+        list: (index, local_sim, edge_count, valid[, mapping]) in
+        descending order of the similarity (ties are broken by the index)
+    """
+    if k < 1:
+        return []
+    q = len(arrays)
+    shared = list(arrays) + [query]
+    sizes = np.array([a.max_size for a in shared], dtype=np.int64)
+    js = candidates(sizes, q, np.arange(q), gls_cutoff, edge_cutoff)
+    sm = np.minimum(sizes[q], sizes[js])
+    bg = np.maximum(sizes[q], sizes[js])
+    bound = sm / np.maximum(bg, 1)
+    order = np.lexsort((js, -bound))
+    js = js[order]
+    neg_bound = -bound[order]  # ascending
+    round_size = chunk_size * (processes or multiprocessing.cpu_count())
+    cutoff = gls_cutoff
+    heap = []
+    with comparison_pool(shared, processes, threads) as run:
+        pos = 0
+        while pos < len(js):
+            end = min(pos + round_size, len(js))
+            if cutoff is not None:
+                # candidates whose bound can reach the cutoff
+                end = min(end, np.searchsorted(neg_bound, -cutoff, "right"))
+            if end <= pos:
+                break
+            tasks = split_tasks(q, js[pos:end], timeout, cutoff, edge_cutoff,
+                                chunk_size, mapping)
+            for results, _ in run(tasks):
+                for _, j, sim, ecnt, valid, *mp in results:
+                    if not sim:
+                        continue
+                    # Indices are unique, so mappings are not compared
+                    item = (sim, -j, ecnt, valid, *mp)
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    elif item > heap[0]:
+                        heapq.heapreplace(heap, item)
+            pos = end
+            if len(heap) == k:
+                # local_sim is rounded to 3 digits. Pairs that may round up
+                # to the k-th similarity are kept for the tie-break.
+                kth = heap[0][0] - 0.001
+                cutoff = kth if gls_cutoff is None else max(gls_cutoff, kth)
+    results = []
+    for sim, j, ecnt, valid, *mp in sorted(heap, reverse=True):
+        results.append((-j, sim, ecnt, valid, *mp))
+    return results
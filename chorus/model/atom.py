@@ -6,7 +6,8 @@
 
 import os
 import yaml
-from collections import Counter
+from collections import Counter, namedtuple
+from operator import attrgetter
 
 """ Import periodic table """
 with open(os.path.join(
@@ -14,8 +15,38 @@ with open(os.path.join(
     P_TAB = yaml.load(file.read())
 
 
+class Element(namedtuple("Element", "symbol name number color weight")):
+    """Periodic table record shared by atoms of the same element"""
+    __slots__ = ()
+
+    def __reduce__(self):
+        # Unpickle into the shared record if possible
+        if ELEMENTS.get(self.symbol) == self:
+            return element, (self.symbol,)
+        return Element, tuple(self)
+
+
+ELEMENTS = {}
+
+
+def element(symbol):
+    """Return the shared Element record of the symbol
+
+    Raises:
+        KeyError: Symbol not defined in periodictable.yaml
+    """
+    try:
+        return ELEMENTS[symbol]
+    except KeyError:
+        rcd = P_TAB[symbol]
+        ELEMENTS[symbol] = Element(
+            symbol, rcd['name'], rcd['number'],
+            tuple(rcd.get('color', [0, 192, 192])), rcd.get('std_weight'))
+        return ELEMENTS[symbol]
+
+
 def atom_number(symbol):
-    return P_TAB[symbol]['number']
+    return element(symbol).number
 
 
 ALIASES = {
@@ -39,6 +70,25 @@ ALIASES = {
 }
 
 
+def element_property(field):
+    """Attribute stored in the Element record. Setting a different symbol
+    replaces the record by the one of the element, and setting other fields
+    replaces the record of the atom by a modified copy."""
+    def fget(self):
+        return getattr(self.element, field)
+
+    def fset(self, value):
+        if field == "symbol":
+            if value != self.element.symbol:
+                self.element = element(value)
+            return
+        if field == "color":
+            value = tuple(value)
+        if getattr(self.element, field) != value:
+            self.element = self.element._replace(**{field: value})
+    return property(fget, fset)
+
+
 class Atom(object):
     """Atom object
 
@@ -47,6 +97,7 @@ class Atom(object):
         attr_dict (dict): load ``Atom`` object from dict notation.
 
     Attributes:
+        element: shared periodic table record (see Element)
         name: general name of the atom
         number: atomic number
         symbol: atom symbol
@@ -65,31 +116,37 @@ class Atom(object):
         patty: ``patty``` descriptor
 
     """
+    __slots__ = (
+        "element", "charge", "H_count", "multi", "mass", "visible", "coords",
+        "pi", "aromatic", "H_donor", "H_acceptor", "carbonyl_C", "lone_pair",
+        "wctype", "patty", "stereo",
+        # v2000reader
+        "mass_diff", "radical",
+        # descriptor.assign_charge
+        "charge_phys", "charge_conj", "n_oxide"
+    )
+
+    symbol = element_property("symbol")
+    name = element_property("name")
+    number = element_property("number")
+    color = element_property("color")
+
     def __init__(self, symbol, attr_dict=None):
-        self.name = P_TAB[symbol]['name']
-        self.number = P_TAB[symbol]['number']
-        self.symbol = symbol
+        self.element = element(symbol)
         self.charge = 0
         self.H_count = 0
         self.multi = 1
         self.mass = None
-        self.visible = 1
-        if symbol == 'C':
-            self.visible = 0
+        self.visible = 0 if symbol == 'C' else 1
         self.coords = None
-        self.color = tuple(P_TAB[symbol].get('color', [0, 192, 192]))
 
         # chem.descriptor
         self.pi = 0
         self.aromatic = 0
         self.H_donor = 0
-        self.H_acceptor = 0
+        self.H_acceptor = 1 if symbol in ('N', 'O', 'F') else 0
         self.carbonyl_C = 0
-        self.lone_pair = 0  # not used?
-        if self.symbol in ('N', 'O'):
-            self.lone_pair = 1
-        if self.symbol in ('N', 'O', 'F'):
-            self.H_acceptor = 1
+        self.lone_pair = 1 if symbol in ('N', 'O') else 0  # not used?
         self.wctype = None
         self.patty = 7
 
@@ -98,15 +155,42 @@ class Atom(object):
         # self.excited = False
         # self.stereo_flag = None
 
+        self.mass_diff = 0
+        self.radical = 0
+        self.charge_phys = 0
+        self.charge_conj = 0
+        self.n_oxide = 0
+
         # loads attribute dict
         if attr_dict is not None:
             for k, v in attr_dict.items():
                 setattr(self, ALIASES[k], v)
 
-    def __getattr__(self, name):
-        if name not in ALIASES:
-            raise AttributeError()
-        return object.__getattribute__(self, ALIASES[name])
+    def copy(self):
+        """Return a copy of the atom (the Element record is shared)"""
+        new = object.__new__(self.__class__)
+        new.element = self.element
+        new.charge = self.charge
+        new.H_count = self.H_count
+        new.multi = self.multi
+        new.mass = self.mass
+        new.visible = self.visible
+        new.coords = self.coords
+        new.pi = self.pi
+        new.aromatic = self.aromatic
+        new.H_donor = self.H_donor
+        new.H_acceptor = self.H_acceptor
+        new.carbonyl_C = self.carbonyl_C
+        new.lone_pair = self.lone_pair
+        new.wctype = self.wctype
+        new.patty = self.patty
+        new.stereo = self.stereo
+        new.mass_diff = self.mass_diff
+        new.radical = self.radical
+        new.charge_phys = self.charge_phys
+        new.charge_conj = self.charge_conj
+        new.n_oxide = self.n_oxide
+        return new
 
     def add_hydrogen(self, num):
         """Adds hydrogens
@@ -147,9 +231,7 @@ class Atom(object):
 
     def mw(self):
         """Molecular weight"""
-        m = P_TAB[self.symbol].get('std_weight')
-        mh = P_TAB['H'].get('std_weight')
-        return m + mh * self.H_count
+        return self.element.weight + element('H').weight * self.H_count
 
     def charge_sign(self):
         """Charge sign text"""
@@ -176,3 +258,9 @@ class Atom(object):
         for k, v in ALIASES.items():
             res[k] = getattr(self, v)
         return res
+
+
+# Short names of attributes (for JSON notation)
+for _k, _v in ALIASES.items():
+    if _k != _v:
+        setattr(Atom, _k, property(attrgetter(_v)))
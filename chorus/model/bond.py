@@ -4,6 +4,8 @@
 # http://opensource.org/licenses/MIT
 #
 
+from operator import attrgetter
+
 ALIASES = {
     "o": "order",
     "vis": "visible",
@@ -48,6 +50,9 @@ class Bond(object):
 
 
     """
+    __slots__ = ("order", "is_lower_first", "type", "rotatable", "aromatic",
+                 "smiles_cis_trans", "visible")
+
     def __init__(self, attr_dict=None):
         self.order = 1
         self.is_lower_first = 1
@@ -62,13 +67,26 @@ class Bond(object):
             for k, v in attr_dict.items():
                 setattr(self, ALIASES[k], v)
 
-    def __getattr__(self, name):
-        if name not in ALIASES:
-            raise AttributeError()
-        return object.__getattribute__(self, ALIASES[name])
+    def copy(self):
+        """Return a copy of the bond"""
+        new = object.__new__(self.__class__)
+        new.order = self.order
+        new.is_lower_first = self.is_lower_first
+        new.type = self.type
+        new.rotatable = self.rotatable
+        new.aromatic = self.aromatic
+        new.smiles_cis_trans = self.smiles_cis_trans
+        new.visible = self.visible
+        return new
 
     def dumps(self):
         res = {}
         for k, v in ALIASES.items():
             res[k] = getattr(self, v)
         return res
+
+
+# Short names of attributes (for JSON notation)
+for _k, _v in ALIASES.items():
+    if _k != _v:
+        setattr(Bond, _k, property(attrgetter(_v)))
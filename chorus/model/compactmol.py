@@ -0,0 +1,530 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+""" Compact molecule (compactmol.py)
+
+Array-backed molecule model. Atom and bond attributes are stored in typed
+NumPy arrays and the connection table in CSR (compressed sparse row) form
+instead of a networkx graph of Atom and Bond objects.
+
+CompactMol provides the same interface as graphmol.Compound (atom, bond,
+atoms_iter, bonds_iter, neighbors ...), so descriptors, writers and drawers
+work on it. Atom and bond objects returned by the interface are lightweight
+views that read and write the arrays.
+"""
+
+import networkx as nx
+import numpy as np
+
+from chorus.model.atom import Atom, ALIASES as ATOM_ALIASES, element
+from chorus.model.bond import Bond, ALIASES as BOND_ALIASES
+from chorus.model.graphmol import Compound
+
+
+# Integer atom attributes and their types
+ATOM_FIELDS = {
+    "number": np.uint16,
+    "charge": np.int8,
+    "H_count": np.uint8,
+    "multi": np.uint8,
+    "visible": np.int8,
+    "pi": np.int8,
+    "aromatic": np.int8,
+    "H_donor": np.int8,
+    "H_acceptor": np.int8,
+    "carbonyl_C": np.int8,
+    "lone_pair": np.int8,
+    "patty": np.int8,
+    "stereo": np.int8
+}
+# Optional integer atom attributes (None is stored as -1)
+ATOM_OPTIONALS = {
+    "mass": np.int16
+}
+# Atom attributes stored as indices of the per-molecule value table
+ATOM_TABLES = ("symbol", "name", "wctype")
+# Integer bond attributes and their types
+BOND_FIELDS = {
+    "order": np.int8,
+    "is_lower_first": np.int8,
+    "type": np.int8,
+    "rotatable": np.int8,
+    "aromatic": np.int8,
+    "smiles_cis_trans": np.int8,
+    "visible": np.int8
+}
+ATOM_ATTRS = set(ATOM_FIELDS) | set(ATOM_OPTIONALS) | set(ATOM_TABLES) | {
+    "coords", "color"}
+
+# Record types of atom and bond tables. coords_dim 0 means coords is None.
+ATOM_DTYPE = np.dtype(
+    [("key", np.int64)] +
+    [(f, np.int16) for f in ATOM_TABLES] +
+    list(ATOM_FIELDS.items()) + list(ATOM_OPTIONALS.items()) +
+    [("coords", np.float64, (3,)), ("coords_dim", np.uint8),
+     ("color", np.uint8, (3,))]
+)
+BOND_DTYPE = np.dtype(
+    [("atoms", np.int32, (2,))] + list(BOND_FIELDS.items()))
+
+
+class AtomView(object):
+    """Atom of CompactMol
+
+    Attributes are read from and written to the arrays of the molecule.
+    Methods are the same as model.atom.Atom.
+    """
+    __slots__ = ("_mol", "_key", "_idx", "_version")
+
+    def __init__(self, mol, key, idx):
+        object.__setattr__(self, "_mol", mol)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_idx", idx)
+        object.__setattr__(self, "_version", mol._version)
+
+    def _index(self):
+        if self._version != self._mol._version:
+            object.__setattr__(self, "_idx", self._mol.atom_index(self._key))
+            object.__setattr__(self, "_version", self._mol._version)
+        return self._idx
+
+    def __getattr__(self, name):
+        name = ATOM_ALIASES.get(name, name)
+        if name not in ATOM_ATTRS:
+            raise AttributeError(name)
+        return self._mol._get_atom_attr(self._index(), name)
+
+    def __setattr__(self, name, value):
+        if name not in ATOM_ATTRS:
+            raise AttributeError(name)
+        self._mol._set_atom_attr(self._index(), name, value)
+
+    @property
+    def element(self):
+        return element(self.symbol)
+
+    add_hydrogen = Atom.add_hydrogen
+    formula_html = Atom.formula_html
+    composition = Atom.composition
+    mw = Atom.mw
+    charge_sign = Atom.charge_sign
+    charge_sign_html = Atom.charge_sign_html
+    dumps = Atom.dumps
+
+
+class BondView(object):
+    """Bond of CompactMol
+
+    Attributes are read from and written to the arrays of the molecule.
+    """
+    __slots__ = ("_mol", "_keys", "_idx", "_version")
+
+    def __init__(self, mol, keys, idx):
+        object.__setattr__(self, "_mol", mol)
+        object.__setattr__(self, "_keys", keys)
+        object.__setattr__(self, "_idx", idx)
+        object.__setattr__(self, "_version", mol._version)
+
+    def _index(self):
+        if self._version != self._mol._version:
+            object.__setattr__(self, "_idx", self._mol.bond_index(*self._keys))
+            object.__setattr__(self, "_version", self._mol._version)
+        return self._idx
+
+    def __getattr__(self, name):
+        name = BOND_ALIASES.get(name, name)
+        if name not in BOND_FIELDS:
+            raise AttributeError(name)
+        return self._mol.bond_table[name][self._index()].item()
+
+    def __setattr__(self, name, value):
+        if name not in BOND_FIELDS:
+            raise AttributeError(name)
+        self._mol.bond_table[name][self._index()] = value
+
+    dumps = Bond.dumps
+
+
+class CompactMol(object):
+    """Array-backed molecule.
+
+    Atom keys are kept in ascending order, so atoms_iter yields atoms in
+    order of the key. Atom and bond views are bound to the keys and remain
+    valid after adding or removing other atoms and bonds.
+
+    Attributes:
+        atom_table (numpy.ndarray): atom records (n, see ATOM_DTYPE)
+        bond_table (numpy.ndarray): bond records (m, see BOND_DTYPE).
+            "atoms" field is the positions of the atoms in atom_table
+        indptr (numpy.ndarray): CSR row pointer (n + 1)
+        indices (numpy.ndarray): CSR neighbor atom positions (2m)
+        edges (numpy.ndarray): CSR bond positions (2m)
+        data (dict): optional attributes(ex. general name, safety info)
+        descriptors (set): Available descriptors
+    """
+    def __init__(self):
+        self.atom_table = np.zeros(0, dtype=ATOM_DTYPE)
+        self.bond_table = np.zeros(0, dtype=BOND_DTYPE)
+        self._tables = {f: [] for f in ATOM_TABLES}
+        self._version = 0
+        self._build_csr()
+        self.data = {}
+        self.descriptors = set()
+        self.rings = None
+        self.scaffolds = None
+        self.isolated = None
+        self.size2d = None
+
+    @property
+    def keys(self):
+        """Atom keys (ascending order)"""
+        return self.atom_table["key"]
+
+    def _build_csr(self):
+        n = len(self.atom_table)
+        m = len(self.bond_table)
+        pairs = self.bond_table["atoms"]
+        src = np.concatenate((pairs[:, 0], pairs[:, 1]))
+        dst = np.concatenate((pairs[:, 1], pairs[:, 0]))
+        eid = np.tile(np.arange(m, dtype=np.int32), 2)
+        # neighbors in order of bonds
+        order = np.lexsort((eid, src))
+        self.indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+        self.indices = dst[order]
+        self.edges = eid[order]
+        self._version += 1
+
+    def _get_atom_attr(self, i, name):
+        rec = self.atom_table[i]
+        if name in ATOM_TABLES:
+            return self._tables[name][rec[name]]
+        if name == "coords":
+            dim = rec["coords_dim"]
+            if not dim:
+                return None
+            return tuple(rec["coords"][:dim].tolist())
+        if name == "color":
+            return tuple(rec["color"].tolist())
+        value = rec[name].item()
+        if name in ATOM_OPTIONALS and value < 0:
+            return None
+        return value
+
+    def _set_atom_attr(self, i, name, value):
+        if name in ATOM_TABLES:
+            self.atom_table[name][i] = self._table_code(name, value)
+        elif name == "coords":
+            if value is None:
+                self.atom_table["coords_dim"][i] = 0
+            else:
+                self.atom_table["coords"][i, :len(value)] = value
+                self.atom_table["coords_dim"][i] = len(value)
+        elif name in ATOM_OPTIONALS:
+            self.atom_table[name][i] = -1 if value is None else value
+        else:
+            self.atom_table[name][i] = value
+
+    def _table_code(self, name, value):
+        table = self._tables[name]
+        try:
+            return table.index(value)
+        except ValueError:
+            table.append(value)
+            return len(table) - 1
+
+    def __str__(self):
+        return Compound.__str__(self).replace("Compound:", "CompactMol:", 1)
+
+    def __len__(self):
+        """Alias of atom_count"""
+        return self.atom_count()
+
+    def require(self, desc):
+        if desc not in self.descriptors:
+            raise TypeError("Descriptor '{}' is required.".format(desc))
+
+    def atom_index(self, key):
+        """Position of the atom in atom_table
+
+        Raises:
+            KeyError: if the atom does not exist
+        """
+        keys = self.keys
+        i = int(np.searchsorted(keys, key))
+        if i == len(keys) or keys[i] != key:
+            raise KeyError(key)
+        return i
+
+    def bond_index(self, key1, key2):
+        """Position of the bond in bond_table
+
+        Raises:
+            KeyError: if the bond does not exist
+        """
+        u = self.atom_index(key1)
+        v = self.atom_index(key2)
+        s, e = self.indptr[u], self.indptr[u + 1]
+        found = np.flatnonzero(self.indices[s:e] == v)
+        if not len(found):
+            raise KeyError((key1, key2))
+        return int(self.edges[s + found[0]])
+
+    def atom(self, key):
+        """Get an atom."""
+        return AtomView(self, key, self.atom_index(key))
+
+    def add_atom(self, key, atom):
+        """Set an atom. Existing atom will be overwritten."""
+        try:
+            i = self.atom_index(key)
+        except KeyError:
+            i = int(np.searchsorted(self.keys, key))
+            self.atom_table = np.insert(
+                self.atom_table, i, np.zeros(1, dtype=ATOM_DTYPE))
+            self.atom_table["key"][i] = key
+            pairs = self.bond_table["atoms"]
+            pairs[pairs >= i] += 1
+            self._build_csr()
+        for f in ATOM_ATTRS:
+            self._set_atom_attr(i, f, getattr(atom, f))
+
+    def remove_atom(self, key):
+        """Remove an atom and adjacent bonds."""
+        i = self.atom_index(key)
+        pairs = self.bond_table["atoms"]
+        self.bond_table = self.bond_table[~np.any(pairs == i, axis=1)]
+        pairs = self.bond_table["atoms"]
+        pairs[pairs > i] -= 1
+        self.atom_table = np.delete(self.atom_table, i)
+        self._build_csr()
+
+    def atoms_iter(self):
+        """Iterate over atoms."""
+        for i, k in enumerate(self.keys.tolist()):
+            yield k, AtomView(self, k, i)
+
+    def atom_count(self):
+        """Get number of atoms."""
+        return len(self.atom_table)
+
+    def bond(self, key1, key2):
+        """Get a bond."""
+        return BondView(self, (key1, key2), self.bond_index(key1, key2))
+
+    def add_bond(self, key1, key2, bond):
+        """Set a bond. Existing bond will be overwritten."""
+        try:
+            e = self.bond_index(key1, key2)
+        except KeyError:
+            rec = np.zeros(1, dtype=BOND_DTYPE)
+            rec["atoms"] = (self.atom_index(key1), self.atom_index(key2))
+            self.bond_table = np.append(self.bond_table, rec)
+            e = len(self.bond_table) - 1
+            self._build_csr()
+        for f in BOND_FIELDS:
+            self.bond_table[f][e] = getattr(bond, f)
+
+    def remove_bond(self, key1, key2):
+        """Remove a bond."""
+        self.bond_table = np.delete(
+            self.bond_table, self.bond_index(key1, key2))
+        self._build_csr()
+
+    def bonds_iter(self):
+        """Iterate over bonds (in the same order as graphmol.Compound)."""
+        keys = self.keys.tolist()
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        edges = self.edges.tolist()
+        for i, k in enumerate(keys):
+            for p in range(indptr[i], indptr[i + 1]):
+                n = indices[p]
+                if n > i:
+                    yield k, keys[n], BondView(self, (k, keys[n]), edges[p])
+
+    def bond_count(self):
+        """Return number of bonds."""
+        return len(self.bond_table)
+
+    def key_set(self):
+        """Get a set of atom keys"""
+        return set(self.keys.tolist())
+
+    def _neighbors(self, key, i, keys):
+        s, e = self.indptr[i], self.indptr[i + 1]
+        return {
+            keys[n]: BondView(self, (key, keys[n]), b) for n, b in zip(
+                self.indices[s:e].tolist(), self.edges[s:e].tolist())}
+
+    def neighbors(self, key):
+        """Return dict of neighbor atom index and connecting bond."""
+        return self._neighbors(key, self.atom_index(key), self.keys.tolist())
+
+    def neighbor_count(self, key):
+        """Return number of neighbors."""
+        i = self.atom_index(key)
+        return int(self.indptr[i + 1] - self.indptr[i])
+
+    def neighbors_iter(self):
+        """Iterate over atoms and return its neighbors."""
+        keys = self.keys.tolist()
+        for i, k in enumerate(keys):
+            yield k, self._neighbors(k, i, keys)
+
+    @property
+    def graph(self):
+        """networkx.Graph of the molecule (for graph algorithms)
+
+        The graph is built on each access. Atom and bond attributes of the
+        graph are views of the molecule, but the changes of the graph
+        structure are not reflected to the molecule.
+        """
+        g = nx.Graph()
+        g.add_nodes_from((k, {"atom": a}) for k, a in self.atoms_iter())
+        g.add_edges_from((u, v, {"bond": b}) for u, v, b in self.bonds_iter())
+        return g
+
+    def copy(self):
+        """Return a copy of the molecule"""
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.atom_table = self.atom_table.copy()
+        new.bond_table = self.bond_table.copy()
+        new._tables = {k: list(v) for k, v in self._tables.items()}
+        new.data = dict(self.data)
+        new.descriptors = set(self.descriptors)
+        for k in ("rings", "scaffolds", "isolated"):
+            v = getattr(self, k)
+            if v is not None:
+                setattr(new, k, [list(c) for c in v])
+        return new
+
+    def clear(self):
+        """Empty the instance """
+        self.__init__()
+
+    def jsonized(self):
+        return Compound.jsonized(self)
+
+
+def _new(n, m):
+    mol = CompactMol()
+    mol.atom_table = np.zeros(n, dtype=ATOM_DTYPE)
+    mol.bond_table = np.zeros(m, dtype=BOND_DTYPE)
+    return mol
+
+
+def build(keys, symbols, bonds, **attrs):
+    """Build CompactMol from arrays
+
+    Attributes not given are set to the default values of the Atom and
+    Bond object.
+
+    Args:
+        keys (numpy.ndarray): atom keys (n, ascending order)
+        symbols (list): atom symbols (n)
+        bonds (numpy.ndarray): atom keys of bonds (m x 2)
+        attrs: atom attribute arrays (n) and bond attribute arrays (m)
+            named by the attribute (ex. charge=..., order=...).
+            coords (n x 2 or n x 3) is also accepted. None of optional
+            attributes (mass) is given as -1.
+
+    Raises:
+        KeyError: Symbol not defined in periodictable.yaml
+    """
+    bonds = np.asarray(bonds, dtype=np.int64).reshape(-1, 2)
+    mol = _new(len(symbols), len(bonds))
+    at = mol.atom_table
+    at["key"] = keys
+    mol.bond_table["atoms"] = np.searchsorted(at["key"], bonds)
+    # Atom defaults depend only on the symbol
+    distinct = {}
+    codes = np.array([distinct.setdefault(s, len(distinct)) for s in symbols],
+                     dtype=np.int64)
+    protos = np.zeros(len(distinct), dtype=ATOM_DTYPE)
+    for i, sym in enumerate(distinct):
+        a = Atom(sym)
+        for f in ATOM_TABLES:
+            protos[f][i] = mol._table_code(f, getattr(a, f))
+        for f in ATOM_FIELDS:
+            protos[f][i] = getattr(a, f)
+        protos["mass"][i] = -1
+        protos["color"][i] = a.color
+    keys = at["key"].copy()
+    at[:] = protos[codes]
+    at["key"] = keys
+    proto_bond = Bond()
+    for f in BOND_FIELDS:
+        mol.bond_table[f] = getattr(proto_bond, f)
+    for f, values in attrs.items():
+        if f == "coords":
+            values = np.asarray(values, dtype=np.float64)
+            at["coords"][:, :values.shape[1]] = values
+            at["coords_dim"] = values.shape[1]
+        elif f in ATOM_FIELDS or f in ATOM_OPTIONALS:
+            at[f] = values
+        elif f in BOND_FIELDS:
+            mol.bond_table[f] = values
+        else:
+            raise ValueError("Unsupported attribute: {}".format(f))
+    mol._build_csr()
+    return mol
+
+
+def from_compound(mol):
+    """Convert graphmol.Compound into CompactMol"""
+    keys = sorted(mol.key_set())
+    atoms = [mol.atom(k) for k in keys]
+    bonds = list(mol.bonds_iter())
+    cmol = _new(len(keys), len(bonds))
+    at = cmol.atom_table
+    at["key"] = keys
+    for f in ATOM_FIELDS:
+        at[f] = [getattr(a, f) for a in atoms]
+    for f in ATOM_OPTIONALS:
+        at[f] = [-1 if getattr(a, f) is None else getattr(a, f)
+                 for a in atoms]
+    for f in ATOM_TABLES:
+        at[f] = [cmol._table_code(f, getattr(a, f)) for a in atoms]
+    for i, a in enumerate(atoms):
+        cmol._set_atom_attr(i, "coords", a.coords)
+    at["color"] = np.array([a.color for a in atoms]).reshape(-1, 3)
+    bt = cmol.bond_table
+    bt["atoms"] = np.searchsorted(
+        at["key"], np.array([(u, v) for u, v, _ in bonds]).reshape(-1, 2))
+    for f in BOND_FIELDS:
+        bt[f] = [getattr(b, f) for _, _, b in bonds]
+    cmol._build_csr()
+    cmol.data = dict(mol.data)
+    cmol.descriptors = set(mol.descriptors)
+    cmol.rings = mol.rings
+    cmol.scaffolds = mol.scaffolds
+    cmol.isolated = mol.isolated
+    cmol.size2d = mol.size2d
+    return cmol
+
+
+def to_compound(cmol):
+    """Convert CompactMol into graphmol.Compound"""
+    mol = Compound()
+    for k, view in cmol.atoms_iter():
+        atom = Atom(view.symbol)
+        for f in ATOM_ATTRS:
+            setattr(atom, f, getattr(view, f))
+        mol.add_atom(k, atom)
+    for u, v, view in cmol.bonds_iter():
+        bond = Bond()
+        for f in BOND_FIELDS:
+            setattr(bond, f, getattr(view, f))
+        mol.add_bond(u, v, bond)
+    mol.data = dict(cmol.data)
+    mol.descriptors = set(cmol.descriptors)
+    mol.rings = cmol.rings
+    mol.scaffolds = cmol.scaffolds
+    mol.isolated = cmol.isolated
+    mol.size2d = cmol.size2d
+    return mol
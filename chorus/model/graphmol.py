@@ -131,6 +131,41 @@ class Compound(object):
         for n, adj in self.graph.adj.items():
             yield n, {n: attr["bond"] for n, attr in adj.items()}
 
+    def copy(self):
+        """Return a copy of the molecule
+
+        The graph, atoms, bonds, data and descriptor results are copied.
+        Attribute values of atoms and bonds (ex. coords) are not copied
+        but shared because they are always replaced, not modified.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.graph = self.graph.__class__()
+        new.graph.graph.update(self.graph.graph)
+        node = new.graph._node
+        adj = new.graph._adj
+        for n, attr in self.graph._node.items():
+            d = attr.copy()
+            d["atom"] = attr["atom"].copy()
+            node[n] = d
+        for u, nbrs in self.graph._adj.items():
+            row = adj[u] = {}
+            for v, attr in nbrs.items():
+                if v in adj and v != u:
+                    # the edge attribute dict is shared by adj[u] and adj[v]
+                    row[v] = adj[v][u]
+                    continue
+                d = attr.copy()
+                d["bond"] = attr["bond"].copy()
+                row[v] = d
+        new.data = dict(self.data)
+        new.descriptors = set(self.descriptors)
+        for k in ("rings", "scaffolds", "isolated"):
+            v = getattr(self, k)
+            if v is not None:
+                setattr(new, k, [list(c) for c in v])
+        return new
+
     def clear(self):
         """Empty the instance """
         # self.graph = nx.Graph()
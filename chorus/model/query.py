@@ -0,0 +1,240 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+""" Query molecule model (query.py)
+
+Atoms and bonds of a query molecule have predicates (allowed values of
+each property) instead of properties. Properties of atoms and bonds of a
+molecule to be searched are encoded as features, one bit for each property
+(see ATOM_FIELDS and BOND_FIELDS), and a predicate is compiled into a mask
+of the allowed bits. An atom or bond satisfies the predicate if
+features & ~mask == 0, so the matcher (substructure.mappings_iter) tests
+predicates by a few integer operations while it extends mappings.
+"""
+
+from chorus.model.atom import P_TAB
+from chorus.model.graphmol import Compound
+
+
+WORD_BITS = 64
+
+
+class Fields(object):
+    """ Bit layout of properties
+
+    Args:
+        fields (list): (name, values) values: possible values of the
+            property. If values are integers, out of range values are the
+            same as the smallest or largest value.
+
+    Attributes:
+        values (dict): name -> values
+        size (int): number of bits
+        words (int): number of words (WORD_BITS) of the bits
+    """
+    def __init__(self, fields):
+        self.values = {}
+        self.bits = {}  # (name, value) -> bit
+        self.lookup = {}  # name -> {value: bit}
+        self.masks = {}  # name -> all bits of the property
+        i = 0
+        for name, values in fields:
+            self.values[name] = tuple(values)
+            self.lookup[name] = {}
+            self.masks[name] = 0
+            for v in values:
+                self.bits[(name, v)] = 1 << i
+                self.lookup[name][v] = 1 << i
+                self.masks[name] |= 1 << i
+                i += 1
+        self.size = i
+        self.words = (i + WORD_BITS - 1) // WORD_BITS
+        self.all = (1 << i) - 1
+
+    def clamp(self, name, value):
+        values = self.values[name]
+        if isinstance(values[0], int) and not isinstance(values[0], bool):
+            return min(max(int(value), values[0]), values[-1])
+        return value
+
+    def features(self, **props):
+        """Features (int) of the properties
+
+        Raises:
+            KeyError: unknown property name or value
+        """
+        res = 0
+        for name, value in props.items():
+            table = self.lookup[name]
+            bit = table.get(value)
+            if bit is None:
+                bit = table[self.clamp(name, value)]
+            res |= bit
+        return res
+
+    def normalize(self, predicates):
+        """Predicates of all properties (tuple of allowed values or None
+        as any value)
+
+        Raises:
+            KeyError: unknown property name or value
+        """
+        unknown = set(predicates) - set(self.values)
+        if unknown:
+            raise KeyError("Unknown properties: {}".format(sorted(unknown)))
+        res = {}
+        for name in self.values:
+            values = predicates.get(name)
+            if values is not None:
+                if isinstance(values, (str, int)):
+                    values = (values,)
+                values = tuple(sorted(
+                    {self.clamp(name, v) for v in values}, key=str))
+                for v in values:
+                    if (name, v) not in self.bits:
+                        raise KeyError("Unknown value: {}={}".format(name, v))
+            res[name] = values
+        return res
+
+    def mask(self, predicates):
+        """Mask (int) of the predicates (see normalize)"""
+        res = self.all
+        for name, values in self.normalize(predicates).items():
+            if values is None:
+                continue
+            allowed = 0
+            for v in values:
+                allowed |= self.bits[(name, v)]
+            res = res & ~self.masks[name] | allowed
+        return res
+
+    def split(self, value):
+        """Words (list of int) of the bits from the lowest"""
+        w = (1 << WORD_BITS) - 1
+        return [value >> (WORD_BITS * i) & w for i in range(self.words)]
+
+
+ATOM_FIELDS = Fields([
+    ("symbol", sorted(P_TAB)),
+    ("pi", (0, 1, 2)),
+    ("aromatic", (False, True)),
+    ("charge", (-3, -2, -1, 0, 1, 2, 3)),
+    ("H_count", (0, 1, 2, 3, 4)),
+    ("ring", (False, True)),
+    ("degree", (0, 1, 2, 3, 4, 5, 6))
+])
+
+# Bond symbol: "-", "=", "#" by the order or ":" for aromatic bonds
+BOND_FIELDS = Fields([
+    ("symbol", ("-", "=", "#", ":")),
+    ("ring", (False, True))
+])
+
+BOND_SYMBOL = {1: "-", 2: "=", 3: "#"}
+
+
+def ring_members(mol):
+    """Atoms and bonds (frozenset of atom pair) in rings"""
+    mol.require("Topology")
+    atoms = set()
+    bonds = set()
+    for r in mol.rings:
+        atoms.update(r)
+        for i in range(len(r)):
+            bonds.add(frozenset((r[i - 1], r[i])))
+    return atoms, bonds
+
+
+def atom_features(mol, key, ring=False):
+    """Features of the atom of the molecule (ring: the atom is in a ring)"""
+    a = mol.atom(key)
+    return ATOM_FIELDS.features(
+        symbol=a.symbol, pi=a.pi, aromatic=bool(a.aromatic),
+        charge=a.charge, H_count=a.H_count, ring=ring,
+        degree=mol.neighbor_count(key))
+
+
+def bond_features(bond, ring=False):
+    """Features of the bond (ring: the bond is in a ring)"""
+    symbol = ":" if bond.aromatic else BOND_SYMBOL[bond.order]
+    return BOND_FIELDS.features(symbol=symbol, ring=ring)
+
+
+class QueryAtom(object):
+    """ Atom predicate of a query molecule
+
+    Each argument is an allowed value or a tuple of allowed values of the
+    property (None: any value). Charge, H_count and degree out of the range
+    of ATOM_FIELDS are the same as the smallest or largest value.
+
+    Args:
+        symbol: atom symbol
+        pi: number of pi electrons
+        aromatic (bool): aromatic atom
+        charge: charge
+        H_count: number of implicit hydrogens
+        ring (bool): the atom is in a ring
+        degree: number of neighbors
+
+    Attributes:
+        predicates (dict): property -> tuple of allowed values or None
+        mask (int): compiled bitmask
+
+    Raises:
+        KeyError: unknown property or value
+    """
+    def __init__(self, symbol=None, **predicates):
+        predicates["symbol"] = symbol
+        self.predicates = ATOM_FIELDS.normalize(predicates)
+        self.mask = ATOM_FIELDS.mask(self.predicates)
+
+    def __repr__(self):
+        return "QueryAtom({})".format(", ".join(
+            "{}={}".format(k, v) for k, v in self.predicates.items()
+            if v is not None))
+
+
+class QueryBond(object):
+    """ Bond predicate of a query molecule (see QueryAtom)
+
+    Args:
+        symbol: "-", "=", "#" (non-aromatic bond of the order) or ":"
+            (aromatic bond)
+        ring (bool): the bond is in a ring
+
+    Attributes:
+        predicates (dict): property -> tuple of allowed values or None
+        mask (int): compiled bitmask
+    """
+    def __init__(self, symbol=None, ring=None):
+        self.predicates = BOND_FIELDS.normalize(
+            {"symbol": symbol, "ring": ring})
+        self.mask = BOND_FIELDS.mask(self.predicates)
+
+    def __repr__(self):
+        return "QueryBond({})".format(", ".join(
+            "{}={}".format(k, v) for k, v in self.predicates.items()
+            if v is not None))
+
+
+class QueryMol(Compound):
+    """ Query molecule which has QueryAtom and QueryBond
+
+    Matched atoms and bonds of a molecule satisfy the predicates of the
+    query (see substructure.substructure). Unlike a Compound as a query,
+    bonds between matched atoms which are not in the query are allowed
+    (ex. a chain query matches a ring).
+    """
+    @classmethod
+    def from_compound(cls, mol):
+        """Query which matches the same atoms as the molecule does as a
+        query (symbol and pi, see substructure.atom_match) and any bonds"""
+        q = cls()
+        for k, a in mol.atoms_iter():
+            q.add_atom(k, QueryAtom(a.symbol, pi=a.pi))
+        for u, v, _ in mol.bonds_iter():
+            q.add_bond(u, v, QueryBond())
+        return q
@@ -6,32 +6,101 @@
 
 from collections import Counter
 import itertools
-import pickle
 
 
 from chorus.model.graphmol import Compound
 from chorus.model.atom import atom_number
-from chorus import descriptor, remover, topology, wclogp
+from chorus import descriptor, patty, remover, topology, wclogp
+
+
+""" Descriptor registry
+
+Descriptor name (the same as Compound.require) ->
+    (assign function, descriptors required by the function)
+"""
+DESCRIPTORS = {
+    "Topology": (topology.recognize, ()),
+    "Valence": (descriptor.assign_valence, ()),
+    "Rotatable": (descriptor.assign_rotatable, ("Valence", "Topology")),
+    "MinifiedRing": (topology.minify_ring, ("Topology",)),
+    "Aromatic": (descriptor.assign_aromatic, ("Valence", "MinifiedRing")),
+    "Phys_charge": (descriptor.assign_charge, ("Aromatic",)),
+    "Wildman-Crippen": (wclogp.assign_wctype, ("Aromatic",)),
+    "PATTY": (patty.assign_type, ("Phys_charge",))
+}
+
+""" Descriptors assigned by assign_descriptors """
+BASIC_DESCRIPTORS = ("Topology", "Valence", "Rotatable", "MinifiedRing",
+                     "Aromatic")
 
 
 def clone(mol):
-    """ Returns deepcopy of the object.
-    Pickle and unpickle is faster than deepcopy.
+    """ Returns copy of the molecule (see Compound.copy).
     TODO: this query function should be renamed to "cloned"
     """
-    return pickle.loads(pickle.dumps(mol, protocol=4))
+    return mol.copy()
 
 
-def assign_descriptors(mol):
+def descriptor_order(names):
+    """Return descriptors and their dependencies in order of calculation
+
+    Raises:
+        KeyError: if the descriptor is not registered
+    """
+    order = []
+
+    def visit(name):
+        if name in order:
+            return
+        for dep in DESCRIPTORS[name][1]:
+            visit(dep)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+
+def dependent_descriptors(names):
+    """Return descriptors and all descriptors depending on them"""
+    result = set(names)
+    for name in descriptor_order(DESCRIPTORS):
+        if result.intersection(DESCRIPTORS[name][1]):
+            result.add(name)
+    return result
+
+
+def update_descriptors(mol, names=BASIC_DESCRIPTORS):
+    """Assign descriptors (and their dependencies) which are not assigned
+    or have been invalidated. Assigned descriptors are not recalculated.
+
+    Args:
+        mol: Compound
+        names (iterable): descriptors required
+
+    Throws:
+        RuntimeError: if minify_ring failed
+    """
+    for name in descriptor_order(names):
+        if name not in mol.descriptors:
+            DESCRIPTORS[name][0](mol)
+
+
+def invalidate_descriptors(mol, names):
+    """Invalidate descriptors and the descriptors depending on them after
+    modification of the molecule. Call update_descriptors to recalculate.
     """
+    mol.descriptors -= dependent_descriptors(names)
+
+
+def assign_descriptors(mol):
+    """Recalculate basic descriptors
+
     Throws:
         RuntimeError: if minify_ring failed
     """
-    topology.recognize(mol)
-    descriptor.assign_valence(mol)
-    descriptor.assign_rotatable(mol)
-    topology.minify_ring(mol)
-    descriptor.assign_aromatic(mol)
+    invalidate_descriptors(mol, BASIC_DESCRIPTORS)
+    update_descriptors(mol)
 
 
 def make_Hs_implicit(original_mol, keep_stereo=True):
@@ -39,7 +108,6 @@ def make_Hs_implicit(original_mol, keep_stereo=True):
     TODO: this query function should be renamed to "explicitHs_removed"
     """
     mol = clone(original_mol)
-    mol.descriptors.clear()  # Reset descriptor
     to_remove = set()
     for i, nbrs in mol.neighbors_iter():
         if mol.atom(i).symbol == "H":  # do not remove H2
@@ -48,9 +116,22 @@ def make_Hs_implicit(original_mol, keep_stereo=True):
             if mol.atom(nbr).symbol == "H" and \
                     not (bond.order == 1 and bond.type and keep_stereo):
                 to_remove.add(nbr)
+    mol.descriptors &= set(DESCRIPTORS)  # unknown ones can not be updated
+    if any(mol.neighbor_count(r) > 1 for r in to_remove):
+        # Bridging hydrogen may be in a ring
+        invalidate_descriptors(mol, ("Topology", "Valence"))
+    else:
+        # Removal of terminal hydrogens changes hydrogen count and terminal
+        # bonds, but does not change rings.
+        invalidate_descriptors(mol, ("Valence", "Rotatable"))
+        if "Topology" in mol.descriptors:
+            largest = mol.key_set().difference(*mol.isolated)
+            comps = [[k for k in c if k not in to_remove]
+                     for c in [largest] + mol.isolated]
+            mol.isolated = sorted(comps, key=len, reverse=True)[1:]
     for r in to_remove:
         mol.remove_atom(r)
-    assign_descriptors(mol)
+    update_descriptors(mol)
     return mol
 
 
@@ -69,8 +150,16 @@ def largest_graph(mol):
     mol.require("Topology")
     m = clone(mol)  # Avoid modification of original object
     if m.isolated:
-        for k in itertools.chain.from_iterable(m.isolated):
+        removed = set(itertools.chain.from_iterable(m.isolated))
+        for k in removed:
             m.remove_atom(k)
+        # Rings of the largest graph and atom descriptors are still valid
+        keep = [i for i, r in enumerate(m.rings) if r[0] not in removed]
+        new_idx = {old: new for new, old in enumerate(keep)}
+        m.rings = [m.rings[i] for i in keep]
+        m.scaffolds = [[new_idx[i] for i in s] for s in m.scaffolds
+                       if s[0] in new_idx]
+        m.isolated = []
     return m
 
 
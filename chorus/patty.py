@@ -19,21 +19,21 @@ def assign_type(mol, force_recalc=False):
         nbrcnt = mol.neighbor_count(i)
         if atom.charge > 0 or atom.charge_phys > 0 or \
                 atom.charge_conj > 0 and not atom.n_oxide:
-            atom.type = 1  # cation
+            atom.patty = 1  # cation
         elif atom.charge < 0 or atom.charge_phys < 0 or \
                 atom.charge_conj < 0 and not atom.n_oxide:
-            atom.type = 2  # anion
+            atom.patty = 2  # anion
         elif atom.symbol == "N":
             if nbrcnt in (1, 2):
                 if atom.pi == 2:
-                    atom.type = 3  # donor
+                    atom.patty = 3  # donor
                 elif atom.pi == 1:
-                    atom.type = 4  # acceptor
+                    atom.patty = 4  # acceptor
         elif atom.symbol == "O":
             if nbrcnt == 1 and not atom.pi:
-                atom.type = 5  # polar
+                atom.patty = 5  # polar
             else:
-                atom.type = 4  # acceptor
+                atom.patty = 4  # acceptor
         elif atom.symbol in ("C", "Si", "S", "Se", "P", "As"):
             ewg = False
             for n, bond in mol.neighbors(i).items():
@@ -44,9 +44,9 @@ def assign_type(mol, force_recalc=False):
                     ewg = True
                     break
             if not ewg:
-                atom.type = 6  # hydrophobes
+                atom.patty = 6  # hydrophobes
         elif atom.symbol in ("F", "Cl", "Br", "I") and nbrcnt == 1:
-            atom.type = 6  # typical halogens are hydrophobic
+            atom.patty = 6  # typical halogens are hydrophobic
     mol.descriptors.add("PATTY")
 
 
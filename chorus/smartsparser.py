@@ -0,0 +1,271 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+""" SMARTS parser module (smartsparser.py)
+
+SMARTS text is parsed into a query molecule (model.query.QueryMol) in the
+same way as SMILES (see smilessupplier). Supported primitives are
+
+- atoms: element symbols (uppercase: aliphatic, lowercase: aromatic),
+  #<n> (atomic number), * (any), a, A, H<n> (implicit hydrogens),
+  D<n> (degree), R, R0 (ring membership), +<n>, -<n> (charge)
+- bonds: -, =, #, :, ~, @ (unspecified: single or aromatic)
+
+with logical operators !, & (or implicit), "," and ;. A predicate is a set
+of allowed values of each property, so "," is supported only if the
+operands differ in one property (ex. [C,N], [N,O;H1], [CH2,CH3] but not
+[C,H1]), and ! only for a single property (ex. [!#1], !@ but not !C).
+"""
+
+import re
+
+from chorus.model.atom import P_TAB
+from chorus.model.query import (
+    ATOM_FIELDS, BOND_FIELDS, QueryAtom, QueryBond, QueryMol)
+from chorus.smilessupplier import charge_sign
+
+
+# Tokens (group index)
+# 1: bracket atom, 2: atom symbol, 3: ring label, 4: bond expression,
+# 5: dot or branch
+TOKEN = re.compile(
+    r"\[([^\]]*)\]"
+    r"|(Cl|Br|[BCNOSPFI]|[bcnops]|\*|[aA])"
+    r"|(%[0-9]{2}|[0-9])"
+    r"|([-=#:~@!&,;]+)"
+    r"|([.()])"
+)
+ELEMENTS = sorted(P_TAB, key=len, reverse=True)  # longest match first
+# 1: atomic number, 2: H, D or R, 3: count, 4: element symbol,
+# 5: aromatic atom symbol, 6: a or A, 7: charge (* otherwise)
+ATOM_PRIMITIVE = re.compile(
+    r"#([0-9]+)|([HDR])([0-9]*)(?![a-z])|({})|(se|as|[bcnops])|\*"
+    r"|([aA])|([\+\-]+[0-9]*)".format("|".join(ELEMENTS))
+)
+HYDROGEN = re.compile(r"H([\+\-]+[0-9]*)?")
+BOND_PRIMITIVE = {
+    "-": {"symbol": {"-"}}, "=": {"symbol": {"="}},
+    "#": {"symbol": {"#"}}, ":": {"symbol": {":"}},
+    "~": {}, "@": {"ring": {True}}
+}
+DEFAULT_BOND = {"symbol": {"-", ":"}}
+
+
+def conjunction(p1, p2, fields):
+    """p1 and p2 (predicates are dicts of property -> allowed values)"""
+    res = dict(p1)
+    for name, values in p2.items():
+        res[name] = res.get(name, set(fields.values[name])) & values
+    return res
+
+
+def disjunction(p1, p2, fields):
+    """p1 or p2
+
+    Raises:
+        ValueError: the operands differ in more than one property
+    """
+    universe = fields.values
+    diff = [n for n in universe
+            if p1.get(n, set(universe[n])) != p2.get(n, set(universe[n]))]
+    if not diff:
+        return p1
+    if len(diff) > 1:
+        raise ValueError("Unsupported SMARTS: OR of different properties")
+    res = dict(p1)
+    name = diff[0]
+    res[name] = p1.get(name, set(universe[name])) | \
+        p2.get(name, set(universe[name]))
+    return res
+
+
+def negation(p, fields):
+    """not p
+
+    Raises:
+        ValueError: the operand has more than one property
+    """
+    if not p:
+        return {"symbol": set()}  # nothing
+    if len(p) > 1:
+        raise ValueError("Unsupported SMARTS: NOT of multiple properties")
+    name, values = next(iter(p.items()))
+    return {name: set(fields.values[name]) - values}
+
+
+def expression(text, primitives, fields):
+    """Predicate of the logical expression of primitives
+
+    Args:
+        text: expression
+        primitives: function which parses text into a list of
+            (negated, predicate)
+        fields: model.query.Fields
+    """
+    res = None
+    for low in text.split(";"):
+        p_or = None
+        for alt in low.split(","):
+            p_and = {}
+            for term in alt.split("&"):
+                if not term:
+                    raise ValueError("Syntax Error: empty SMARTS expression")
+                for negated, p in primitives(term):
+                    if negated:
+                        p = negation(p, fields)
+                    p_and = conjunction(p_and, p, fields)
+            p_or = p_and if p_or is None else disjunction(p_or, p_and, fields)
+        res = p_or if res is None else conjunction(res, p_or, fields)
+    return res
+
+
+def atom_primitives(text):
+    """List of (negated, predicate) of atom primitives
+
+    Raises:
+        ValueError: unsupported primitive
+    """
+    res = []
+    pos = 0
+    while pos < len(text):
+        negated = False
+        while text.startswith("!", pos):
+            negated = not negated
+            pos += 1
+        m = ATOM_PRIMITIVE.match(text, pos)
+        if m is None:
+            raise ValueError(
+                "Unsupported SMARTS primitive: {}".format(text[pos:]))
+        pos = m.end()
+        if m.group(1):
+            number = int(m.group(1))
+            p = {"symbol": {s for s, e in P_TAB.items()
+                            if e["number"] == number}}
+        elif m.group(2):
+            n = int(m.group(3)) if m.group(3) else None
+            if m.group(2) == "H":
+                p = {"H_count": {ATOM_FIELDS.clamp(
+                    "H_count", 1 if n is None else n)}}
+            elif m.group(2) == "D":
+                p = {"degree": {ATOM_FIELDS.clamp(
+                    "degree", 1 if n is None else n)}}
+            elif not n:
+                p = {"ring": {n is None}}
+            else:
+                raise ValueError("Unsupported SMARTS primitive: R{}".format(n))
+        elif m.group(4):
+            p = {"symbol": {m.group(4)}, "aromatic": {False}}
+        elif m.group(5):
+            p = {"symbol": {m.group(5).capitalize()}, "aromatic": {True}}
+        elif m.group(6):
+            p = {"aromatic": {m.group(6) == "a"}}
+        elif m.group(7):
+            p = {"charge": {ATOM_FIELDS.clamp(
+                "charge", charge_sign(m.group(7)))}}
+        else:  # *
+            p = {}
+        res.append((negated, p))
+    return res
+
+
+def bond_primitives(text):
+    res = []
+    negated = False
+    for c in text:
+        if c == "!":
+            negated = not negated
+            continue
+        res.append((negated, BOND_PRIMITIVE[c]))
+        negated = False
+    if negated:
+        raise ValueError("Syntax Error: unexpected symbol \"!\"")
+    return res
+
+
+def query_atom(p):
+    return QueryAtom(**{k: tuple(v) for k, v in p.items()})
+
+
+def query_bond(p):
+    return QueryBond(**{k: tuple(v) for k, v in p.items()})
+
+
+def smarts_to_query(smarts):
+    """ Build a query molecule from SMARTS text
+
+    Atom indices start from 1 in order of appearance.
+
+    Raises:
+        ValueError: SMARTS with unsupported format
+    """
+    atoms = []
+    bonds = []  # (u, v, bond predicate)
+    rings = {}  # ring label -> (atom index, bond predicate or None)
+    branches = []  # atom indices of branch points
+    prev = None  # atom index to be connected with the next atom
+    bond = None  # explicit bond to the next atom or ring closure
+    pos = 0
+    for m in TOKEN.finditer(smarts):
+        if m.start() != pos:
+            break
+        pos = m.end()
+        kind = m.lastindex
+        if kind <= 2:
+            if kind == 1:
+                contents = m.group(1)
+                if not contents:
+                    raise ValueError("Syntax Error: empty brackets")
+                if HYDROGEN.fullmatch(contents):  # [H] is not H_count
+                    atom = {"symbol": {"H"}}
+                    if len(contents) > 1:
+                        atom["charge"] = {charge_sign(contents[1:])}
+                else:
+                    atom = expression(contents, atom_primitives, ATOM_FIELDS)
+            else:
+                atom = atom_primitives(m.group(2))[0][1]
+            atoms.append(atom)
+            i = len(atoms)
+            if prev is not None:
+                bonds.append((prev, i, DEFAULT_BOND if bond is None else bond))
+            prev = i
+            bond = None
+        elif kind == 3:
+            if prev is None:
+                raise ValueError("Syntax Error: unexpected ring label")
+            label = m.group(3)
+            if label in rings:
+                u, b = rings.pop(label)
+                if bond is None:
+                    bond = DEFAULT_BOND if b is None else b
+                bonds.append((u, prev, bond))
+            else:
+                rings[label] = (prev, bond)
+            bond = None
+        elif kind == 4:
+            bond = expression(m.group(4), bond_primitives, BOND_FIELDS)
+        else:
+            token = m.group(5)
+            if token == "(":
+                branches.append(prev)
+            elif token == ")":
+                if not branches:
+                    raise ValueError("Syntax Error: unexpected symbol \")\"")
+                prev = branches.pop()
+            else:
+                prev = None
+                bond = None
+    if pos != len(smarts):
+        raise ValueError("Unsupported Symbol: {}".format(smarts[pos:]))
+    if branches:
+        raise ValueError("Syntax Error: unclosed branch")
+    if rings:
+        raise ValueError("Syntax Error: unclosed ring")
+    mol = QueryMol()
+    for i, p in enumerate(atoms, 1):
+        mol.add_atom(i, query_atom(p))
+    for u, v, p in bonds:
+        mol.add_bond(u, v, query_bond(p))
+    return mol
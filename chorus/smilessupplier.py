@@ -4,11 +4,13 @@
 # http://opensource.org/licenses/MIT
 #
 
-""" SMILES parser module (smilessupplier.py)"""
+""" SMILES parser module (smilessupplier.py)
 
-# TODO: make it simple and eager function
+SMILES text is tokenized by a regular expression and atoms and bonds are
+built in a single pass. Atom indices start from 1 in order of appearance
+(an explicit hydrogen on a chiral center follows the center atom).
+"""
 
-import copy
 import re
 import logging
 
@@ -21,296 +23,158 @@ from chorus import molutil
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
+AROMATIC = ("c", "n", "o", "p", "s")
+
+# Tokens (group index)
+# 1: bracket atom, 2: atom symbol, 3: ring label, 4: bond, dot or branch
+# Lowercase letters which can be an aromatic atom or an element of the
+# organic subset start a new atom (ex. Cl, Br, but Cc -> C + c)
+TOKEN = re.compile(
+    r"\[([^\]]*)\]"
+    r"|([A-Za-z][adeghjklmqrtuvwxyz]*)"
+    r"|(%[0-9]{2}|[0-9])"
+    r"|([-=#/\\.:()])"
+)
+BRACKET = re.compile(r"([0-9]*)([a-zA-Z][a-z]?)H?[0-9]*([\+\-]*[0-9]*)")
+BOND_ORDER = {"-": 1, "=": 2, "#": 3}
+
+
+def charge_sign(text):
+    """ Process charge signs.
+    + -> 1, - -> -1, +3 -> 3, +++ -> 3
+    Args:
+      text: charge signs (+, - or number)
+    Returns:
+      charge count (neg -2, -1, 0, 1, 2 pos)
+    """
+    result = 0
+    for c in text:
+        if c == "-":
+            result -= 1
+        elif c == "+":
+            result += 1
+        elif c.isdigit():
+            result *= int(c)
+    return result
 
-def element():
-    atom = []
-    bond = Bond()
-
-    def flush():
-        """ Flash a connection if exist
-        Returns:
-          (Atom(), Bond())
-          if no atom, returns (None, Bond())
-            (ring flag with multiple bond like =1)
-          if neither atom and bond, returns None
-        Raises:
-          ValueError: if the atom symbol is wrong or not supported
-        """
-        nonlocal bond
-        a = None
-        logtext = []
-        if atom:
-            symbol = ''.join(atom)
-            a = Atom(symbol.capitalize())
-            if symbol in ('c', 'n', 'o', 'p', 's'):
-                a.pi = 1
-                a.aromatic = True
-            logtext.append('Symbol:{}'.format(a.symbol))
-        else:
-            logtext.append('No element')
-        if bond:
-            logtext.append('Bond:{}'.format(bond.order))
-        else:
-            logtext.append('No bond')
-        logger.debug(', '.join(logtext))
-        result = (a, bond)  # copy
-        atom.clear()  # init
-        bond = Bond()  # init
-        return result
-
-    def exec_(token):
-        """ Process a token and return an atom and a bond if available.
-        Args:
-          token: token
-        Returns:
-          flush()
-        """
-        nonlocal bond
-        result = (None, None)
-        if not token:
-            return flush()
-        if atom and token.upper() in (
-                'B', 'C', 'N', 'O', 'P', 'I', 'S', 'F',
-                '=', '#', '/', '\\', '.'):
-            result = flush()
-        if token == '.':
-            bond = None
-        elif token == '=':
-            bond.order = 2
-        elif token == '#':
-            bond.order = 3
-        elif token == '/':
-            bond.smiles_cis_trans = 1
-        elif token == '\\':
-            bond.smiles_cis_trans = -1
-        else:
-            atom.append(token)
-        logger.debug('{} is queued'.format(token))
-        return result
-
-    return exec_
-
-
-def group():
-    container = []
-    exp = re.compile("([0-9]*)([a-zA-Z][a-z]?)H?[0-9]*([\+\-]*[0-9]*)")
-
-    def charge_sign(text):
-        """ Process charge signs.
-        + -> 1, - -> -1, +3 -> 3, +++ -> 3
-        Args:
-          text: charge signs (+, - or number)
-        Returns:
-          charge count (neg -2, -1, 0, 1, 2 pos)
-        """
-        result = 0
-        for c in text:
-            cases = {'-': -1, '+': 1}
-            if c in cases:
-                result += cases[c]
-            elif c.isdigit():
-                result *= int(c)
-        return result
-
-    def flush():
-        """ Flash an atom group
-        explicit hydrogen on the chiral center is added if exist.
-        Returns:
-          (Atom, hydrogen(as Compound branch))
-        Raises:
-          ValueError: if the atom symbol is wrong or not supported
-        """
-        contents = ''.join(container)
-        sym = ''
-        stereo = 0
-        atom = None
-        hydro = None
-        if '@@' in contents:
-            sym = '@@'
-            stereo = -1
-        elif '@' in contents:
-            sym = '@'
-            stereo = 1
-        if sym:
-            # chiral
-            c, h = contents.split(sym)
-            atom = Atom(c.capitalize())
-            if c in ('c', 'n', 'o', 'p', 's'):
-                atom.pi = 1
-            atom.stereo = stereo
-            if h:
-                mol = molecule()
-                mol('H')
-                hydro = mol(None)
-        else:
-            # charged, isotope or inorganic atoms
-            m = exp.match(contents)
-            if m:
-                logger.debug('Group parsed: {}'.format(m.groups()))
-                isotope = m.group(1)
-                atom = Atom(m.group(2).capitalize())
-                if m.group(2) in ('c', 'n', 'o', 'p', 's'):
-                    atom.pi = 1
-                atom.charge = charge_sign(m.group(3))
-        container.clear()  # init
-        return atom, hydro
-
-    def exec_(token):
-        """ Process a token and return a group if available.
-        Args:
-          token: token
-        Returns:
-          flush()
-        """
-        if not token:
-            return flush()
-        container.append(token)
-
-    return exec_
-
-
-def molecule():
-    idx = 0
-    depth = 0
-    is_group = False
-    cp = Compound()
-    cp.add_atom(idx, Atom('Dummy'))
-    elem = element()
-    grp = group()
-    branches = []
-    ring_labels = {}
-
-    def connect(e):
-        """ connect a bond and branches to the molecule
-        Args:
-          e: (Atom(), Bond())
-        """
-        nonlocal idx
-        for b, r in branches:
-            ai = cp.available_idx()
-            bond = b.bond(0, 1)
-            b.graph.remove_node(0)
-            cp.add_molecule(b, bond, idx, 1)
-            for k, v in r.items():
-                i, bond = v
-                ring(k, bond, i + ai - 1)
-        logger.debug('{} branches are merged'.format(len(branches)))
-        branches.clear()
-        if e[0]:
-            ai = cp.available_idx()
-            cp.add_atom(ai, e[0])
-            if e[1]:
-                cp.add_bond(idx, ai, e[1])
-                logger.debug('Connected:{} {}'.format(e[0].symbol, e[1].order))
-            else:
-                logger.debug('Added:{}'.format(e[0].symbol))
-            idx = ai
-        logger.debug(cp)
-
-    def ring(label, bond=None, i=None):
-        """ add ring label to the ring_labels dict.
-        if the label matched to existing label, flush and close ring
-        Args:
-          label: number (string type)
-          bond: Bond() to close the ring
-          i: index (for branch merging)
-        """
-        if not i:
-            i = idx
-        if label in ring_labels:
-            u = ring_labels[label][0]
-            if not bond:
-                bond = ring_labels[label][1]
-                if not bond:
-                    bond = Bond()
-            cp.add_bond(u, i, bond)
-            del ring_labels[label]
-            logger.debug('ring closed')
-            logger.debug(ring_labels)
-        else:
-            ring_labels[label] = (i, bond)
-            logger.debug('ring opened')
-            logger.debug(ring_labels)
 
-    def flush():
-        """ Flash a molecule
-        Returns:
-          (Compound, ring flag dict)
-        """
-        nonlocal idx
-        logger.debug('Flushed ({} atoms)'.format(cp.atom_count() - 1))
-        logger.debug('Ring labels: {}'.format(ring_labels))
-        logger.debug(cp)
-        result = (copy.deepcopy(cp), copy.deepcopy(ring_labels))  # copy
-        idx = 0  # init
-        cp.clear()  # init
-        cp.add_atom(idx, Atom('Dummy'))  # init
-        ring_labels.clear()  # init
-        return result
+def bracket_atom(contents):
+    """ Atom in square brackets
+    Isotope and hydrogen count are ignored except for an explicit hydrogen
+    on the chiral center.
+    Args:
+      contents: text in the brackets
+    Returns:
+      (Atom, whether it has an explicit hydrogen)
+    Raises:
+      ValueError: unsupported format
+      KeyError: unsupported atom symbol
+    """
+    if "@" in contents:
+        # chiral
+        stereo = -1 if "@@" in contents else 1
+        c, h = contents.split("@@" if stereo == -1 else "@")
+        atom = Atom(c.capitalize())
+        if c in AROMATIC:
+            atom.pi = 1
+        atom.stereo = stereo
+        return atom, bool(h)
+    # charged, isotope or inorganic atoms
+    m = BRACKET.match(contents)
+    if m is None:
+        raise ValueError("Unsupported Symbol: [{}]".format(contents))
+    atom = Atom(m.group(2).capitalize())
+    if m.group(2) in AROMATIC:
+        atom.pi = 1
+    atom.charge = charge_sign(m.group(3))
+    return atom, False
+
+
+def parse(smiles):
+    """ Build a compound from SMILES text (descriptors are not assigned)
 
-    def exec_(token):
-        """ Process a token and return a compound if available.
-        Args:
-          token: token
-        Returns:
-          flush()
-        """
-        nonlocal depth
-        nonlocal is_group
-        if not token:
-            connect(elem(None))
-            return flush()
-        logger.debug('{} is supplied'.format(token))
-        if token == ':':
-            return
-        elif token == ')':
-            depth -= 1
-            if depth > 0:
-                branches[-1](token)
-                logger.debug('Depth {}: {} is sent to branch'.format(depth, token))
-            elif not depth:
-                branches[-1] = branches[-1](None)
-                logger.debug('branch closed'.format(depth))
+    Raises:
+      ValueError: SMILES with unsupported format
+      KeyError: unsupported atom symbol
+    """
+    atoms = []
+    bonds = []  # (u, v, Bond)
+    rings = {}  # ring label -> (atom index, Bond or None)
+    branches = []  # atom indices of branch points
+    prev = None  # atom index to be connected with the next atom
+    bond = None  # explicit bond to the next atom or ring closure
+    pos = 0
+    for m in TOKEN.finditer(smiles):
+        if m.start() != pos:
+            break
+        pos = m.end()
+        kind = m.lastindex
+        if kind <= 2:
+            if kind == 1:
+                atom, hydro = bracket_atom(m.group(1))
             else:
-                raise ValueError('Syntax Error: unexpected symbol \")\"')
-        elif token == '(':
-            if depth:
-                branches[-1](token)
-                logger.debug('Depth {}: {} is sent to branch'.format(depth, token))
+                symbol = m.group(2)
+                atom = Atom(symbol.capitalize())
+                if symbol in AROMATIC:
+                    atom.pi = 1
+                    atom.aromatic = True
+                hydro = False
+            atoms.append(atom)
+            i = len(atoms)
+            if prev is not None:
+                bonds.append((prev, i, bond or Bond()))
+            if hydro:
+                atoms.append(Atom("H"))
+                bonds.append((i, i + 1, Bond()))
+            prev = i
+            bond = None
+        elif kind == 3:
+            if prev is None:
+                raise ValueError("Syntax Error: unexpected ring label")
+            label = m.group(3)
+            if label in rings:
+                u, b = rings.pop(label)
+                bonds.append((u, prev, bond or b or Bond()))
             else:
-                connect(elem(None))
-                branches.append(molecule())
-                logger.debug('Depth {}: branch started'.format(depth))
-            depth += 1
+                rings[label] = (prev, bond)
+            bond = None
         else:
-            if depth:
-                branches[-1](token)
-                logger.debug('Depth {}: {} is sent to branch'.format(depth, token))
-            elif token == ']':
-                g, h = grp(None)
-                e = elem(None)
-                if e[0]:
-                    connect(e)
-                    e = (None, Bond())
-                connect((g, e[1]))
-                if h:
-                    branches.append(h)
-                is_group = False
-            elif is_group:
-                    grp(token)
-            elif token == '[':
-                    is_group = True
-            elif token.isdigit():
-                e = elem(None)
-                if e[0] is None:
-                    ring(token, e[1])
-                else:
-                    connect(e)
-                    ring(token)
-            else:
-                connect(elem(token))
-
-    return exec_
+            token = m.group(4)
+            if token in BOND_ORDER:
+                if bond is None:
+                    bond = Bond()
+                bond.order = BOND_ORDER[token]
+            elif token == "(":
+                branches.append(prev)
+            elif token == ")":
+                if not branches:
+                    raise ValueError("Syntax Error: unexpected symbol \")\"")
+                prev = branches.pop()
+            elif token == ".":
+                prev = None
+                bond = None
+            elif token == ":":
+                continue
+            else:  # cis-trans
+                if bond is None:
+                    bond = Bond()
+                bond.smiles_cis_trans = 1 if token == "/" else -1
+    if pos != len(smiles):
+        raise ValueError("Unsupported Symbol: {}".format(smiles[pos:]))
+    if branches:
+        raise ValueError("Syntax Error: unclosed branch")
+    logger.debug("{} atoms, {} bonds, unclosed rings: {}".format(
+        len(atoms), len(bonds), list(rings)))
+    # Fill the adjacency dicts directly (see graphmol.Compound.copy)
+    mol = Compound()
+    node = mol.graph._node
+    adj = mol.graph._adj
+    for i, a in enumerate(atoms, 1):
+        node[i] = {"atom": a}
+        adj[i] = {}
+    for u, v, b in bonds:
+        adj[u][v] = adj[v][u] = {"bond": b}
+    return mol
 
 
 def smiles_to_compound(smiles, assign_descriptors=True):
@@ -319,16 +183,45 @@ def smiles_to_compound(smiles, assign_descriptors=True):
     Raises:
         ValueError: SMILES with unsupported format
     """
-    it = iter(smiles)
-    mol = molecule()
     try:
-        for token in it:
-                mol(token)
-        result, _ = mol(None)
+        result = parse(smiles)
     except KeyError as err:
         raise ValueError("Unsupported Symbol: {}".format(err))
-    result.graph.remove_node(0)
-    logger.debug(result)
     if assign_descriptors:
         molutil.assign_descriptors(result)
     return result
+
+
+def smiles_supplier(lines, no_halt=True, assign_descriptors=True):
+    """Yields molecules from lines of SMILES file
+
+    Each line has SMILES and an optional name separated by whitespace.
+    The name is stored in data["name"]. Empty lines are skipped.
+
+    Args:
+        lines (iterable): lines of SMILES file
+        no_halt (bool): if True, unsupported SMILES is reported and
+            yielded as a null molecule instead of raising ValueError
+        assign_descriptors (bool): see smiles_to_compound
+    """
+    for i, line in enumerate(lines):
+        fields = line.strip().split(None, 1)
+        if not fields:
+            continue
+        try:
+            c = smiles_to_compound(fields[0], assign_descriptors)
+        except ValueError as err:
+            if not no_halt:
+                raise
+            print("{} (#{} in smilessupplier)".format(err, i + 1))
+            c = molutil.null_molecule(assign_descriptors)
+        if len(fields) > 1:
+            c.data["name"] = fields[1]
+        yield c
+
+
+def mols_from_file(path, no_halt=True, assign_descriptors=True):
+    """Compound supplier from SMILES file (see smiles_supplier)"""
+    with open(path) as f:
+        for c in smiles_supplier(f, no_halt, assign_descriptors):
+            yield c
@@ -7,9 +7,25 @@
 import operator
 from collections import Counter
 
+import networkx as nx
 from networkx.algorithms.isomorphism.vf2userfunc import GraphMatcher
 
 from chorus import molutil
+from chorus.model.query import (
+    ATOM_FIELDS, BOND_FIELDS, WORD_BITS, QueryMol, atom_features,
+    bond_features, ring_members)
+
+try:
+    from chorus.cython import vf2
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
+
+
+# Masks of properties not compared by atom_match (a molecule as a pattern)
+PLAIN_ATOM = ATOM_FIELDS.split(
+    ATOM_FIELDS.all & ~ATOM_FIELDS.masks["symbol"] & ~ATOM_FIELDS.masks["pi"])
+PLAIN_BOND = BOND_FIELDS.all
 
 
 def atom_match(n1, n2):
@@ -19,6 +35,200 @@ def atom_match(n1, n2):
         return True
 
 
+def encode(mol):
+    """Integer-encoded atoms and bonds and compact adjacency of the molecule
+
+    Atoms and bonds of a Compound are encoded as features, and those of a
+    model.query.QueryMol as masks of the predicates.
+
+    Returns:
+        tuple: (keys, atoms, indptr, indices, bonds) keys: atom indices,
+        atoms: words of the i-th atom are atoms[i * w:(i + 1) * w]
+        (w: ATOM_FIELDS.words), neighbors of the i-th atom are
+        indices[indptr[i]:indptr[i + 1]] and bonds[j] is the bond to
+        indices[j]
+    """
+    query = isinstance(mol, QueryMol)
+    if not query:
+        ring_atoms, ring_bonds = ring_members(mol)
+    keys = list(mol.graph.adj)
+    pos = {k: i for i, k in enumerate(keys)}
+    atoms = []
+    indptr = [0]
+    indices = []
+    bonds = []
+    for k, nbrs in mol.graph.adj.items():
+        if query:
+            atoms.extend(ATOM_FIELDS.split(mol.atom(k).mask))
+        else:
+            atoms.extend(ATOM_FIELDS.split(
+                atom_features(mol, k, k in ring_atoms)))
+        for n, attr in nbrs.items():
+            indices.append(pos[n])
+            if query:
+                bonds.append(attr["bond"].mask)
+            else:
+                bonds.append(bond_features(
+                    attr["bond"], frozenset((k, n)) in ring_bonds))
+        indptr.append(len(indices))
+    return keys, atoms, indptr, indices, bonds
+
+
+def plain_masks(encoded):
+    """Encoded molecule as a pattern: masks of the symbol and pi of atoms
+    (see atom_match) and of any bonds"""
+    keys, atoms, indptr, indices, bonds = encoded
+    w = ATOM_FIELDS.words
+    atoms = [b | PLAIN_ATOM[i % w] for i, b in enumerate(atoms)]
+    return keys, atoms, indptr, indices, [PLAIN_BOND] * len(bonds)
+
+
+def bit_graph(encoded):
+    """networkx.Graph of the encoded molecule (node and edge attribute
+    "bits": features or masks)"""
+    keys, atoms, indptr, indices, bonds = encoded
+    w = ATOM_FIELDS.words
+    g = nx.Graph()
+    for i in range(len(keys)):
+        bits = sum(b << (WORD_BITS * j)
+                   for j, b in enumerate(atoms[i * w:i * w + w]))
+        g.add_node(i, bits=bits)
+    for i in range(len(keys)):
+        for j in range(indptr[i], indptr[i + 1]):
+            g.add_edge(i, indices[j], bits=bonds[j])
+    return g
+
+
+def bits_match(target, pattern):
+    return not target["bits"] & ~pattern["bits"]
+
+
+class PreparedMolecule(object):
+    """ Molecule normalized once for repeated comparisons
+
+    largest_graph and make_Hs_implicit (they clone the molecule and
+    recalculate descriptors) are applied once, and the values compared by
+    equal, substructure and the matcher are cached. Prepared molecules can
+    be passed to them instead of Compound objects as both of mol and query.
+
+    Args:
+        mol: Compound (not modified)
+        largest_only, ignore_hydrogen: see substructure
+
+    Attributes:
+        mol: normalized molecule (new object)
+        counts (list): Counters compared by filter_ (composition, pi,
+            ring sizes and scaffold sizes)
+        mw (float): molecular weight
+        encoded (tuple): see encode (computed when the matcher needs it)
+    """
+    def __init__(self, mol, largest_only=True, ignore_hydrogen=True):
+        self.largest_only = largest_only
+        self.ignore_hydrogen = ignore_hydrogen
+        if largest_only:
+            mol = molutil.largest_graph(mol)
+        if ignore_hydrogen:
+            mol = molutil.make_Hs_implicit(mol)
+        mol.require("Topology")
+        self.mol = mol
+        self.counts = [
+            molutil.composition(mol),
+            Counter(a.pi for _, a in mol.atoms_iter()),
+            Counter(len(r) for r in mol.rings),
+            Counter(len(s) for s in mol.scaffolds)
+        ]
+        self.mw = molutil.mw(mol)
+        self._encoded = None
+        self._graphs = {}
+
+    def __len__(self):
+        return len(self.mol)
+
+    @property
+    def encoded(self):
+        if self._encoded is None:
+            self._encoded = encode(self.mol)
+        return self._encoded
+
+    def graph(self, pattern=False):
+        """Atom keys and vf2.Graph of the molecule as a target or a pattern
+        (see plain_masks)"""
+        if pattern not in self._graphs:
+            keys, *g = plain_masks(self.encoded) if pattern else self.encoded
+            self._graphs[pattern] = keys, vf2.Graph(*g)
+        return self._graphs[pattern]
+
+
+def prepare(mol, largest_only=True, ignore_hydrogen=True):
+    """ PreparedMolecule of the molecule (returned as it is if prepared)
+
+    Raises:
+        ValueError: the molecule is prepared with different options
+    """
+    if not isinstance(mol, PreparedMolecule):
+        return PreparedMolecule(mol, largest_only, ignore_hydrogen)
+    if (mol.largest_only, mol.ignore_hydrogen) != \
+            (largest_only, ignore_hydrogen):
+        raise ValueError("Molecule prepared with different options")
+    return mol
+
+
+def mappings_iter(pattern, target):
+    """Iterate mappings of the pattern onto induced subgraphs of the
+    target. Atoms are compared by atom_match and bonds are not compared.
+
+    If the pattern is a model.query.QueryMol, atoms and bonds satisfy the
+    predicates of the query, and the subgraphs are not necessarily induced
+    (other bonds between the matched atoms are allowed).
+
+    Args:
+        pattern: Compound, PreparedMolecule (compared as it is) or QueryMol
+        target: Compound or PreparedMolecule
+
+    Yields:
+        dict: pattern atom index -> target atom index
+    """
+    def compound(mol):
+        return mol.mol if isinstance(mol, PreparedMolecule) else mol
+
+    def encoded(mol):
+        if isinstance(mol, PreparedMolecule):
+            return mol.encoded
+        return encode(mol)
+
+    if not len(pattern):
+        yield {}
+        return
+    query = isinstance(pattern, QueryMol)
+    if not CYTHON_AVAILABLE:
+        if query:
+            keys1 = list(pattern.graph)
+            keys2 = list(compound(target).graph)
+            gm = GraphMatcher(
+                bit_graph(encoded(target)), bit_graph(encoded(pattern)),
+                node_match=bits_match, edge_match=bits_match)
+            for m in gm.subgraph_monomorphisms_iter():
+                yield {keys1[p]: keys2[t] for t, p in m.items()}
+            return
+        gm = GraphMatcher(compound(target).graph, compound(pattern).graph,
+                          node_match=atom_match)
+        for m in gm.subgraph_isomorphisms_iter():
+            yield {p: t for t, p in m.items()}
+        return
+    if isinstance(pattern, PreparedMolecule):
+        keys1, graph1 = pattern.graph(pattern=True)
+    else:
+        keys1, *g = encode(pattern) if query else plain_masks(encode(pattern))
+        graph1 = vf2.Graph(*g)
+    if isinstance(target, PreparedMolecule):
+        keys2, graph2 = target.graph()
+    else:
+        keys2, *g = encode(target)
+        graph2 = vf2.Graph(*g)
+    for m in vf2.Matcher(graph1, graph2, not query):
+        yield {keys1[i]: keys2[j] for i, j in enumerate(m)}
+
+
 def filter_(mol, query, f=operator.ne):
     mol.require("Topology")
     query.require("Topology")
@@ -36,54 +246,62 @@ def filter_(mol, query, f=operator.ne):
     return True
 
 
-def equal(mol, query, largest_only=True, ignore_hydrogen=True):
+def equal(mol, query, largest_only=True, ignore_hydrogen=True,
+          mappings=False):
     """ if mol is exactly same structure as the query, return True
+    (see canonical.canonical_hash for lookup in many molecules)
     Args:
-      mol: Compound
-      query: Compound
+      mol: Compound or PreparedMolecule
+      query: Compound or PreparedMolecule
+      mappings: if True, return an iterator of all atom mappings
+        (dict: mol atom index -> query atom index) instead
     """
-    m = molutil.clone(mol)
-    q = molutil.clone(query)
-    if largest_only:
-        m = molutil.largest_graph(m)
-        q = molutil.largest_graph(q)
-    if ignore_hydrogen:
-        m = molutil.make_Hs_implicit(m)
-        q = molutil.make_Hs_implicit(q)
-    if molutil.mw(m) == molutil.mw(q):
-        gm = GraphMatcher(q.graph, m.graph, node_match=atom_match)
-        return gm.is_isomorphic()
-    return False
-
-
-def substructure(mol, query, largest_only=True, ignore_hydrogen=True):
+    # Only read here (PreparedMolecule has new objects)
+    m = prepare(mol, largest_only, ignore_hydrogen)
+    q = prepare(query, largest_only, ignore_hydrogen)
+    res = iter(())
+    # Rounded weights of the same composition may differ by the order of
+    # atoms, so a small difference is allowed
+    if len(m) == len(q) and m.mol.bond_count() == q.mol.bond_count() and \
+            abs(m.mw - q.mw) < 0.05:
+        # Induced subgraph of the same size is the whole graph
+        res = mappings_iter(m, q)
+    if mappings:
+        return res
+    return next(res, None) is not None
+
+
+def substructure(mol, query, largest_only=True, ignore_hydrogen=True,
+                 mappings=False):
     """ if mol is a substructure of the query, return True
     Args:
-      mol: Compound
-      query: Compound
+      mol: Compound, PreparedMolecule or model.query.QueryMol (the query
+        molecule is compared as it is, see mappings_iter)
+      query: Compound or PreparedMolecule
       largest_only: compare only largest graph molecule
+      mappings: if True, return an iterator of all atom mappings
+        (dict: mol atom index -> query atom index) instead
     """
-    def subset_filter(cnt1, cnt2):
-        diff = cnt2
-        diff.subtract(cnt1)
-        if any(v < 0 for v in diff.values()):
-            return True
-
+    res = iter(())
     if not (len(mol) and len(query)):
-        return False  # two blank molecules are not isomorphic
-    m = molutil.clone(mol)
-    q = molutil.clone(query)
-    if largest_only:
-        m = molutil.largest_graph(m)
-        q = molutil.largest_graph(q)
-    if ignore_hydrogen:
-        m = molutil.make_Hs_implicit(m)
-        q = molutil.make_Hs_implicit(q)
-    if filter_(m, q, f=subset_filter):
-        gm = GraphMatcher(q.graph, m.graph, node_match=atom_match)
-        return gm.subgraph_is_isomorphic()
-    return False
-
-
-def superstructure(mol, query, largest_only=True, ignore_hydrogen=True):
-    return substructure(query, mol, largest_only, ignore_hydrogen)
+        # two blank molecules are not isomorphic
+        return res if mappings else False
+    # Only read here (PreparedMolecule has new objects)
+    q = prepare(query, largest_only, ignore_hydrogen)
+    if isinstance(mol, QueryMol):
+        # Predicates are tested by the matcher
+        res = mappings_iter(mol, q)
+        return res if mappings else next(res, None) is not None
+    m = prepare(mol, largest_only, ignore_hydrogen)
+    # Same as filter_ (counts of the query are not less than the mol's)
+    if all(all(cq[k] >= v for k, v in cm.items())
+           for cm, cq in zip(m.counts, q.counts)):
+        res = mappings_iter(m, q)
+    if mappings:
+        return res
+    return next(res, None) is not None
+
+
+def superstructure(mol, query, largest_only=True, ignore_hydrogen=True,
+                   mappings=False):
+    return substructure(query, mol, largest_only, ignore_hydrogen, mappings)
@@ -0,0 +1,221 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+""" Batch substructure search (substructurebatch.py)
+
+Substructure search of a query over a compound library. Molecules of the
+library are prepared once (substructure.PreparedMolecule), and their
+path fingerprints and the count vectors of substructure.filter_ are
+stored in numpy arrays. A query is screened against the whole library by
+vectorized tests, and only survivors are compared by the exact matcher
+(substructure.mappings_iter). The results are the same as
+substructure.substructure(query, mol) of each molecule. Query molecules
+(model.query.QueryMol) are not screened because their predicates are not
+labels of the fingerprint and the counts, but tested by the matcher.
+
+Path fingerprint: labels of atoms (symbol and pi electrons, see
+substructure.atom_match) along each simple path up to MAX_PATH_LENGTH
+bonds are hashed into FP_BITS bits. Paths of the query are mapped to paths
+of a matched molecule, so the query bits must be a subset of the molecule
+bits.
+"""
+
+import time
+import zlib
+
+import numpy as np
+
+from chorus.model.query import QueryMol
+from chorus.substructure import mappings_iter, prepare
+
+
+FP_BITS = 1024
+MAX_PATH_LENGTH = 5
+
+
+def path_features(mol, max_length=MAX_PATH_LENGTH):
+    """Set of atom label sequences of simple paths
+
+    Args:
+        mol: Compound
+        max_length (int): maximum number of bonds in a path
+
+    Returns:
+        set: labels joined by "-" (the smaller direction of the path)
+    """
+    labels = {i: "{}{}".format(a.symbol, a.pi) for i, a in mol.atoms_iter()}
+    adj = {i: list(nbrs) for i, nbrs in mol.graph.adj.items()}
+    features = set()
+    for root in adj:
+        path = [root]
+        stack = [iter(adj[root])]
+        features.add(labels[root])
+        while stack:
+            nbr = next(stack[-1], None)
+            if nbr is None:
+                stack.pop()
+                path.pop()
+                continue
+            if nbr in path:
+                continue
+            path.append(nbr)
+            seq = [labels[n] for n in path]
+            features.add("-".join(min(seq, seq[::-1])))
+            if len(path) > max_length:
+                path.pop()
+            else:
+                stack.append(iter(adj[nbr]))
+    return features
+
+
+def path_fingerprint(mol, max_length=MAX_PATH_LENGTH, nbits=FP_BITS):
+    """Hashed path fingerprint
+
+    Returns:
+        numpy.ndarray: nbits bits in uint64 words
+    """
+    fp = np.zeros(nbits // 64, dtype=np.uint64)
+    bits = np.array([zlib.crc32(f.encode()) % nbits
+                     for f in path_features(mol, max_length)],
+                    dtype=np.uint64)
+    np.bitwise_or.at(fp, (bits >> np.uint64(6)).astype(np.intp),
+                     np.uint64(1) << (bits & np.uint64(63)))
+    return fp
+
+
+def filter_counts(mol):
+    """Counts compared by substructure.filter_ in a dict
+
+    Keys are ("composition", symbol), ("pi", pi electrons),
+    ("ring", ring size) and ("scaffold", number of rings).
+
+    Args:
+        mol: substructure.PreparedMolecule
+    """
+    counts = {}
+    for name, cnt in zip(("composition", "pi", "ring", "scaffold"),
+                         mol.counts):
+        for k, v in cnt.items():
+            counts[(name, k)] = v
+    return counts
+
+
+class SubstructureLibrary(object):
+    """Substructure search index of a compound library
+
+    Args:
+        mols (iterable): Compound or substructure.PreparedMolecule objects
+        largest_only, ignore_hydrogen: see substructure.substructure
+
+    Attributes:
+        mols (list): substructure.PreparedMolecule of the molecules
+        fingerprints (numpy.ndarray): path fingerprints of the molecules
+        counts (numpy.ndarray): count vectors of the molecules
+        features (dict): key of filter_counts -> column of counts
+    """
+    def __init__(self, mols, largest_only=True, ignore_hydrogen=True):
+        self.largest_only = largest_only
+        self.ignore_hydrogen = ignore_hydrogen
+        self.mols = []
+        self.features = {}
+        fps = []
+        rows = []
+        for mol in mols:
+            mol = prepare(mol, largest_only, ignore_hydrogen)
+            self.mols.append(mol)
+            fps.append(path_fingerprint(mol.mol))
+            counts = filter_counts(mol)
+            for k in counts:
+                self.features.setdefault(k, len(self.features))
+            rows.append(counts)
+        self.fingerprints = np.array(fps, dtype=np.uint64).reshape(
+            -1, FP_BITS // 64)
+        self.counts = np.zeros((len(rows), len(self.features)),
+                               dtype=np.int32)
+        for i, counts in enumerate(rows):
+            for k, v in counts.items():
+                self.counts[i, self.features[k]] = v
+        self.nonempty = np.array([len(m) > 0 for m in self.mols], dtype=bool)
+
+    def __len__(self):
+        return len(self.mols)
+
+    def screen(self, query):
+        """Indices of molecules which may contain the query
+
+        Args:
+            query: substructure.PreparedMolecule or model.query.QueryMol
+                (only empty molecules are eliminated)
+
+        Returns:
+            tuple: (indices, eliminated) eliminated: dict of the number of
+            molecules eliminated as empty ones (or all if the query is
+            empty), by fingerprint and by counts
+        """
+        keep = self.nonempty.copy()
+        if not len(query):
+            keep[:] = False
+        eliminated = {"empty": len(keep) - int(np.count_nonzero(keep))}
+        if isinstance(query, QueryMol):
+            eliminated.update(fingerprint=0, counts=0)
+            return np.nonzero(keep)[0], eliminated
+        fp = path_fingerprint(query.mol)
+        fp_ok = np.all((self.fingerprints & fp) == fp, axis=1)
+        eliminated["fingerprint"] = int(np.count_nonzero(keep & ~fp_ok))
+        keep &= fp_ok
+        cols = []
+        values = []
+        missing = False  # the query has a feature no molecules have
+        for k, v in filter_counts(query).items():
+            if k in self.features:
+                cols.append(self.features[k])
+                values.append(v)
+            elif v > 0:
+                missing = True
+        count_ok = np.all(self.counts[:, cols] >= values, axis=1)
+        if missing:
+            count_ok[:] = False
+        eliminated["counts"] = int(np.count_nonzero(keep & ~count_ok))
+        keep &= count_ok
+        return np.nonzero(keep)[0], eliminated
+
+    def search(self, query):
+        """Find molecules which contain the query as a substructure
+
+        Results are the same as substructure.substructure(query, mol).
+
+        Args:
+            query: Compound, substructure.PreparedMolecule or
+                model.query.QueryMol
+
+        Returns:
+            tuple: (indices, report) indices: list of matched molecules,
+            report: dict of total: number of molecules, eliminated: number
+            of molecules eliminated as empty, by fingerprint, counts and
+            matcher, matched: number of matched molecules,
+            screen_out_rate: ratio of molecules eliminated without the
+            matcher, elapsed_time
+        """
+        start_time = time.perf_counter()
+        total = len(self.mols)
+        q = query
+        if not isinstance(query, QueryMol):
+            q = prepare(query, self.largest_only, self.ignore_hydrogen)
+        candidates, eliminated = self.screen(q)
+        matched = []
+        for i in candidates.tolist():
+            if next(mappings_iter(q, self.mols[i]), None) is not None:
+                matched.append(i)
+        eliminated["matcher"] = len(candidates) - len(matched)
+        screened = total - len(candidates)
+        report = {
+            "total": total,
+            "eliminated": eliminated,
+            "matched": len(matched),
+            "screen_out_rate": round(screened / total, 4) if total else 0,
+            "elapsed_time": round(time.perf_counter() - start_time, 7)
+        }
+        return matched, report
@@ -4,9 +4,11 @@
 # http://opensource.org/licenses/MIT
 #
 
+import json
+import pickle
 import unittest
 
-from chorus.model.atom import Atom
+from chorus.model.atom import Atom, element
 
 
 class TestAtom(unittest.TestCase):
@@ -38,3 +40,39 @@ class TestAtom(unittest.TestCase):
         atom.charge = -2
         self.assertEqual(atom.formula_html(), "S<sup>2–</sup>")
         # en dash, not hyphen-minus
+
+    def test_element(self):
+        a1 = Atom('N')
+        a2 = Atom('N')
+        self.assertIs(a1.element, a2.element)
+        self.assertEqual((a1.name, a1.number), ("Nitrogen", 7))
+        self.assertFalse(hasattr(a1, "__dict__"))
+        # Modification does not affect other atoms
+        a1.color = [0, 0, 0]
+        self.assertEqual(a1.color, (0, 0, 0))
+        self.assertNotEqual(a2.color, (0, 0, 0))
+        self.assertIs(a2.element, element('N'))
+        # Shared record is restored after unpickling
+        a3 = pickle.loads(pickle.dumps(a2))
+        self.assertIs(a3.element, element('N'))
+        a4 = pickle.loads(pickle.dumps(a1))
+        self.assertEqual(a4.color, (0, 0, 0))
+        # Changing the symbol changes the element
+        a5 = Atom('C')
+        a5.symbol = 'N'
+        self.assertIs(a5.element, element('N'))
+        self.assertEqual(a5.number, 7)
+        self.assertAlmostEqual(a5.mw(), 14.007, 3)
+
+    def test_dumps(self):
+        atom = Atom('O')
+        atom.add_hydrogen(1)
+        atom.coords = (1, 2)
+        d = atom.dumps()
+        self.assertEqual(d["sym"], "O")
+        self.assertEqual(d["hs"], 1)
+        self.assertEqual(atom.crds, (1, 2))  # alias
+        loaded = Atom('O', json.loads(json.dumps(d)))
+        self.assertEqual(json.dumps(loaded.dumps(), sort_keys=True),
+                         json.dumps(d, sort_keys=True))
+        self.assertIs(loaded.element, element('O'))
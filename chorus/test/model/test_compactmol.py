@@ -0,0 +1,96 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+import pickle
+import unittest
+
+from chorus import v2000reader as reader
+from chorus import v2000writer as writer
+from chorus.demo import MOL
+from chorus.draw.svg import SVG
+from chorus.model.atom import Atom
+from chorus.model.bond import Bond
+from chorus.model import compactmol
+from chorus import molutil, wclogp
+
+
+def mol_lines(name):
+    return next(reader.buffer_blocks(MOL[name]))[0]
+
+
+class TestCompactMol(unittest.TestCase):
+    def test_convert(self):
+        for name in ("Phe", "Nitroprusside", "Cyanocobalamin"):
+            m = reader.molecule(mol_lines(name))
+            c = compactmol.from_compound(m)
+            self.assertEqual(c.atom_count(), m.atom_count())
+            self.assertEqual(c.bond_count(), m.bond_count())
+            self.assertEqual(c.jsonized(), m.jsonized())
+            self.assertEqual(
+                compactmol.to_compound(c).jsonized(), m.jsonized())
+            # Parse into arrays directly
+            c2 = reader.compact_molecule(mol_lines(name))
+            self.assertEqual(c2.jsonized(), m.jsonized())
+
+    def test_interface(self):
+        c = reader.compact_molecule(mol_lines("Phe"))
+        self.assertEqual(c.atom(1).symbol, "O")
+        self.assertEqual(c.atom(1).sym, "O")  # alias
+        self.assertEqual(c.atom(3).coords, (3.7934, 0.1568, 0))
+        self.assertIsNone(c.atom(3).mass)
+        self.assertEqual(c.bond(2, 9).order, 2)
+        self.assertEqual(c.bond(9, 2).order, 2)
+        self.assertEqual(sorted(c.neighbors(9)), [1, 2, 5])
+        self.assertEqual(c.neighbor_count(9), 3)
+        c.atom(1).charge = -1
+        self.assertEqual(c.atom(1).charge_sign(), "–")
+        with self.assertRaises(AttributeError):
+            c.atom(1).undefined = 1
+        with self.assertRaises(KeyError):
+            c.atom(13)
+
+    def test_descriptors(self):
+        m = reader.molecule(mol_lines("Cyanocobalamin"))
+        c = reader.compact_molecule(mol_lines("Cyanocobalamin"))
+        molutil.assign_descriptors(m)
+        molutil.assign_descriptors(c)
+        self.assertEqual(c.jsonized(), m.jsonized())
+        self.assertEqual(molutil.mw(c), molutil.mw(m))
+        self.assertEqual(wclogp.wclogp(c), wclogp.wclogp(m))
+        self.assertEqual(writer.mols_to_text([c]), writer.mols_to_text([m]))
+        self.assertEqual(SVG(c).contents(), SVG(m).contents())
+        h = molutil.make_Hs_implicit(c)
+        self.assertIsInstance(h, compactmol.CompactMol)
+        self.assertEqual(h.jsonized(), molutil.make_Hs_implicit(m).jsonized())
+
+    def test_edit(self):
+        c = reader.compact_molecule(mol_lines("Phe"))
+        a = c.atom(3)
+        c.add_atom(0, Atom("Cl"))
+        c.add_atom(100, Atom("Br"))
+        c.add_bond(0, 100, Bond())
+        self.assertEqual(a.symbol, "N")  # view follows the key
+        self.assertEqual(c.atom(100).symbol, "Br")
+        self.assertEqual(list(c.neighbors(0)), [100])
+        self.assertEqual((len(c), c.bond_count()), (14, 13))
+        c.remove_bond(0, 100)
+        c.remove_atom(9)
+        self.assertEqual(c.bond_count(), 9)
+        self.assertEqual(sorted(c.neighbors(10)), [7, 12])
+
+    def test_pickle(self):
+        c = reader.compact_molecule(mol_lines("Phe"))
+        c2 = pickle.loads(pickle.dumps(c))
+        self.assertEqual(c2.jsonized(), c.jsonized())
+
+    def test_clone(self):
+        c = reader.compact_molecule(mol_lines("Phe"))
+        c2 = molutil.clone(c)
+        self.assertEqual(c2.jsonized(), c.jsonized())
+        c2.atom(1).charge = -1
+        c2.remove_atom(12)
+        self.assertEqual(c.atom(1).charge, 0)
+        self.assertEqual(len(c), 12)
@@ -0,0 +1,59 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+import unittest
+
+from chorus.model.query import ATOM_FIELDS, BOND_FIELDS, WORD_BITS, \
+    QueryAtom, QueryBond, QueryMol, atom_features, bond_features, \
+    ring_members
+from chorus.smilessupplier import smiles_to_compound
+
+
+class TestQuery(unittest.TestCase):
+    def test_fields(self):
+        self.assertEqual(ATOM_FIELDS.words, 2)
+        self.assertEqual(BOND_FIELDS.words, 1)
+        f = ATOM_FIELDS.features(symbol="N", charge=1, H_count=7)
+        self.assertEqual(f, ATOM_FIELDS.features(
+            symbol="N", charge=1, H_count=4))  # clamped
+        low, high = ATOM_FIELDS.split(f)
+        self.assertEqual(low | high << WORD_BITS, f)
+        with self.assertRaises(KeyError):
+            ATOM_FIELDS.features(symbol="Xx")
+
+    def test_predicates(self):
+        mol = smiles_to_compound("CC(=O)[O-].c1ccccc1")
+        ring_atoms, ring_bonds = ring_members(mol)
+        self.assertEqual(len(ring_atoms), 6)
+        self.assertEqual(len(ring_bonds), 6)
+        feats = {k: atom_features(mol, k, k in ring_atoms)
+                 for k, _ in mol.atoms_iter()}
+        q = QueryAtom("O", charge=-1, degree=1)
+        self.assertEqual([k for k, f in feats.items() if not f & ~q.mask],
+                         [4])
+        q = QueryAtom(("C", "O"), aromatic=False, H_count=(0, 1))
+        self.assertEqual([k for k, f in feats.items() if not f & ~q.mask],
+                         [2, 3, 4])
+        q = QueryAtom(ring=True)
+        self.assertEqual(sum(not f & ~q.mask for f in feats.values()), 6)
+        self.assertFalse(feats[1] & ~QueryAtom().mask)  # any atom
+        double = bond_features(mol.bond(2, 3))
+        self.assertFalse(double & ~QueryBond("=").mask)
+        self.assertTrue(double & ~QueryBond(("-", ":")).mask)
+        arom = bond_features(mol.bond(5, 6), ring=True)
+        self.assertFalse(arom & ~QueryBond(":", ring=True).mask)
+        self.assertTrue(arom & ~QueryBond(ring=False).mask)
+        with self.assertRaises(KeyError):
+            QueryAtom("C", valence=4)
+
+    def test_from_compound(self):
+        mol = smiles_to_compound("c1ccccc1CN")
+        q = QueryMol.from_compound(mol)
+        self.assertEqual(len(q), len(mol))
+        self.assertEqual(q.bond_count(), mol.bond_count())
+        self.assertEqual(q.atom(1).predicates["symbol"], ("C",))
+        self.assertEqual(q.atom(1).predicates["pi"], (1,))
+        self.assertIsNone(q.atom(1).predicates["aromatic"])
@@ -0,0 +1,88 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from chorus.demo import MOL
+import chorus.v2000index as index
+import chorus.v2000reader as reader
+
+
+class TestV2000Index(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "test.sdf")
+        names = ["Phe", "KCl", "Indinavir", "Arg"]
+        with open(self.path, "w") as f:
+            f.write("".join(
+                MOL[n].split("$$$$")[0].rstrip("\n") + "\n$$$$\n"
+                for n in names))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_build(self):
+        idx = index.build(self.path)
+        self.assertEqual(len(idx), 4)
+        labels, count = reader.inspect_file(self.path)
+        self.assertEqual(sorted(idx.labels), sorted(labels))
+        self.assertEqual(count, 4)
+        self.assertIn("GENERIC_NAME", idx.record_labels(1))
+        with self.assertRaises(IndexError):
+            idx.span(4)
+
+    def test_sidecar(self):
+        self.assertIsNone(index.load(self.path))
+        labels, count = index.inspect_file(self.path)
+        self.assertEqual(count, 4)
+        self.assertTrue(os.path.isfile(self.path + index.INDEX_SUFFIX))
+        idx = index.load(self.path)
+        self.assertEqual(list(idx.offsets),
+                         list(index.build(self.path).offsets))
+        # Outdated index
+        with open(self.path, "a") as f:
+            f.write(MOL["Phe"].rstrip("\n") + "\n$$$$\n")
+        self.assertIsNone(index.load(self.path))
+        self.assertEqual(len(index.index_file(self.path)), 5)
+        # Broken index is rebuilt
+        ipath = self.path + index.INDEX_SUFFIX
+        with open(ipath, "r+b") as f:
+            f.truncate(os.path.getsize(ipath) // 2)
+        self.assertIsNone(index.load(self.path))
+        self.assertEqual(len(index.index_file(self.path)), 5)
+        self.assertIsNotNone(index.load(self.path))
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)),
+                         ["test.sdf", "test.sdf" + index.INDEX_SUFFIX])
+        # Index directory
+        d = os.path.join(self.tmpdir.name, "index")
+        os.mkdir(d)
+        self.assertEqual(index.inspect_file(self.path, d)[1], 5)
+        self.assertTrue(os.path.isfile(
+            os.path.join(d, "test.sdf" + index.INDEX_SUFFIX)))
+        os.remove(self.path + index.INDEX_SUFFIX)
+        mol = index.mol_at(self.path, 2, index_dir=d)
+        self.assertEqual(mol.data["GENERIC_NAME"], "Indinavir")
+        self.assertFalse(os.path.exists(self.path + index.INDEX_SUFFIX))
+        # The index is not saved if the directory is not writable
+        d = os.path.join(self.tmpdir.name, "missing")
+        self.assertEqual(len(index.index_file(self.path, index_dir=d)), 5)
+        self.assertFalse(os.path.exists(d))
+
+    def test_mol_at(self):
+        mol = index.mol_at(self.path, 2)
+        self.assertEqual(mol.data["GENERIC_NAME"], "Indinavir")
+        mol = index.mol_at(self.path, np.int64(2))
+        self.assertEqual(mol.data["GENERIC_NAME"], "Indinavir")
+        mol = index.mol_at(self.path, -1)
+        self.assertEqual(mol.data["GENERIC_NAME"], "L-Arginine")
+        mols = list(index.mols_at(self.path, slice(1, 4, 2)))
+        self.assertEqual([len(m) for m in mols], [2, 12])
+        with self.assertRaises(IndexError):
+            index.mol_at(self.path, 4)
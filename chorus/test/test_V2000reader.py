@@ -5,6 +5,7 @@
 #
 
 import os
+import tempfile
 import unittest
 
 from chorus.demo import MOL
@@ -75,3 +76,93 @@ class TestV2000Reader(unittest.TestCase):
         self.assertTrue(len(mol.descriptors))  # descriptors assigned
         self.assertEqual(mol.atom_count(), 0)
         self.assertEqual(mol.data['GENERIC_NAME'], 'Colesevelam')
+
+    @debug.mute  # Unsupported symbol: A (#3 in v2000reader)
+    def test_parallel(self):
+        names = ["Phe", "KCl", "Colesevelam", "Indinavir", "null", "Arg"]
+        text = "".join(MOL[n].rstrip("\n") + "\n$$$$\n" for n in names)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "test.sdf")
+            with open(path, "w") as f:
+                f.write(text)
+            chunks = list(reader.sdf_chunks(path, 4))
+            self.assertEqual([c[2] for c in chunks], [0, 4])
+            serial = list(reader.mols_from_file(path))
+            para = list(reader.mols_from_file_parallel(
+                path, processes=2, chunk_size=2))
+            self.assertEqual([len(m) for m in para], [len(m) for m in serial])
+            self.assertEqual(para[2].data["GENERIC_NAME"], "Colesevelam")
+            unordered = reader.mols_from_file_parallel(
+                path, processes=2, chunk_size=1, ordered=False)
+            self.assertEqual(sorted(len(m) for m in unordered),
+                             sorted(len(m) for m in serial))
+            with self.assertRaises(ValueError):
+                list(reader.mols_from_file_parallel(
+                    path, no_halt=False, processes=2, chunk_size=2))
+
+    def test_record_spans(self):
+        text = MOL["KCl"] + "$$$$\n" + MOL["Arg"]
+        spans = list(reader.record_spans(text))
+        self.assertEqual(len(spans), 2)
+        start, mol_end, data_start, data_end, end = spans[0]
+        self.assertTrue(text[mol_end:].startswith("M  END"))
+        self.assertTrue(text[data_end:end].startswith("$$$$"))
+        self.assertEqual(spans[1][4], len(text))
+        self.assertEqual(spans, list(reader.record_spans(text.encode())))
+
+    def test_arrays(self):
+        lines = reader.split_lines(MOL["Phe"].split("$$$$")[0])
+        arrs = reader.molecule_arrays(lines)
+        atoms = arrs["atoms"]
+        self.assertEqual(len(atoms["coords"]), 12)
+        self.assertEqual(atoms["symbols"], ["O", "N", "C"])
+        self.assertEqual(atoms["coords"][0].tolist(), [3.7934, 1.8067, 0])
+        self.assertEqual(arrs["bonds"]["atoms"][0].tolist(), [1, 9])
+        # joined fields (atom index >= 100)
+        bonds = reader.bond_arrays(["100101  2  6", "  1102  1  1"])
+        self.assertEqual(bonds["atoms"].tolist(), [[100, 101], [1, 102]])
+        self.assertEqual(bonds["order"].tolist(), [2, 1])
+        self.assertEqual(bonds["type"].tolist(), [2, 1])
+        with self.assertRaises(KeyError):
+            reader.bond_arrays(["  1  2  1  2"])
+
+    def test_encoding(self):
+        text = MOL["Arg"].replace("L-Arginine\n", "L-Arginine é\n")
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "test.sdf")
+            with open(path, "wb") as f:
+                f.write(text.encode("cp1252"))
+            mol = reader.mol_from_file(path)
+            self.assertEqual(mol.data["GENERIC_NAME"], "L-Arginine é")
+            # Each record is decoded by its own codec
+            record = text + "\n$$$$\n"
+            with open(path, "wb") as f:
+                f.write(record.encode("utf-8"))
+                f.write(record.encode("cp1252"))
+                f.write(record.encode("cp1252").replace(b"\xe9", b"\x81"))
+            names = [m.data["GENERIC_NAME"]
+                     for m in reader.mols_from_file(path)]
+            self.assertEqual(names, ["L-Arginine é", "L-Arginine é",
+                                     "L-Arginine \ufffd"])
+            self.assertEqual(
+                [r.data["GENERIC_NAME"]
+                 for r in reader.records_from_file(path)], names)
+
+    @debug.mute  # Unsupported symbol: A (#2 in v2000reader)
+    def test_lazy_record(self):
+        text = "".join(MOL[n].split("$$$$")[0].rstrip("\n") + "\n$$$$\n"
+                       for n in ("Phe", "Colesevelam", "KCl"))
+        records = list(reader.records_from_text(text))
+        self.assertEqual([r.data["GENERIC_NAME"] for r in records],
+                         ["L-Phenylalanine", "Colesevelam",
+                          "Potassium Chloride"])
+        self.assertIsNone(records[0]._compound)  # not built yet
+        self.assertEqual(records[0].compound.atom_count(), 12)
+        self.assertIs(records[0].compound, records[0].compound)
+        self.assertEqual(records[0].compound.data["GENERIC_NAME"],
+                         "L-Phenylalanine")
+        self.assertEqual(records[1].compound.atom_count(), 0)  # no_halt
+        records = list(reader.records_from_text(text.encode(), False))
+        self.assertEqual(records[2].compound.atom_count(), 2)
+        with self.assertRaises(ValueError):
+            records[1].compound
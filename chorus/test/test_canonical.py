@@ -0,0 +1,137 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+import copy
+import itertools
+import random
+import unittest
+
+from chorus.demo import MOL
+from chorus.model.atom import Atom
+from chorus.model.bond import Bond
+from chorus import canonical
+from chorus import molutil
+from chorus.model.graphmol import Compound
+from chorus import v2000reader as reader
+from chorus.smilessupplier import smiles_to_compound
+from chorus.substructure import equal
+
+
+def renumbered(mol, seed):
+    """Same structure with shuffled atom indices and insertion order"""
+    rnd = random.Random(seed)
+    keys = list(mol.graph.nodes)
+    new_keys = dict(zip(keys, rnd.sample(keys, len(keys))))
+    res = Compound()
+    atoms = list(mol.atoms_iter())
+    rnd.shuffle(atoms)
+    for k, a in atoms:
+        res.add_atom(new_keys[k], copy.copy(a))
+    bonds = list(mol.bonds_iter())
+    rnd.shuffle(bonds)
+    for u, v, b in bonds:
+        res.add_bond(new_keys[v], new_keys[u], copy.copy(b))
+    molutil.assign_descriptors(res)
+    return res
+
+
+class TestCanonical(unittest.TestCase):
+    def test_hash(self):
+        for smiles in (("CCO", "OCC", "C(C)O"),
+                       ("c1ccccc1C(=O)O", "OC(=O)c1ccccc1"),
+                       ("CC(C)CCN", "NCCC(C)C", "C(CN)C(C)C")):
+            hashes = {canonical.canonical_hash(smiles_to_compound(s))
+                      for s in smiles}
+            self.assertEqual(len(hashes), 1)
+        # Options
+        for s1, s2 in (("CC(=O)[O-]", "CC(=O)O"),
+                       ("C1=CC=CC=C1", "c1ccccc1")):
+            m1 = smiles_to_compound(s1)
+            m2 = smiles_to_compound(s2)
+            self.assertNotEqual(canonical.canonical_hash(m1),
+                                canonical.canonical_hash(m2))
+            self.assertEqual(
+                canonical.canonical_hash(m1, charge=False, bond_order=False),
+                canonical.canonical_hash(m2, charge=False, bond_order=False))
+        m1 = smiles_to_compound("CCO.[Na+]")
+        m2 = smiles_to_compound("CCO")
+        self.assertEqual(canonical.canonical_hash(m1),
+                         canonical.canonical_hash(m2))
+        self.assertNotEqual(canonical.canonical_hash(m1, largest_only=False),
+                            canonical.canonical_hash(m2, largest_only=False))
+
+    def test_renumbered(self):
+        for name in ("Phe", "Carbidopa", "AmphotericinB",
+                     "Buckminsterfullerene"):
+            mol = reader.mol_from_text(MOL[name])
+            label = canonical.canonical_label(mol)
+            for seed in range(3):
+                other = renumbered(mol, seed)
+                res = canonical.canonical_label(other)
+                self.assertEqual(res.hash, label.hash)
+                self.assertEqual(res.invariant, label.invariant)
+                self.assertTrue(equal(mol, other))
+                # Atom mapping by canonical ranks is an isomorphism
+                mapping = label.mapping(res)
+                self.assertEqual(len(mapping), len(label.keys))
+                for u, v, b in mol.bonds_iter():
+                    if u in mapping and v in mapping:
+                        self.assertEqual(
+                            other.bond(mapping[u], mapping[v]).order, b.order)
+
+    def test_regular(self):
+        # Cubane: all atoms are symmetric
+        mol = smiles_to_compound("C12C3C4C1C5C2C3C45")
+        hashes = {canonical.canonical_hash(renumbered(mol, seed))
+                  for seed in range(5)}
+        self.assertEqual(len(hashes), 1)
+        # Chang graph (T(8) switched by an 8-cycle): 12-regular and not
+        # vertex-transitive, so tied atoms of the same refinement results
+        # are not always symmetric
+        cycle = {frozenset((i, (i + 1) % 8)) for i in range(8)}
+        pairs = [frozenset(p) for p in itertools.combinations(range(8), 2)]
+        hashes = set()
+        for seed in range(5):
+            rnd = random.Random(seed)
+            keys = dict(zip(pairs, rnd.sample(range(28), 28)))
+            mol = Compound()
+            for p in rnd.sample(pairs, 28):
+                mol.add_atom(keys[p], Atom("C"))
+            for p, q in itertools.combinations(pairs, 2):
+                if bool(p & q) != ((p in cycle) != (q in cycle)):
+                    mol.add_bond(keys[p], keys[q], Bond())
+            label = canonical.CanonicalLabel(mol)
+            self.assertFalse(label.discrete)
+            hashes.add(label.hash)
+        self.assertEqual(len(hashes), 1)
+
+    def test_label(self):
+        mol = smiles_to_compound("c1ccccc1CC(N)C(=O)O")
+        label = canonical.CanonicalLabel(mol)
+        self.assertEqual(sorted(label.ranks.values()), list(range(len(mol))))
+        self.assertEqual([label.ranks[k] for k in label.keys],
+                         list(range(len(mol))))
+        self.assertFalse(label.discrete)  # symmetric benzene carbons
+        # Same refinement, different structure
+        m1 = canonical.CanonicalLabel(smiles_to_compound("C1CCC2CCCCC2C1"))
+        m2 = canonical.CanonicalLabel(smiles_to_compound("C1CCC(C1)C1CCCC1"))
+        self.assertEqual(m1.invariant, m2.invariant)
+        self.assertNotEqual(m1.hash, m2.hash)
+        self.assertIsNone(m1.mapping(m2))
+        # Null molecule
+        label = canonical.CanonicalLabel(molutil.null_molecule())
+        self.assertEqual(label.keys, [])
+
+    def test_deduplicate(self):
+        smiles = ["CCO", "c1ccccc1", "OCC", "CC(=O)O", "C1=CC=CC=C1",
+                  "c1ccccc1", "OC(C)=O"]
+        mols = [smiles_to_compound(s) for s in smiles]
+        groups = canonical.deduplicate(mols)
+        self.assertEqual(list(groups.values()),
+                         [[0, 2], [1, 5], [3, 6], [4]])
+        for g in canonical.deduplicate(mols, bond_order=False).values():
+            for i in g:
+                self.assertTrue(equal(mols[g[0]], mols[i]))
@@ -4,9 +4,12 @@
 # http://opensource.org/licenses/MIT
 #
 
+import threading
+import time
 import unittest
 
 import networkx as nx
+import numpy as np
 
 from chorus.demo import MOL
 from chorus import v2000reader as reader
@@ -25,6 +28,26 @@ class TestMCS(unittest.TestCase):
         self.assertEqual(mcsdr.reachables(g, 1, 2),
                          {1: 0, 2: 1, 3: 1, 4: 1, 5: 2, 8: 2, 9: 2})
 
+    def test_descriptor_array(self):
+        # Bond distances are equivalent to BFS on the line graph
+        mol = reader.mol_from_text(MOL["AmphotericinB"])
+        for diam in (3, 8):
+            arr = mcsdr.DescriptorArray(mol, diameter=diam)
+            node = {b: i for i, b in arr.int_to_node.items()}
+            lg = nx.line_graph(arr.mol.graph)
+            expected = set()
+            for u in lg.nodes:
+                for v, d in mcsdr.reachables(lg, u, diam).items():
+                    if d:
+                        ui = node.get(u, node.get(u[::-1]))
+                        vi = node.get(v, node.get(v[::-1]))
+                        expected.add((ui, vi, d))
+            dist = {(u, v): c >> 36 for u, v, c in arr.array.tolist()}
+            self.assertEqual({(u, v, d) for (u, v), d in dist.items()},
+                             expected)
+        self.assertEqual(arr.max_size, 26)
+        self.assertTrue(arr.valid)
+
     def test_mcsdr1(self):
         # TODO: pi mismatch is not acceptable
         mol1 = reader.mol_from_text(MOL["Phe"])
@@ -38,6 +61,14 @@ class TestMCS(unittest.TestCase):
         arr1 = mcsdr.DescriptorArray(mol1)
         arr2 = mcsdr.DescriptorArray(mol2)
         self.assertEqual(mcsdr.from_array(arr1, arr2).edge_count(), 7)
+        res = mcsdr.from_array(arr1, arr2)
+        common = res.common_struct(arr1.mol)
+        self.assertEqual(common.bond_count(), 7)
+        self.assertEqual({frozenset(b) for b, _ in res.mapping()},
+                         {frozenset(b) for b in common.graph.edges})
+        for b1, b2 in res.mapping():
+            self.assertEqual(arr1.mol.bond(*b1).order,
+                             arr2.mol.bond(*b2).order)
 
     def test_mcsdr2(self):
         # Disconnected
@@ -71,10 +102,149 @@ class TestMCS(unittest.TestCase):
         arr2 = mcsdr.DescriptorArray(mol2)
         # self.assertEqual(mcsdr.from_array(arr1, arr2).edge_count(), 0)
 
+    def test_comparison_graph(self):
+        arr1 = mcsdr.DescriptorArray(reader.mol_from_text(MOL["Phe"]))
+        arr2 = mcsdr.DescriptorArray(reader.mol_from_text(MOL["Arg"]))
+        expected = set()
+        for u1, v1, c1 in arr1.array:
+            for u2, v2, c2 in arr2.array:
+                if c1 == c2:
+                    expected.add(frozenset(((u1, u2), (v1, v2))))
+        res = mcsdr.comparison_graph(arr1.array, arr2.array, timeout=5)
+        dec = res["decoder"]
+        edges = {frozenset((dec[u], dec[v])) for u, v in res["edges"]}
+        self.assertEqual(edges, expected)
+        self.assertEqual(len(dec), len(set().union(*expected)))
+        self.assertFalse(res["timeout"])
+        res = mcsdr.comparison_graph(arr1.array, arr2.array, timeout=0)
+        self.assertTrue(res["timeout"])
+
+    def test_screening(self):
+        mols = [smiles_to_compound(s) for s in (
+            "C1OC1CCC(=O)O", "CC(O)CCC(=O)O", "c1ccccc1CCC(=O)O",
+            "CCCCCCCC(=O)O", "C1CCCC1CCCC(=O)O", "CCN(CC)CCOC(=O)C")]
+        mols.append(reader.mol_from_text(MOL["Phe"]))
+        mols.append(reader.mol_from_text(MOL["Arg"]))
+        arrs = [mcsdr.DescriptorArray(m) for m in mols]
+        scr = mcsdr.Screening()
+        pairs = 0
+        for i, arr1 in enumerate(arrs):
+            for arr2 in arrs[i + 1:]:
+                res = mcsdr.McsdrGls(arr1, arr2)
+                bounds = dict(scr.bounds(arr1, arr2))
+                self.assertEqual(list(bounds), list(scr.STAGES))
+                # upper bounds never reject true results
+                self.assertGreaterEqual(min(bounds.values()),
+                                        res.edge_count())
+                self.assertEqual(scr.upper_bound(arr1, arr2),
+                                 min(bounds.values()))
+                sim = res.edge_count() / (
+                    arr1.max_size + arr2.max_size - res.edge_count())
+                passed = scr.passes(arr1, arr2, gls_cutoff=0.5)
+                if sim >= 0.5:
+                    self.assertTrue(passed)
+                if not passed:
+                    gls = mcsdr.from_array(arr1, arr2, gls_cutoff=0.5)
+                    self.assertIsNone(gls.mod_product_time)
+                pairs += 1
+        self.assertEqual(sum(scr.eliminated.values()) + scr.passed, pairs)
+        self.assertGreater(scr.eliminated["bond_type"], 0)
+        self.assertGreater(scr.eliminated["descriptor"], 0)
+        total = mcsdr.Screening()
+        total.update(scr)
+        total.update(scr)
+        self.assertEqual(total.passed, scr.passed * 2)
+        # No line graph
+        arr = mcsdr.DescriptorArray(smiles_to_compound("CC"))
+        self.assertEqual(scr.upper_bound(arr, arrs[0]), 0)
+        self.assertFalse(scr.passes(arr, arrs[0]))
+
+    def test_find_cliques(self):
+        for seed in range(20):
+            g = nx.gnp_random_graph(30, 0.1 + seed * 0.04, seed=seed)
+            keys = {n: n * 2 + 1 for n in g}
+            edges = [(keys[u], keys[v]) for u, v in g.edges]
+            res = mcsdr.find_cliques(keys.values(), edges, timeout=5)
+            clique = [(k - 1) // 2 for k in res["max_clique"]]
+            self.assertEqual(len(clique), nx.graph_clique_number(g))
+            sub = g.subgraph(clique)
+            self.assertEqual(sub.number_of_edges(),
+                             len(clique) * (len(clique) - 1) // 2)
+            self.assertFalse(res["timeout"])
+        self.assertEqual(mcsdr.find_cliques([], [], 1)["max_clique"], [])
+        self.assertEqual(mcsdr.find_cliques([3], [], 1)["max_clique"], [3])
+
+    def test_dumps(self):
+        mol1 = reader.mol_from_text(MOL["Phe"])
+        mol2 = reader.mol_from_text(MOL["Arg"])
+        arr1 = mcsdr.DescriptorArray(mol1, diameter=6)
+        arr2 = mcsdr.DescriptorArray(mol2, diameter=6)
+        data = arr1.dumps()
+        res = mcsdr.DescriptorArray.loads(data)
+        self.assertEqual(res.array.tolist(), arr1.array.tolist())
+        self.assertEqual(res.int_to_node, arr1.int_to_node)
+        self.assertEqual((res.diam, res.ignoreh, res.valid, res.max_size),
+                         (6, True, True, arr1.max_size))
+        self.assertEqual(res.elapsed_time, arr1.elapsed_time)
+        self.assertEqual(mcsdr.from_array(res, arr2).edge_count(),
+                         mcsdr.from_array(arr1, arr2).edge_count())
+        self.assertEqual(res.dumps(), data)
+        # No line graph
+        arr = mcsdr.DescriptorArray(smiles_to_compound("CC"))
+        res = mcsdr.DescriptorArray.loads(arr.dumps())
+        self.assertEqual(len(res.array), 0)
+        self.assertEqual(mcsdr.from_array(res, arr1).edge_count(), 0)
+        with self.assertRaises(ValueError):
+            mcsdr.DescriptorArray.loads(data[:-1])
+        with self.assertRaises(ValueError):
+            mcsdr.DescriptorArray.loads(b"")
+
     def test_timeout(self):
         mol = reader.mol_from_text(MOL["Buckminsterfullerene"])
-        tout = mcsdr.DescriptorArray(mol, timeout=0.1)
-        self.assertFalse(tout.valid)
+        arr = mcsdr.DescriptorArray(mol, timeout=0.1)
+        self.assertTrue(arr.valid)
+        self.assertEqual(arr.max_size, 45)
         arr = mcsdr.DescriptorArray(mol, diameter=5, timeout=0.1)
         sim = mcsdr.from_array(arr, arr, timeout=0.1)
+        self.assertFalse(sim.valid)
         self.assertGreater(sim.local_sim(), 0)
+
+    def test_deadline(self):
+        d = mcsdr.Deadline()
+        self.assertEqual(d.remaining(), float("inf"))
+        self.assertFalse(d.expired())
+        child = d.child(0)
+        self.assertTrue(child.expired())
+        self.assertFalse(d.expired())
+        child.cancel()
+        self.assertTrue(d.cancelled)
+        self.assertEqual(d.remaining(), 0)
+        # Stage times
+        mol1 = reader.mol_from_text(MOL["Phe"])
+        mol2 = reader.mol_from_text(MOL["Arg"])
+        res = mcsdr.from_mol(mol1, mol2)
+        self.assertEqual(res.edge_count(), 5)
+        self.assertEqual(set(res.timings), {
+            "preprocess", "line_graph", "max_fragment", "mod_product",
+            "max_clique"})
+        # Cancel from another thread
+        mol = reader.mol_from_text(MOL["Buckminsterfullerene"])
+        arr = mcsdr.DescriptorArray(mol, diameter=5)
+        d = mcsdr.Deadline()
+        timer = threading.Timer(0.2, d.cancel)
+        timer.start()
+        start = time.monotonic()
+        res = mcsdr.from_array(arr, arr, deadline=d)
+        timer.join()
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertTrue(d.cancelled)
+        self.assertFalse(res.valid)
+        # Array stages are not started after the deadline
+        d = mcsdr.Deadline()
+        d.cancel()
+        arr = mcsdr.DescriptorArray(mol1, deadline=d)
+        self.assertFalse(arr.valid)
+        self.assertEqual(len(arr.array), 0)
+        self.assertEqual(set(d.timings), {"preprocess"})
+        bonds = np.array([(u, v) for u, v, _ in mol1.bonds_iter()])
+        self.assertIsNone(arr.bond_distances(bonds, d))
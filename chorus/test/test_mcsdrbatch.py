@@ -0,0 +1,182 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from chorus.demo import MOL
+from chorus import v2000reader as reader
+from chorus.smilessupplier import smiles_to_compound
+from chorus import mcsdr
+from chorus import mcsdrbatch
+
+
+SMILES = ["C1OC1CCC(=O)O", "CC(O)CCC(=O)O", "CC", "c1ccccc1CCC(=O)O",
+          "CCCCCCCC(=O)O"]
+
+
+def library():
+    mols = [smiles_to_compound(s) for s in SMILES]
+    mols.append(reader.mol_from_text(MOL["Phe"]))
+    mols.append(reader.mol_from_text(MOL["Arg"]))
+    return mols
+
+
+class TestMcsdrBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.arrays = mcsdrbatch.descriptor_arrays(library(), processes=1)
+
+    def test_descriptor_arrays(self):
+        arrs = mcsdrbatch.descriptor_arrays(library(), processes=2,
+                                            chunk_size=3)
+        self.assertEqual([a.max_size for a in arrs],
+                         [a.max_size for a in self.arrays])
+        self.assertEqual(arrs[-1].array.tolist(),
+                         self.arrays[-1].array.tolist())
+        self.assertFalse(hasattr(arrs[-1], "mol"))  # not pickled
+        state = pickle.loads(pickle.dumps(self.arrays[0]))
+        self.assertEqual(state.int_to_node, self.arrays[0].int_to_node)
+
+    def test_candidates(self):
+        sizes = np.array([a.max_size for a in self.arrays])
+        n = len(sizes)
+        for gls, edge in [(None, None), (0.5, None), (None, 6), (0.7, 4)]:
+            for i in range(n):
+                js = mcsdrbatch.candidates(sizes, i, range(i + 1, n),
+                                           gls, edge)
+                # pairs passing the max_size stage of the screening
+                expected = []
+                for j in range(i + 1, n):
+                    scr = mcsdr.Screening()
+                    scr.passes(self.arrays[i], self.arrays[j], gls, edge)
+                    if not scr.eliminated["max_size"]:
+                        expected.append(j)
+                self.assertEqual(js.tolist(), expected)
+
+    def test_matrix(self):
+        n = len(self.arrays)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "gls.mtx")
+            stats = mcsdrbatch.similarity_matrix(
+                self.arrays, path, gls_cutoff=0.5, processes=2, chunk_size=2)
+            size, rows, cols, values = mcsdrbatch.read_matrix(path)
+            with open(path) as f:
+                self.assertTrue(f.readline().startswith("%%MatrixMarket"))
+        self.assertEqual(size, n)
+        self.assertEqual(stats["compared"] + stats["filtered"],
+                         n * (n - 1) // 2)
+        self.assertEqual(sum(stats["eliminated"].values()), stats["filtered"])
+        expected = mcsdr.Screening()
+        for i in range(n):
+            for j in range(i + 1, n):
+                expected.passes(self.arrays[i], self.arrays[j], 0.5)
+        self.assertEqual(stats["eliminated"], expected.eliminated)
+        self.assertGreater(stats["eliminated"]["bond_type"]
+                           + stats["eliminated"]["descriptor"], 0)
+        self.assertEqual(stats["entries"], len(values))
+        self.assertTrue(np.all(rows >= cols))
+        result = {(r, c): v for r, c, v in zip(rows, cols, values)}
+        self.assertNotIn((2, 2), result)  # ethane has no array edges
+        for i in range(n):
+            for j in range(i + 1, n):
+                sim = mcsdr.from_array(self.arrays[i], self.arrays[j],
+                                       gls_cutoff=0.5).local_sim()
+                self.assertEqual(result.get((j, i), 0), sim)
+        # Thread pool
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "gls.mtx")
+            mcsdrbatch.similarity_matrix(
+                self.arrays, path, gls_cutoff=0.5, processes=3, chunk_size=1,
+                threads=True)
+            _, rows, cols, values = mcsdrbatch.read_matrix(path)
+        self.assertEqual({(r, c): v for r, c, v in zip(rows, cols, values)},
+                         result)
+        # Serial calculation and sim_cutoff
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "gls.mtx")
+            mcsdrbatch.similarity_matrix(
+                self.arrays, path, sim_cutoff=0.6, processes=1)
+            _, rows, cols, values = mcsdrbatch.read_matrix(path)
+        self.assertTrue(np.all(values >= 0.6))
+        self.assertEqual(len(values),
+                         len([v for v in result.values() if v >= 0.6]))
+
+    def test_nearest(self):
+        query = self.arrays[0]
+        res = mcsdrbatch.nearest(query, self.arrays, k=3, processes=1)
+        self.assertEqual(len(res), 3)
+        self.assertEqual(res[0][:2], (0, 1))
+        sims = [mcsdr.from_array(query, a).local_sim() for a in self.arrays]
+        self.assertEqual([r[1] for r in res], sorted(sims, reverse=True)[:3])
+        para = mcsdrbatch.nearest(query, self.arrays, k=3, processes=2,
+                                  chunk_size=1)
+        self.assertEqual(para, res)
+        para = mcsdrbatch.nearest(query, self.arrays, k=3, processes=2,
+                                  chunk_size=1, threads=True)
+        self.assertEqual(para, res)
+        self.assertEqual(mcsdrbatch.nearest(query, self.arrays, k=0), [])
+        # Pruned by the dynamic cutoff without changing results
+        for q, query in enumerate(self.arrays):
+            sims = [(mcsdr.from_array(query, a).local_sim(), -j)
+                    for j, a in enumerate(self.arrays)]
+            expected = [(-j, s) for s, j in sorted(sims, reverse=True) if s]
+            for k in range(1, len(self.arrays) + 1):
+                res = mcsdrbatch.nearest(query, self.arrays, k=k,
+                                         processes=1, chunk_size=1)
+                self.assertEqual([r[:2] for r in res], expected[:k])
+        # Common structure mappings of the results
+        res = mcsdrbatch.nearest(self.arrays[0], self.arrays, k=2,
+                                 processes=1, mapping=True)
+        for j, _, ecnt, _, mapping in res:
+            self.assertEqual(len(mapping), ecnt)
+            self.assertTrue(set(b for b, _ in mapping)
+                            <= set(self.arrays[0].int_to_node.values()))
+            self.assertTrue(set(b for _, b in mapping)
+                            <= set(self.arrays[j].int_to_node.values()))
+        self.assertEqual([r[:4] for r in res], mcsdrbatch.nearest(
+            self.arrays[0], self.arrays, k=2, processes=1))
+        # Mappings of the compared pairs
+        results, _ = mcsdrbatch.compare_arrays(
+            self.arrays, (0, [1, 2], 10, None, None, True))
+        for _, j, _, ecnt, _, mapping in results:
+            gls = mcsdr.from_array(self.arrays[0], self.arrays[j])
+            self.assertEqual(len(mapping), ecnt)
+            self.assertEqual(len(mapping), gls.edge_count())
+
+    def test_store(self):
+        items = [("M{}".format(i), m) for i, m in enumerate(library())]
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "arrays.db")
+            with mcsdrbatch.DescriptorArrayStore(path) as store:
+                arrs = mcsdrbatch.library_arrays(store, items[:4], timeout=0,
+                                                 processes=1)
+                self.assertFalse(any(a.valid for a in arrs))
+                self.assertEqual(len(store), 4)
+                # Timed out arrays are calculated again with a larger timeout
+                arrs = mcsdrbatch.library_arrays(store, items[:4],
+                                                 processes=1)
+                self.assertEqual([a.valid for a in arrs],
+                                 [a.valid for a in self.arrays[:4]])
+                self.assertTrue(store.get("M0").valid)
+                self.assertIn(("M3", 8, True), store)
+                self.assertNotIn(("M3", 6, True), store)
+                self.assertIsNone(store.get("M3", diameter=6))
+            with mcsdrbatch.DescriptorArrayStore(path) as store:
+                cached = mcsdrbatch.library_arrays(store, items, processes=1)
+                self.assertEqual(len(store), len(items))
+                self.assertEqual([a.max_size for a in cached],
+                                 [a.max_size for a in self.arrays])
+                self.assertEqual(cached[1].array.tolist(),
+                                 arrs[1].array.tolist())
+                store.put("M0", self.arrays[1])
+                self.assertEqual(store.get("M0").int_to_node,
+                                 self.arrays[1].int_to_node)
+                self.assertEqual(len(store), len(items))
@@ -19,6 +19,21 @@ class TestMolUtil(unittest.TestCase):
         m = reader.mol_from_text(MOL["Indinavir"])
         cp = molutil.clone(m)
         self.assertEqual(len(m), len(cp))
+        self.assertEqual(cp.descriptors, m.descriptors)
+        self.assertEqual(cp.jsonized()["atoms"], m.jsonized()["atoms"])
+        self.assertEqual(list(cp.bonds_iter())[0][:2],
+                         list(m.bonds_iter())[0][:2])
+        # Modification does not affect the original
+        cp.atom(1).charge = 1
+        cp.bond(1, 15).order = 2
+        cp.rings[0].append(0)
+        cp.remove_atom(2)
+        self.assertEqual(m.atom(1).charge, 0)
+        self.assertEqual(m.bond(1, 15).order, 1)
+        self.assertNotEqual(cp.rings[0], m.rings[0])
+        self.assertEqual(len(m), len(cp) + 1)
+        # Adjacency dict is shared by both ends of the bond
+        self.assertIs(cp.graph[3][19], cp.graph[19][3])
         # deepcopy takes 0.013 ms
         # m = reader.mol_from_text(MOL["Indinavir"])
         # cp = copy.deepcopy(m)
@@ -59,6 +74,47 @@ class TestMolUtil(unittest.TestCase):
         self.assertEqual(newmol.atom_count(), 4)
         self.assertEqual(molutil.mw(newmol), 58.08)
 
+    def test_make_Hs_implicit_descriptors(self):
+        mol = smiles_to_compound("[H]OC([H])([H])C([H])([H])[H].[H]O[H]")
+        rot = [b.rotatable for _, _, b in mol.bonds_iter()]
+        self.assertEqual(rot.count(True), 2)  # C-C, C-O
+        newmol = molutil.make_Hs_implicit(mol)
+        self.assertTrue(set(molutil.BASIC_DESCRIPTORS) <= newmol.descriptors)
+        self.assertEqual(
+            [b.rotatable for _, _, b in newmol.bonds_iter()], [0, 0])
+        self.assertEqual([len(c) for c in newmol.isolated], [1])
+        self.assertEqual(newmol.atom(2).H_count, 1)
+        # Dependents of the modified descriptors are invalidated
+        molutil.update_descriptors(mol, ["Phys_charge"])
+        mol.descriptors.add("Unknown")
+        newmol = molutil.make_Hs_implicit(mol)
+        self.assertEqual(newmol.descriptors, set(molutil.BASIC_DESCRIPTORS))
+
+    def test_update_descriptors(self):
+        self.assertEqual(
+            molutil.descriptor_order(["Aromatic"]),
+            ["Valence", "Topology", "MinifiedRing", "Aromatic"])
+        mol = smiles_to_compound("c1ccccc1CC", False)
+        molutil.update_descriptors(mol, ["Rotatable"])
+        self.assertEqual(mol.descriptors, {"Valence", "Topology", "Rotatable"})
+        molutil.update_descriptors(mol)
+        self.assertEqual(mol.descriptors, set(molutil.BASIC_DESCRIPTORS))
+        molutil.invalidate_descriptors(mol, ["Valence"])
+        self.assertEqual(mol.descriptors, {"Topology", "MinifiedRing"})
+        mol.rings = None  # Assigned descriptor is not recalculated
+        molutil.update_descriptors(mol, ["Valence"])
+        self.assertIsNone(mol.rings)
+        with self.assertRaises(KeyError):
+            molutil.update_descriptors(mol, ["Undefined"])
+
+    def test_largest_graph(self):
+        mol = smiles_to_compound("C1CC1.c1ccccc1CC(=O)[O-].[Na+]")
+        newmol = molutil.largest_graph(mol)
+        self.assertEqual(newmol.isolated, [])
+        self.assertEqual([len(r) for r in newmol.rings], [6])
+        self.assertEqual(newmol.scaffolds, [[0]])
+        self.assertEqual(len(newmol), 10)
+
     def test_non_hydrogen_count(self):
         mol = smiles_to_compound("C(H)(H)(H)C(H)(H)C(=O)H", False)
         self.assertEqual(molutil.non_hydrogen_count(mol), 4)
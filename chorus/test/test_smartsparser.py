@@ -0,0 +1,71 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+import unittest
+
+from chorus.smartsparser import smarts_to_query
+from chorus.smilessupplier import smiles_to_compound
+from chorus.substructure import substructure
+
+
+def match(smarts, smiles):
+    return substructure(smarts_to_query(smarts), smiles_to_compound(smiles))
+
+
+class TestSmartsParser(unittest.TestCase):
+    def test_parse(self):
+        q = smarts_to_query("C(=O)[OH]")
+        self.assertEqual(len(q), 3)
+        self.assertEqual(q.bond_count(), 2)
+        self.assertEqual(q.atom(3).predicates["symbol"], ("O",))
+        self.assertEqual(q.atom(3).predicates["H_count"], (1,))
+        self.assertEqual(q.bond(1, 2).predicates["symbol"], ("=",))
+        self.assertEqual(q.bond(1, 3).predicates["symbol"], ("-", ":"))
+        q = smarts_to_query("[C,N;H2]")
+        self.assertEqual(q.atom(1).predicates["symbol"], ("C", "N"))
+        self.assertEqual(q.atom(1).predicates["aromatic"], (False,))
+        q = smarts_to_query("[#1]")
+        self.assertEqual(q.atom(1).predicates["symbol"], ("D", "H"))
+        q = smarts_to_query("[H+]")
+        self.assertEqual(q.atom(1).predicates["charge"], (1,))
+        q = smarts_to_query("[CH0]")
+        self.assertEqual(q.atom(1).predicates["H_count"], (0,))
+        q = smarts_to_query("C1CC1.[Hg]")
+        self.assertEqual(len(q), 4)
+        self.assertEqual(q.bond_count(), 3)
+        self.assertEqual(q.atom(4).predicates["symbol"], ("Hg",))
+        q = smarts_to_query("*!@*")
+        self.assertEqual(q.bond(1, 2).predicates["ring"], (False,))
+
+    def test_unsupported(self):
+        # OR and NOT of different properties
+        for smarts in ("[C,H1]", "[!C]", "[R2]", "[2H]", "[C@H]", "C(",
+                       "C1CC", "[]", "C/C=C/C"):
+            with self.assertRaises(ValueError):
+                smarts_to_query(smarts)
+
+    def test_match(self):
+        self.assertTrue(match("C(=O)[OH]", "CC(=O)O"))
+        self.assertFalse(match("C(=O)[OH]", "CC(=O)OC"))
+        self.assertFalse(match("C(=O)[OH]", "CC(=O)[O-]"))
+        self.assertTrue(match("[N+]", "C[N+](C)(C)C"))
+        self.assertFalse(match("[N+]", "CN"))
+        self.assertTrue(match("c1ccccc1", "Cc1ccccc1"))
+        self.assertFalse(match("c1ccccc1", "C1CCCCC1"))
+        self.assertTrue(match("[R]", "C1CC1"))
+        self.assertFalse(match("[R0]", "C1CC1"))
+        self.assertFalse(match("C=C", "c1ccccc1"))
+        self.assertTrue(match("c:c", "c1ccccc1"))
+        self.assertTrue(match("c!@c", "c1ccccc1-c1ccccc1"))
+        self.assertFalse(match("[CH3]", "C1CC1"))
+        self.assertTrue(match("[D3]", "CC(C)C"))
+        self.assertFalse(match("[D3]", "CCCC"))
+        self.assertTrue(match("[#7]", "c1ccncc1"))
+        self.assertFalse(match("N", "c1ccncc1"))
+        # Bonds between matched atoms not in the query are allowed
+        self.assertTrue(match("CCC", "C1CC1"))
+        self.assertFalse(substructure(smiles_to_compound("CCC"),
+                                      smiles_to_compound("C1CC1")))
@@ -8,7 +8,7 @@ import unittest
 # import logging
 # logging.basicConfig(level=logging.DEBUG)
 
-from chorus.smilessupplier import smiles_to_compound
+from chorus.smilessupplier import smiles_to_compound, smiles_supplier
 
 # logger = logging.getLogger('cheddar.chem.smilessupplier')
 
@@ -149,3 +149,37 @@ class TestSmilesSupplier(unittest.TestCase):
     def test_unsupported_symbol(self):
         with self.assertRaises(ValueError):
             smiles_to_compound("Hoge")
+
+    def test_syntax_error(self):
+        for smiles in ("CC)C", "CC(C", "1CC", "C*C"):
+            with self.assertRaises(ValueError):
+                smiles_to_compound(smiles)
+
+    def test_bond_symbols(self):
+        compound = smiles_to_compound("C-C=C#N")
+        self.assertEqual(compound.bond(1, 2).order, 1)
+        self.assertEqual(compound.bond(2, 3).order, 2)
+        self.assertEqual(compound.bond(3, 4).order, 3)
+        compound = smiles_to_compound("F/C=C\\F")
+        self.assertEqual(compound.bond(1, 2).smiles_cis_trans, 1)
+        self.assertEqual(compound.bond(3, 4).smiles_cis_trans, -1)
+        # two digit ring label
+        compound = smiles_to_compound("C%10CCCCC%10")
+        self.assertCountEqual(compound.neighbors(1), [2, 6])
+
+    def test_ring_in_branch(self):
+        compound = smiles_to_compound("C1CC(CC1)(C)C")
+        self.assertCountEqual(compound.neighbors(1), [2, 5])
+        self.assertCountEqual(compound.neighbors(3), [2, 4, 6, 7])
+        compound = smiles_to_compound("C1CC(C1)C")
+        self.assertCountEqual(compound.neighbors(1), [2, 4])
+
+    def test_supplier(self):
+        lines = ["CCO ethanol", "", "Hoge unsupported", "c1ccccc1"]
+        mols = list(smiles_supplier(lines, assign_descriptors=False))
+        self.assertEqual(len(mols), 3)
+        self.assertEqual(mols[0].data["name"], "ethanol")
+        self.assertEqual(mols[1].atom_count(), 0)
+        self.assertEqual(mols[2].atom_count(), 6)
+        with self.assertRaises(ValueError):
+            list(smiles_supplier(lines, no_halt=False))
@@ -7,8 +7,17 @@
 import json
 import unittest
 
+from networkx.algorithms.isomorphism.vf2userfunc import GraphMatcher
+
+from chorus.demo import MOL
+from chorus import molutil
+from chorus import v2000reader as reader
+from chorus.model.query import QueryMol
+from chorus.smartsparser import smarts_to_query
 from chorus.smilessupplier import smiles_to_compound
-from chorus.substructure import equal, substructure, filter_
+from chorus.substructure import equal, substructure, superstructure, \
+    filter_, atom_match, mappings_iter, prepare, bit_graph, bits_match, \
+    encode
 
 
 class TestSubstructure(unittest.TestCase):
@@ -50,3 +59,88 @@ class TestSubstructure(unittest.TestCase):
         # Non destructive
         self.assertEqual(mj, json.dumps(mol.jsonized())[:1000])
         self.assertEqual(qj, json.dumps(query.jsonized())[:1000])
+
+    def test_mappings_iter(self):
+        mols = [smiles_to_compound(s) for s in (
+            "c1ccc2ccccc2c1", "C1CCCC1CCCC(=O)O", "CC(O)CC(C)O", "CCC",
+            "C1CC1", "OC(=O)C(N)CC(=O)O")]
+        mols.append(reader.mol_from_text(MOL["Phe"]))
+        mols.append(reader.mol_from_text(MOL["Carbidopa"]))
+        for target in mols:
+            for pattern in mols + [smiles_to_compound(s) for s in (
+                    "c1ccccc1", "CC", "CCO", "C(=O)O", "CCCC")]:
+                gm = GraphMatcher(target.graph, pattern.graph,
+                                  node_match=atom_match)
+                expected = {frozenset((p, t) for t, p in m.items())
+                            for m in gm.subgraph_isomorphisms_iter()}
+                res = {frozenset(m.items())
+                       for m in mappings_iter(pattern, target)}
+                self.assertEqual(res, expected)
+        # Symmetric structure
+        mol = reader.mol_from_text(MOL["Buckminsterfullerene"])
+        self.assertEqual(len(list(equal(mol, mol, mappings=True))), 120)
+        self.assertTrue(equal(mol, molutil.clone(mol)))
+
+    def test_mappings(self):
+        mol = smiles_to_compound("C(=O)O")
+        query = smiles_to_compound("c1ccccc1CCC(=O)O.O")
+        res = list(substructure(mol, query, mappings=True))
+        self.assertEqual(len(res), 1)
+        for k, v in res[0].items():
+            self.assertEqual(mol.atom(k).symbol, query.atom(v).symbol)
+        res = list(superstructure(query, mol, mappings=True))
+        self.assertEqual(len(res), 1)
+        mol = smiles_to_compound("CCC")
+        res = list(equal(mol, smiles_to_compound("CCC"), mappings=True))
+        self.assertEqual(len(res), 2)
+        self.assertEqual(list(substructure(
+            smiles_to_compound(""), query, mappings=True)), [])
+        self.assertEqual(list(substructure(
+            smiles_to_compound("CCN"), query, mappings=True)), [])
+
+    def test_prepared(self):
+        smiles = ["c1ccccc1", "c1ccccc1CCC", "c1ccccc1.CCO.O.O", "CC(O)CC",
+                  "OCC(O)CC(=O)O", "C1CC1", "c1ccccc1CCC.O", "[Na+]", ""]
+        mols = [smiles_to_compound(s) for s in smiles]
+        mj = [json.dumps(m.jsonized())[:1000] for m in mols]
+        prepared = [prepare(m) for m in mols]
+        for _ in range(2):  # cached values are not modified
+            for m1, p1 in zip(mols, prepared):
+                for m2, p2 in zip(mols, prepared):
+                    expected = substructure(m1, m2)
+                    self.assertEqual(substructure(p1, p2), expected)
+                    self.assertEqual(substructure(m1, p2), expected)
+                    self.assertEqual(equal(p1, p2), equal(m1, m2))
+        self.assertEqual(mj, [json.dumps(m.jsonized())[:1000] for m in mols])
+        res = list(substructure(prepared[0], prepared[1], mappings=True))
+        self.assertEqual(len(res), 12)  # symmetry of benzene
+        self.assertIs(prepare(prepared[0]), prepared[0])
+        with self.assertRaises(ValueError):
+            substructure(prepared[2], prepared[1], largest_only=False)
+
+    def test_query(self):
+        mol = prepare(reader.mol_from_text(MOL["Carbidopa"]))
+        for smarts in ("c1ccccc1", "[O;H1]-c", "C(=O)[OH]", "N-N", "*~*~*",
+                       "[R]!@[R0]", "[D3;R]"):
+            query = smarts_to_query(smarts)
+            res = sorted(sorted(m.items()) for m in mappings_iter(query, mol))
+            gm = GraphMatcher(bit_graph(encode(mol.mol)),
+                              bit_graph(encode(query)),
+                              node_match=bits_match, edge_match=bits_match)
+            keys1 = list(query.graph)
+            keys2 = list(mol.mol.graph)
+            expected = sorted(
+                sorted((keys1[p], keys2[t]) for t, p in m.items())
+                for m in gm.subgraph_monomorphisms_iter())
+            self.assertTrue(expected)
+            self.assertEqual(res, expected)
+        # Same as the molecule except for the non-induced subgraph
+        for smiles in ("CCC", "c1ccccc1O", "NN"):
+            query = smiles_to_compound(smiles)
+            q = QueryMol.from_compound(query)
+            self.assertEqual(substructure(query, mol), substructure(q, mol))
+        self.assertTrue(substructure(QueryMol.from_compound(
+            smiles_to_compound("CCC")), smiles_to_compound("C1CC1")))
+        self.assertTrue(superstructure(mol, smarts_to_query("NN")))
+        self.assertFalse(substructure(smarts_to_query("[N+]"), mol))
+        self.assertFalse(substructure(QueryMol(), mol))
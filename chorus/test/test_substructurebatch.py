@@ -0,0 +1,90 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+import unittest
+
+import numpy as np
+
+from chorus.demo import MOL
+from chorus import v2000reader as reader
+from chorus.smartsparser import smarts_to_query
+from chorus.smilessupplier import smiles_to_compound
+from chorus.substructure import substructure, prepare
+from chorus import substructurebatch as sb
+
+
+SMILES = ["c1ccccc1CCC(=O)O", "CC(O)CCC(=O)O", "CC", "C1CCCC1CCCC(=O)O",
+          "c1ccccc1.CCO.O.O", "", "OCC1OC(O)C(O)C(O)C1O",
+          "C[N+](C)(C)CC([O-])=O"]
+
+
+def library():
+    mols = [smiles_to_compound(s) for s in SMILES]
+    for name in ("Phe", "Arg", "Lys", "Carbidopa"):
+        mols.append(reader.mol_from_text(MOL[name]))
+    return mols
+
+
+class TestSubstructureBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mols = library()
+        cls.lib = sb.SubstructureLibrary(cls.mols)
+
+    def test_fingerprint(self):
+        mol = smiles_to_compound("c1ccccc1CCC(=O)O")
+        feats = sb.path_features(mol, max_length=2)
+        self.assertIn("C0-C1-C1", feats)  # the smaller direction
+        self.assertNotIn("C1-C1-C0", feats)
+        self.assertIn("C0-C1-O1", feats)
+        self.assertNotIn("C1-C1-C1-C1", feats)
+        self.assertEqual(len(sb.path_fingerprint(mol)), sb.FP_BITS // 64)
+        # Bits of substructures are subset of the molecule bits
+        sub = sb.path_fingerprint(smiles_to_compound("c1ccccc1C"))
+        fp = sb.path_fingerprint(mol)
+        self.assertTrue(np.all(fp & sub == sub))
+
+    def test_filter_counts(self):
+        mol = smiles_to_compound("c1ccccc1CC2CC2.O")
+        counts = sb.filter_counts(prepare(mol))
+        self.assertEqual(counts[("composition", "C")], 10)
+        self.assertEqual(counts[("pi", 1)], 6)
+        self.assertEqual(counts[("ring", 3)], 1)
+        self.assertEqual(counts[("scaffold", 1)], 2)
+
+    def test_search(self):
+        queries = ["c1ccccc1", "C(=O)O", "CCN", "C1CC1", "CC", "O", "[Na+]",
+                   "c1ccccc1CC(N)C(=O)O", "", "CCCC.O"]
+        for smiles in queries:
+            query = smiles_to_compound(smiles)
+            expected = [i for i, m in enumerate(self.mols)
+                        if substructure(query, m)]
+            res, report = self.lib.search(query)
+            self.assertEqual(res, expected)
+            self.assertEqual(report["matched"], len(res))
+            self.assertEqual(
+                sum(report["eliminated"].values()) + len(res), len(self.lib))
+        _, report = self.lib.search(smiles_to_compound("C1CC1"))
+        self.assertEqual(report["screen_out_rate"], 1)
+        _, report = self.lib.search(smiles_to_compound("c1ccccc1"))
+        self.assertGreater(report["eliminated"]["fingerprint"], 0)
+        self.assertEqual(report["eliminated"]["empty"], 1)
+        # Molecules are not modified
+        self.assertEqual(self.mols[4].atom_count(), 11)
+
+    def test_search_query(self):
+        for smarts in ("c1ccccc1", "C(=O)[OH]", "[N+]", "[O-]", "[R]",
+                       "CCC", "[#7;H2]"):
+            query = smarts_to_query(smarts)
+            expected = [i for i, m in enumerate(self.mols)
+                        if substructure(query, m)]
+            res, report = self.lib.search(query)
+            self.assertEqual(res, expected)
+            self.assertEqual(report["eliminated"]["fingerprint"], 0)
+            self.assertEqual(report["eliminated"]["counts"], 0)
+        res, _ = self.lib.search(smarts_to_query("C(=O)[OH]"))
+        self.assertIn(0, res)
+        self.assertNotIn(7, res)  # carboxylate
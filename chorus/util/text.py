@@ -7,6 +7,9 @@
 import re
 
 
+CODECS = ("utf-8", "cp1252", "shift-jis")
+
+
 def substitute(dict_, source):
     """ Perform re.sub with the patterns in the given dict
     Args:
@@ -18,18 +21,24 @@ def substitute(dict_, source):
     return pattern.sub(lambda x: dict_[x.group()], source)
 
 
-def decode(byte_):
-    try:
-        res = byte_.decode('utf-8')
-    except UnicodeDecodeError:
+def decode(byte_, encodings=CODECS, errors="strict"):
+    """ Decode bytes by the first codec which can decode them
+    Args:
+      byte_: bytes
+      encodings: codec names to try in order
+      errors: if not "strict", bytes which no codec can decode are decoded
+        by the first codec with this error handler (ex. "replace")
+    Raises:
+      ValueError: if no codec can decode the bytes (errors="strict")
+    """
+    for codec in encodings:
         try:
-            res = byte_.decode("cp1252")
+            return byte_.decode(codec)
         except UnicodeDecodeError:
-            try:
-                res = byte_.decode("shift-jis")
-            except UnicodeDecodeError:
-                raise ValueError("Unsupported codec")
-    return res
+            continue
+    if errors == "strict":
+        raise ValueError("Unsupported codec")
+    return byte_.decode(encodings[0], errors)
 
 
 def decode_file(path):
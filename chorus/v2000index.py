@@ -0,0 +1,261 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+""" SDFile record index (v2000index.py)
+
+Byte offsets of SDFile records and data labels found in each record are
+stored in a sidecar file (<sdfile>.idx.npz) so that record count, data
+labels and random access to a record do not require scanning the file.
+"""
+
+import json
+import numbers
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+from chorus import v2000reader as reader
+import chorus.util.text as tx
+
+
+INDEX_SUFFIX = ".idx.npz"
+
+
+class SDFileIndex(object):
+    """Byte-offset index of SDFile records
+
+    Args:
+        path (str): SDFile path
+        offsets (numpy.ndarray): byte offsets of records. record i starts at
+            offsets[i] and ends at offsets[i + 1]
+        labels (list): data labels in order of appearance
+        labelsets (list): distinct sets of label indices
+        record_labelsets (numpy.ndarray): labelset index of each record
+        size (int): file size at the time of indexing
+        mtime (int): file modification time (ns) at the time of indexing
+    """
+    def __init__(self, path, offsets, labels, labelsets, record_labelsets,
+                 size, mtime):
+        self.path = path
+        self.offsets = offsets
+        self.labels = labels
+        self.labelsets = labelsets
+        self.record_labelsets = record_labelsets
+        self.size = size
+        self.mtime = mtime
+
+    def __len__(self):
+        """Number of records"""
+        return len(self.record_labelsets)
+
+    def span(self, i):
+        """Return (start, end) byte offsets of the record"""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("record index out of range")
+        return int(self.offsets[i]), int(self.offsets[i + 1])
+
+    def record_labels(self, i):
+        """Return data labels of the record"""
+        self.span(i)  # range check
+        ls = self.labelsets[self.record_labelsets[i]]
+        return [self.labels[j] for j in ls]
+
+    def is_fresh(self):
+        """Whether the indexed file has not been modified since indexing"""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        return st.st_size == self.size and st.st_mtime_ns == self.mtime
+
+    def save(self, path=None):
+        """Save the index to the sidecar file
+
+        The index is written to a temporary file and replaces the sidecar
+        file at once, so readers never see a partially written index.
+
+        Args:
+            path (str): index file path (default: <sdfile>.idx.npz)
+        """
+        if path is None:
+            path = self.path + INDEX_SUFFIX
+        meta = {
+            "labels": self.labels,
+            "labelsets": self.labelsets,
+            "size": self.size,
+            "mtime": self.mtime
+        }
+        fd, tmp = tempfile.mkstemp(
+            suffix=".tmp", prefix=os.path.basename(path) + ".",
+            dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, offsets=self.offsets,
+                         record_labelsets=self.record_labelsets,
+                         meta=np.array(json.dumps(meta)))
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+
+def build(path):
+    """Build SDFile index in one pass
+
+    Returns:
+        SDFileIndex
+    """
+    st = os.stat(path)
+    offsets = [0]
+    labels = {}
+    labelsets = {}
+    record_labelsets = []
+    current = set()
+    pos = 0
+
+    def close():
+        key = tuple(sorted(current))
+        if key not in labelsets:
+            labelsets[key] = len(labelsets)
+        record_labelsets.append(labelsets[key])
+        offsets.append(pos)
+        current.clear()
+
+    with reader.mmap_file(path) as mm:
+        for _, mol_end, data_start, data_end, end in reader.record_spans(mm):
+            if end == data_end and data_start == mol_end:
+                break  # trailing record without 'M  END'
+            for line in mm[data_start:data_end].split(b"\n"):
+                if not line.startswith(b">"):
+                    continue
+                result = reader.SDF_FIELD.match(
+                    tx.decode(line, errors="replace"))
+                if result:
+                    label = result.group(1)
+                    if label not in labels:
+                        labels[label] = len(labels)
+                    current.add(labels[label])
+            pos = end
+            close()
+    return SDFileIndex(
+        path, np.array(offsets, dtype=np.int64), list(labels),
+        [list(k) for k in labelsets],
+        np.array(record_labelsets, dtype=np.int32),
+        st.st_size, st.st_mtime_ns)
+
+
+def load(path, index_path=None):
+    """Load SDFile index from the sidecar file
+
+    Returns:
+        SDFileIndex, or None if the index does not exist, is outdated or
+        can not be read (ex. broken file)
+    """
+    if index_path is None:
+        index_path = path + INDEX_SUFFIX
+    if not os.path.isfile(index_path):
+        return None
+    try:
+        with np.load(index_path) as npz:
+            meta = json.loads(str(npz["meta"]))
+            idx = SDFileIndex(
+                path, npz["offsets"], meta["labels"], meta["labelsets"],
+                npz["record_labelsets"], meta["size"], meta["mtime"])
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+    if not idx.is_fresh():
+        return None
+    return idx
+
+
+def sidecar_path(path, index_dir=None):
+    """Index file path of the SDFile (<sdfile>.idx.npz in index_dir if
+    given, otherwise next to the SDFile)"""
+    if index_dir is None:
+        return path + INDEX_SUFFIX
+    return os.path.join(index_dir, os.path.basename(path) + INDEX_SUFFIX)
+
+
+def index_file(path, rebuild=False, index_dir=None):
+    """Return SDFile index. The index is built and saved to the sidecar file
+    if it does not exist or is outdated. Saving is skipped if the file can
+    not be written (ex. read-only directory).
+
+    Args:
+        path (str): SDFile path
+        rebuild (bool): always rebuild the index
+        index_dir (str): directory of the index file (see sidecar_path)
+
+    Returns:
+        SDFileIndex
+    """
+    ipath = sidecar_path(path, index_dir)
+    idx = None if rebuild else load(path, ipath)
+    if idx is None:
+        idx = build(path)
+        try:
+            idx.save(ipath)
+        except OSError:
+            pass
+    return idx
+
+
+def inspect_file(path, index_dir=None):
+    """Inspect SDFile structure using the sidecar index
+
+    Returns:
+        tuple: (data label list, number of records)
+    """
+    idx = index_file(path, index_dir=index_dir)
+    return list(idx.labels), len(idx)
+
+
+def mols_at(path, key, no_halt=True, assign_descriptors=True, index=None,
+            index_dir=None):
+    """Compound supplier of the records specified by the key
+
+    Args:
+        path (str): SDFile path
+        key (int, slice or iterable): record indices
+        no_halt (boolean): see v2000reader.mol_supplier
+        assign_descriptors (boolean): see v2000reader.mol_supplier
+        index (SDFileIndex): index to use (default: sidecar index)
+        index_dir (str): directory of the sidecar index (see index_file)
+    """
+    if index is None:
+        idx = index_file(path, index_dir=index_dir)
+    else:
+        idx = index
+    if isinstance(key, numbers.Integral):
+        indices = [key]
+    elif isinstance(key, slice):
+        indices = range(*key.indices(len(idx)))
+    else:
+        indices = key
+    with reader.mmap_file(path) as mm:
+        for i in indices:
+            start, end = idx.span(i)
+            if i < 0:
+                i += len(idx)
+            buf = mm[start:end]
+            blocks = reader.buffer_blocks(buf)
+            for c in reader.block_supplier(
+                    blocks, no_halt, assign_descriptors, i):
+                yield c
+
+
+def mol_at(path, i, assign_descriptors=True, index=None, index_dir=None):
+    """Parse i-th record of the SDFile and return it as a Compound object.
+
+    Raises:
+        IndexError: if the record does not exist
+    """
+    return next(mols_at(path, i, False, assign_descriptors, index,
+                        index_dir))
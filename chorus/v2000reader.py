@@ -4,12 +4,19 @@
 # http://opensource.org/licenses/MIT
 #
 
+from contextlib import contextmanager
+import mmap
+import multiprocessing
+import os
 import traceback
 import re
 
+import numpy as np
+
 from chorus.model.atom import Atom
 from chorus.model.bond import Bond
 from chorus.model.graphmol import Compound
+from chorus.model import compactmol
 from chorus import molutil
 import chorus.util.text as tx
 
@@ -56,7 +63,8 @@ def inspect_file(path):
         tuple: (data label list, number of records)
     """
     with open(path, 'rb') as f:
-        labels, count = inspect(tx.decode(line) for line in f)
+        labels, count = inspect(
+            tx.decode(line, errors="replace") for line in f)
     return labels, count
 
 
@@ -70,6 +78,110 @@ def optional_data(lines):
     return data
 
 
+# Fixed width columns (start, end) of atom block and bond block lines
+ATOM_COLUMNS = [(0, 10), (10, 20), (20, 30), (34, 37), (37, 40)]
+SYMBOL_COLUMN = (31, 34)
+BOND_COLUMNS = [(0, 3), (3, 6), (6, 9), (9, 12)]
+# Convert sdf style charge to actual charge
+CHARGE_TABLE = np.array([0, 3, 2, 1, 0, -1, -2, -3])
+# Convert sdf style stereobond (see chem.model.bond.Bond), -1: undefined
+STEREO_TABLE = np.array([0, 1, -1, 3, 3, -1, 2])
+
+
+def fixed_width_values(lines, columns, width):
+    """Parse numeric fixed width fields of lines
+
+    Fields are sliced from a character array of the whole block and each
+    field is converted by float. Conversion of the digits by NumPy
+    operations is slower for blocks of the molfile size.
+
+    Args:
+        lines (list): lines of the block
+        columns (list): (start, end) positions of the fields
+        width (int): line width to be considered
+
+    Returns:
+        tuple: (values (lines x fields float array),
+                characters (lines x width uint8 array))
+
+    Raises:
+        ValueError: if a field is empty or not numeric
+    """
+    buf = "".join([line[:width].ljust(width) for line in lines])
+    chars = np.frombuffer(buf.encode("ascii"), dtype=np.uint8)
+    chars = chars.reshape(-1, width)
+    # Rearrange fields with separators. Adjacent fields may be joined
+    # (ex. atom index >= 100 in bond block).
+    sep = np.full((len(lines), sum(e - s + 1 for s, e in columns)),
+                  ord(" "), dtype=np.uint8)
+    pos = 0
+    for s, e in columns:
+        sep[:, pos:pos + e - s] = chars[:, s:e]
+        pos += e - s + 1
+    fields = sep.tobytes().split()
+    if len(fields) != len(lines) * len(columns):
+        raise ValueError("Invalid fixed width field")
+    values = np.array(list(map(float, fields))).reshape(-1, len(columns))
+    return values, chars
+
+
+def table_lookup(table, values, undefined=None):
+    """Convert values by the lookup table
+
+    Raises:
+        KeyError: if the value is out of the table or is undefined
+    """
+    invalid = (values < 0) | (values >= len(table))
+    if not invalid.any():
+        res = table[values]
+        if undefined is None:
+            return res
+        invalid = res == undefined
+        if not invalid.any():
+            return res
+    raise KeyError(int(values[invalid][0]))
+
+
+def atom_arrays(lines):
+    """Parse atom block into arrays
+
+    Returns:
+        dict: coords (n x 3 float), symbols (list of symbols),
+            symbol_codes (index of symbols), mass_diff, charge and
+            radical (n int)
+    """
+    values, chars = fixed_width_values(lines, ATOM_COLUMNS, 40)
+    s, e = SYMBOL_COLUMN
+    symbols = {}
+    codes = [symbols.setdefault(sym, len(symbols))
+             for sym in chars[:, s:e].copy().view("S3").ravel().tolist()]
+    old_sdf_charge = values[:, 4].astype(np.int64)
+    return {
+        "coords": values[:, 0:3],
+        "symbols": [sym.decode().rstrip() for sym in symbols],
+        "symbol_codes": np.array(codes, dtype=np.int64),
+        "mass_diff": values[:, 3].astype(np.int64),
+        "charge": table_lookup(CHARGE_TABLE, old_sdf_charge),
+        "radical": (old_sdf_charge == 4).astype(np.int64)
+    }
+
+
+def bond_arrays(lines):
+    """Parse bond block into arrays
+
+    Returns:
+        dict: atoms (n x 2 int, atom indices), order and type
+            (see chem.model.bond.Bond) (n int)
+    """
+    values, _ = fixed_width_values(lines, BOND_COLUMNS, 12)
+    values = values.astype(np.int64)
+    return {
+        "atoms": values[:, 0:2],
+        "order": values[:, 2],
+        "type": table_lookup(STEREO_TABLE, values[:, 3], undefined=-1)
+    }
+
+
 def atoms(lines):
     """Parse atom block into atom objects
 
@@ -170,6 +282,9 @@ def add_properties(props, mol):
 def molecule(lines):
     """Parse molfile part into molecule object
 
+    Atoms and bonds are parsed line by line into Atom and Bond objects. If
+    the objects are not required, compact_molecule uses much less memory.
+
     Args:
         lines (list): lines of molfile part
 
@@ -191,7 +306,192 @@ def molecule(lines):
     return compound
 
 
-def mol_supplier(lines, no_halt, assign_descriptors):
+def molecule_arrays(lines):
+    """Parse molfile part into arrays without building atom and bond objects
+
+    Args:
+        lines (list): lines of molfile part
+
+    Returns:
+        dict: atoms (see atom_arrays), bonds (see bond_arrays),
+            properties (see properties)
+    """
+    count_line = lines[3]
+    num_atoms = int(count_line[0:3])
+    num_bonds = int(count_line[3:6])
+    return {
+        "atoms": atom_arrays(lines[4: num_atoms+4]),
+        "bonds": bond_arrays(lines[num_atoms+4: num_atoms+num_bonds+4]),
+        "properties": properties(lines[num_atoms+num_bonds+4:])
+    }
+
+
+def compact_molecule(lines):
+    """Parse molfile part into compactmol.CompactMol
+
+    Array path of molecule. Atom and bond blocks are parsed into arrays
+    and no Atom and Bond objects are built (see molecule_arrays), so the
+    result takes a fraction of the memory. Parsing is not faster than
+    molecule (see the v2000reader benchmarks of scripts/benchmark.py).
+
+    Args:
+        lines (list): lines of molfile part
+
+    Raises:
+        ValueError: Symbol not defined in periodictable.yaml
+    """
+    arrs = molecule_arrays(lines)
+    atoms = arrs["atoms"]
+    bonds = arrs["bonds"]
+    symbols = [atoms["symbols"][c] for c in atoms["symbol_codes"].tolist()]
+    pairs = bonds["atoms"]
+    try:
+        mol = compactmol.build(
+            np.arange(1, len(symbols) + 1), symbols, pairs,
+            coords=atoms["coords"], charge=atoms["charge"],
+            order=np.where(bonds["order"] < 4, bonds["order"], 1),
+            is_lower_first=pairs[:, 0] < pairs[:, 1], type=bonds["type"])
+    except KeyError as e:
+        raise ValueError(e.args[0])
+    add_properties(arrs["properties"], mol)
+    return mol
+
+
+def sdf_block(lines):
+    """Yields molfile part and data part of each SDFile record
+
+    Args:
+        lines (iterable): CTAB text lines
+
+    Returns:
+        tuple: (molfile lines, data lines)
+    """
+    mol = []
+    opt = []
+    is_mol = True
+    for line in lines:
+        if line.startswith("$$$$"):
+            yield mol[:], opt[:]
+            is_mol = True
+            mol.clear()
+            opt.clear()
+        elif line.startswith("M  END"):
+            is_mol = False
+        elif is_mol:
+            mol.append(line.rstrip())
+        else:
+            opt.append(line.rstrip())
+    if mol:
+        yield mol, opt
+
+
+def find_line(buf, token, start, end):
+    """Return offset of the first line in buf[start:end] which starts with
+    the token, or -1 if not found"""
+    if buf[start:start + len(token)] == token and start + len(token) <= end:
+        return start
+    nl = "\n" if isinstance(token, str) else b"\n"
+    pos = buf.find(nl + token, start, end)
+    if pos < 0:
+        return -1
+    return pos + 1
+
+
+def record_spans(buf):
+    """Yields spans of SDFile records in the buffer without splitting lines
+
+    Args:
+        buf: SDFile content (bytes, mmap.mmap or str)
+
+    Returns:
+        tuple: (start, molfile end, data start, data end, end)
+            molfile part is buf[start:molfile end] and data part is
+            buf[data start:data end]. data start > molfile end if the record
+            has 'M  END' line. end > data end if the record is terminated
+            by '$$$$' line, and the next record starts at end.
+    """
+    if isinstance(buf, str):
+        nl, rec_sep, mol_sep = "\n", "$$$$", "M  END"
+    else:
+        nl, rec_sep, mol_sep = b"\n", b"$$$$", b"M  END"
+    size = len(buf)
+    start = 0
+    while start < size:
+        sep = find_line(buf, rec_sep, start, size)
+        if sep < 0:
+            data_end = end = size
+        else:
+            data_end = sep
+            eol = buf.find(nl, sep)
+            end = size if eol < 0 else eol + 1
+        mend = find_line(buf, mol_sep, start, data_end)
+        if mend < 0:
+            mol_end = data_start = data_end
+        else:
+            mol_end = mend
+            eol = buf.find(nl, mend, data_end)
+            data_start = data_end if eol < 0 else eol + 1
+        yield start, mol_end, data_start, data_end, end
+        start = end
+
+
+def split_lines(text):
+    """Split text into right-stripped lines (same as sdf_block)"""
+    lines = text.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    return [line.rstrip() for line in lines]
+
+
+def decode_part(buf, encoding=None):
+    """Decode a part of an SDFile record (str is returned as is)
+
+    Bytes are decoded by the encoding if given, otherwise by the first codec
+    of util.text.CODECS which can decode them, so each record of a file with
+    mixed encodings is decoded by its own codec. Undecodable bytes are
+    replaced with U+FFFD instead of failing the whole file.
+    """
+    if isinstance(buf, str):
+        return buf
+    encodings = tx.CODECS if encoding is None else (encoding,)
+    return tx.decode(buf, encodings, errors="replace")
+
+
+def buffer_blocks(buf, encoding=None):
+    """Yields molfile part and data part of each SDFile record in the buffer
+
+    Records are located on the raw buffer and each part is decoded at once
+    (see decode_part), so the lines are not decoded one by one.
+
+    Args:
+        buf: SDFile content (bytes, mmap.mmap or str)
+        encoding (str): codec to decode bytes (default: detected for each
+            part, see decode_part)
+
+    Returns:
+        tuple: (molfile lines, data lines)
+    """
+    for start, mol_end, data_start, data_end, end in record_spans(buf):
+        mol = decode_part(buf[start:mol_end], encoding)
+        opt = decode_part(buf[data_start:data_end], encoding)
+        mol_lines = split_lines(mol)
+        if not mol_lines and end == data_end:
+            continue  # trailing blank record
+        yield mol_lines, split_lines(opt)
+
+
+@contextmanager
+def mmap_file(path):
+    """Read-only memory map of the file (empty bytes if the file is empty)"""
+    with open(path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def mol_supplier(lines, no_halt, assign_descriptors, start=0):
     """Yields molecules generated from CTAB text
 
     Args:
@@ -201,27 +501,21 @@ def mol_supplier(lines, no_halt, assign_descriptors):
             False: throws an exception for it and stop parsing.
         assign_descriptors (boolean):
             if True, default descriptors are automatically assigned.
+        start (int): index of the first record in the whole file
+            (used for warning messages)
     """
-    def sdf_block(lns):
-        mol = []
-        opt = []
-        is_mol = True
-        for line in lns:
-            if line.startswith("$$$$"):
-                yield mol[:], opt[:]
-                is_mol = True
-                mol.clear()
-                opt.clear()
-            elif line.startswith("M  END"):
-                is_mol = False
-            elif is_mol:
-                mol.append(line.rstrip())
-            else:
-                opt.append(line.rstrip())
-        if mol:
-            yield mol, opt
+    return block_supplier(sdf_block(lines), no_halt, assign_descriptors,
+                          start)
 
-    for i, (mol, opt) in enumerate(sdf_block(lines)):
+
+def block_supplier(blocks, no_halt, assign_descriptors, start=0):
+    """Yields molecules generated from molfile and data part blocks
+
+    Args:
+        blocks (iterable): tuples of (molfile lines, data lines)
+        no_halt, assign_descriptors, start: see mol_supplier
+    """
+    for i, (mol, opt) in enumerate(blocks, start):
         try:
             c = molecule(mol)
             if assign_descriptors:
@@ -262,14 +556,8 @@ def mols_from_text(text, no_halt=True, assign_descriptors=True):
         StopIteration: if the text does not have molecule
         ValueError: if Unsupported symbol is found
     """
-    if isinstance(text, bytes):
-        t = tx.decode(text)
-    else:
-        t = text
-    # Lazy line splitter. More efficient memory usage than str.split.
-    exp = re.compile(r"[^\n]*\n|.")
-    sp = (x.group(0) for x in re.finditer(exp, t))
-    for c in mol_supplier(sp, no_halt, assign_descriptors):
+    blocks = buffer_blocks(text)
+    for c in block_supplier(blocks, no_halt, assign_descriptors):
         yield c
 
 
@@ -285,10 +573,14 @@ def mol_from_text(text, assign_descriptors=True):
 
 
 def mols_from_file(path, no_halt=True, assign_descriptors=True):
-    """Compound supplier from CTAB text file (.mol, .sdf)"""
-    with open(path, 'rb') as f:
-        fd = (tx.decode(line) for line in f)
-        for c in mol_supplier(fd, no_halt, assign_descriptors):
+    """Compound supplier from CTAB text file (.mol, .sdf)
+
+    The file is memory-mapped and records are located on raw bytes. Each
+    record is decoded separately (see decode_part).
+    """
+    with mmap_file(path) as mm:
+        blocks = buffer_blocks(mm)
+        for c in block_supplier(blocks, no_halt, assign_descriptors):
             yield c
 
 
@@ -296,3 +588,149 @@ def mol_from_file(path, assign_descriptors=True):
     """Parse CTAB file and return first one as a Compound object."""
     cs = mols_from_file(path, False, assign_descriptors)
     return next(cs)
+
+
+class LazyRecord(object):
+    """SDFile record whose data fields are parsed eagerly and whose Compound
+    object is built on first access
+
+    Args:
+        mol (str or bytes): molfile part of the record
+        data (dict): parsed data fields
+        encoding (str): codec to decode the molfile part if it is bytes
+            (see decode_part)
+        index (int): record index (used for warning messages)
+        no_halt, assign_descriptors: see mol_supplier
+
+    Attributes:
+        data (dict): data fields of the record
+        compound (Compound): molecule object (built on first access)
+    """
+    def __init__(self, mol, data, encoding=None, index=0, no_halt=True,
+                 assign_descriptors=True):
+        self.data = data
+        self.index = index
+        self.no_halt = no_halt
+        self.assign_descriptors = assign_descriptors
+        self._mol = mol
+        self._encoding = encoding
+        self._compound = None
+
+    @property
+    def compound(self):
+        if self._compound is None:
+            mol = decode_part(self._mol, self._encoding)
+            blocks = [(split_lines(mol), [])]
+            c = next(block_supplier(blocks, self.no_halt,
+                                    self.assign_descriptors, self.index))
+            c.data = self.data
+            self._compound = c
+            self._mol = None  # release the source text
+        return self._compound
+
+
+def buffer_records(buf, encoding=None, no_halt=True, assign_descriptors=True):
+    """Yields LazyRecord of each SDFile record in the buffer
+
+    Only the data part is decoded and parsed. The molfile part is kept as is
+    until LazyRecord.compound is accessed.
+
+    Args:
+        buf: SDFile content (bytes, mmap.mmap or str)
+        encoding (str): codec to decode bytes (see buffer_blocks)
+        no_halt, assign_descriptors: see mol_supplier
+    """
+    for i, (start, mol_end, data_start, data_end, end) in enumerate(
+            record_spans(buf)):
+        if start == mol_end and end == data_end:
+            continue  # trailing blank record
+        opt = decode_part(buf[data_start:data_end], encoding)
+        data = optional_data(split_lines(opt))
+        yield LazyRecord(buf[start:mol_end], data, encoding, i,
+                         no_halt, assign_descriptors)
+
+
+def records_from_text(text, no_halt=True, assign_descriptors=True):
+    """LazyRecord supplier from SDFile text (str or bytes)"""
+    records = buffer_records(text, None, no_halt, assign_descriptors)
+    for r in records:
+        yield r
+
+
+def records_from_file(path, no_halt=True, assign_descriptors=True):
+    """LazyRecord supplier from CTAB text file (.mol, .sdf)
+
+    Data fields of each record are available without building molecules,
+    which is much faster when only the data fields are required.
+    """
+    with mmap_file(path) as mm:
+        for r in buffer_records(mm, None, no_halt, assign_descriptors):
+            yield r
+
+
+def sdf_chunks(path, size=1000):
+    """Split SDFile into chunks of records on $$$$ boundaries
+
+    Args:
+        path (str): SDFile path
+        size (int): number of records per chunk
+
+    Returns:
+        tuple: (start byte offset, end byte offset, index of the first record)
+    """
+    with mmap_file(path) as mm:
+        start = pos = 0
+        first = count = 0
+        for _, _, _, _, pos in record_spans(mm):
+            count += 1
+            if count - first == size:
+                yield start, pos, first
+                start = pos
+                first = count
+        if pos > start:
+            yield start, pos, first
+
+
+def chunk_to_mols(args):
+    """Parse a chunk of SDFile records (worker of mols_from_file_parallel)
+
+    Args:
+        args (tuple): (path, start, end, first, no_halt, assign_descriptors)
+
+    Returns:
+        list: Compound objects
+    """
+    path, start, end, first, no_halt, assign_descriptors = args
+    with open(path, 'rb') as f:
+        f.seek(start)
+        buf = f.read(end - start)
+    blocks = buffer_blocks(buf)
+    return list(block_supplier(blocks, no_halt, assign_descriptors, first))
+
+
+def mols_from_file_parallel(path, no_halt=True, assign_descriptors=True,
+                            processes=None, chunk_size=1000, ordered=True):
+    """Compound supplier from CTAB text file using a process pool
+
+    The file is split into chunks of records on $$$$ boundaries and each
+    chunk is parsed in a worker process.
+
+    Args:
+        path (str): SDFile path
+        no_halt (boolean): see mol_supplier
+        assign_descriptors (boolean): see mol_supplier
+        processes (int): number of worker processes (default: cpu count)
+        chunk_size (int): number of records per chunk
+        ordered (boolean): if False, molecules are yielded in the order
+            that chunks were finished (faster if chunks are uneven)
+    """
+    args = ((path, start, end, first, no_halt, assign_descriptors)
+            for start, end, first in sdf_chunks(path, chunk_size))
+    with multiprocessing.Pool(processes) as pool:
+        if ordered:
+            res = pool.imap(chunk_to_mols, args)
+        else:
+            res = pool.imap_unordered(chunk_to_mols, args)
+        for mols in res:
+            for c in mols:
+                yield c
@@ -0,0 +1,496 @@
+#
+# (C) 2014-2017 Seiji Matsuoka
+# Licensed under the MIT License (MIT)
+# http://opensource.org/licenses/MIT
+#
+
+""" Benchmark suite of hot paths using the bundled DrugBank/PubChem
+resources
+
+Usage: make benchmark
+       python3 ./scripts/benchmark.py [-o result.json] [--compare base.json]
+
+Each benchmark is timed `repeat` times (best of `number` calls each) and
+the peak memory allocated in a separate run is measured by tracemalloc.
+Results are written as JSON (stdout by default) so that they can be
+compared across commits by --compare.
+"""
+
+import argparse
+from collections import OrderedDict
+import glob
+import json
+import os
+import pickle
+import platform
+import signal
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import networkx as nx  # noqa: E402
+import numpy as np  # noqa: E402
+
+from chorus import canonical  # noqa: E402
+from chorus import mcsdr  # noqa: E402
+from chorus import molutil  # noqa: E402
+from chorus import substructure  # noqa: E402
+from chorus import substructurebatch  # noqa: E402
+from chorus import v2000reader as reader  # noqa: E402
+from chorus import wclogp  # noqa: E402
+from chorus.demo import RESOURCE_DIR  # noqa: E402
+from chorus.draw.calc2dcoords import calc2dcoords  # noqa: E402
+from chorus.draw.svg import mol_to_svg  # noqa: E402
+from chorus.model.query import QueryAtom, QueryBond, QueryMol  # noqa: E402
+from chorus.smartsparser import smarts_to_query  # noqa: E402
+from chorus.smilessupplier import smiles_to_compound  # noqa: E402
+
+
+SMILES = [
+    "CC(=O)Oc1ccccc1C(=O)O",
+    "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+    "CC(C)Cc1ccc(cc1)C(C)C(=O)O",
+    "CC(=O)Nc1ccc(O)cc1",
+    "OC(=O)CCC(=O)O",
+    "C1CCC(CC1)NC(=O)c1ccccc1Cl",
+    "COc1ccc2[nH]cc(CCN(C)C)c2c1",
+    "CC1(C)SC2C(NC(=O)Cc3ccccc3)C(=O)N2C1C(=O)O",
+    "OCC1OC(O)C(O)C(O)C1O",
+    "N[C@@H](Cc1ccccc1)C(=O)O",
+    "C[N+](C)(C)CC([O-])=O",
+    "c1ccc2c(c1)ccc1ccccc12",
+]
+
+SMARTS = [
+    "C(=O)[OH]",
+    "c1ccccc1",
+    "[N;H2]",
+    "[R]!@[R]",
+    "[c;R](:c)-[C;R0]=O",
+    "[D3](-[CH3])-[CH3]",
+    "[O;H1]-c",
+    "[S,P](=O)=O",
+]
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(name, number=1):
+    """Register a benchmark. The decorated function receives the resources
+    and returns (a function to be timed, number of items per call)"""
+    def register(setup):
+        BENCHMARKS[name] = (setup, number)
+        return setup
+    return register
+
+
+def drugbank_files():
+    """Paths of supported DrugBank molfiles"""
+    paths = []
+    pattern = os.path.join(RESOURCE_DIR, "DrugBank", "*.mol")
+    for path in sorted(glob.glob(pattern)):
+        try:
+            reader.mol_from_file(path)
+        except (ValueError, RuntimeError):
+            continue  # Unsupported structure
+        paths.append(path)
+    return paths
+
+
+def drugbank_mols():
+    return [reader.mol_from_file(path) for path in drugbank_files()]
+
+
+def sdf_text():
+    """DrugBank molfiles and PubChem SDFiles concatenated into an SDFile"""
+    texts = []
+    for path in drugbank_files():
+        with open(path) as f:
+            text = f.read().rstrip("\n")
+        if not text.endswith("$$$$"):
+            # data items are terminated by a blank line
+            text += "\n\n$$$$"
+        texts.append(text + "\n")
+    for path in sorted(glob.glob(os.path.join(RESOURCE_DIR, "PubChem",
+                                              "*.sdf"))):
+        with open(path) as f:
+            texts.append(f.read())
+    return "".join(texts)
+
+
+def resources():
+    mols = drugbank_mols()
+    # MCS-DR comparisons are quadratic. Use small and middle size ones.
+    small = sorted(mols, key=len)[:20]
+    return {
+        "mols": mols,
+        "sdf": sdf_text(),
+        "arrays": [mcsdr.DescriptorArray(m) for m in small]
+    }
+
+
+@benchmark("v2000reader.mols_from_text", number=3)
+def bench_sdf(res):
+    text = res["sdf"]
+    return lambda: list(reader.mols_from_text(text)), text.count("$$$$")
+
+
+def molfile_blocks(res, count=None):
+    """Molfile parts of the SDFile records (count: largest ones only)"""
+    blocks = [mol for mol, _ in reader.buffer_blocks(res["sdf"])]
+    if count is not None:
+        blocks = sorted(blocks, key=len, reverse=True)[:count]
+    return blocks
+
+
+@benchmark("v2000reader.molecule", number=5)
+def bench_molecule(res):
+    blocks = molfile_blocks(res)
+    return lambda: [reader.molecule(b) for b in blocks], len(blocks)
+
+
+@benchmark("v2000reader.compact_molecule", number=5)
+def bench_compact_molecule(res):
+    # Array parser (compare time and peak memory with
+    # v2000reader.molecule)
+    blocks = molfile_blocks(res)
+    return lambda: [reader.compact_molecule(b) for b in blocks], len(blocks)
+
+
+@benchmark("v2000reader.molecule.large", number=5)
+def bench_molecule_large(res):
+    # Largest records only
+    blocks = molfile_blocks(res, 5)
+    return lambda: [reader.molecule(b) for b in blocks], len(blocks)
+
+
+@benchmark("v2000reader.compact_molecule.large", number=5)
+def bench_compact_molecule_large(res):
+    blocks = molfile_blocks(res, 5)
+    return lambda: [reader.compact_molecule(b) for b in blocks], len(blocks)
+
+
+@benchmark("smilessupplier.smiles_to_compound", number=5)
+def bench_smiles(res):
+    return lambda: [smiles_to_compound(s) for s in SMILES], len(SMILES)
+
+
+@benchmark("molutil.assign_descriptors", number=3)
+def bench_descriptors(res):
+    mols = res["mols"]
+
+    def run():
+        for m in mols:
+            molutil.assign_descriptors(m)
+    return run, len(mols)
+
+
+@benchmark("molutil.clone", number=20)
+def bench_clone(res):
+    mols = res["mols"]
+    return lambda: [molutil.clone(m) for m in mols], len(mols)
+
+
+@benchmark("pickle.round_trip", number=20)
+def bench_pickle(res):
+    # Reference of molutil.clone
+    mols = res["mols"]
+    return (lambda: [pickle.loads(pickle.dumps(m, protocol=4))
+                     for m in mols]), len(mols)
+
+
+@benchmark("wclogp.wclogp", number=3)
+def bench_wclogp(res):
+    mols = res["mols"]
+    return lambda: [wclogp.wclogp(m) for m in mols], len(mols)
+
+
+@benchmark("substructure.substructure")
+def bench_substructure(res):
+    mols = res["mols"]
+    queries = sorted(mols, key=len)[:8]
+    pairs = [(m, q) for q in queries for m in mols]
+    return (lambda: [substructure.substructure(m, q) for m, q in pairs]), \
+        len(pairs)
+
+
+@benchmark("substructure.substructure.prepared")
+def bench_substructure_prepared(res):
+    # Molecules are normalized once (included in the time)
+    mols = res["mols"]
+    queries = sorted(mols, key=len)[:8]
+
+    def run():
+        pms = [substructure.prepare(m) for m in mols]
+        pqs = [substructure.prepare(q) for q in queries]
+        return [substructure.substructure(m, q) for q in pqs for m in pms]
+    return run, len(queries) * len(mols)
+
+
+@benchmark("substructurebatch.SubstructureLibrary.search")
+def bench_substructure_library(res):
+    # Same queries as substructure.substructure over the indexed library
+    mols = res["mols"]
+    queries = sorted(mols, key=len)[:8]
+    lib = substructurebatch.SubstructureLibrary(mols)
+    return (lambda: [lib.search(q) for q in queries]), \
+        len(queries) * len(mols)
+
+
+@benchmark("substructure.substructure.query")
+def bench_substructure_query(res):
+    # Predicates are tested by the matcher
+    pms = [substructure.prepare(m) for m in res["mols"]]
+    queries = [smarts_to_query(s) for s in SMARTS]
+    return (lambda: [substructure.substructure(q, m)
+                     for q in queries for m in pms]), len(queries) * len(pms)
+
+
+@benchmark("substructure.substructure.query.postfilter")
+def bench_substructure_query_postfilter(res):
+    # Reference of substructure.substructure.query: match element symbols
+    # and test the other predicates on each mapping
+    pms = [substructure.prepare(m) for m in res["mols"]]
+    queries = []
+    for s in SMARTS:
+        q = smarts_to_query(s)
+        elements = QueryMol()
+        for k, a in q.atoms_iter():
+            elements.add_atom(k, QueryAtom(a.predicates["symbol"]))
+        for u, v, _ in q.bonds_iter():
+            elements.add_bond(u, v, QueryBond())
+        queries.append((q, elements))
+
+    # Atom and bond features: atom index -> bits, (atom, atom) -> bits
+    features = []
+    for m in pms:
+        g = substructure.bit_graph(substructure.encode(m.mol))
+        keys = list(m.mol.graph)
+        atoms = {keys[i]: bits for i, bits in g.nodes.data("bits")}
+        bonds = {}
+        for i, j, bits in g.edges.data("bits"):
+            bonds[(keys[i], keys[j])] = bonds[(keys[j], keys[i])] = bits
+        features.append((m, atoms, bonds))
+
+    def satisfied(q, atoms, bonds, mapping):
+        return all(not atoms[mapping[k]] & ~a.mask
+                   for k, a in q.atoms_iter()) and \
+            all(not bonds[(mapping[u], mapping[v])] & ~b.mask
+                for u, v, b in q.bonds_iter())
+
+    def run():
+        return [any(satisfied(q, atoms, bonds, mp)
+                    for mp in substructure.mappings_iter(elements, m))
+                for q, elements in queries for m, atoms, bonds in features]
+    return run, len(queries) * len(pms)
+
+
+@benchmark("canonical.deduplicate")
+def bench_deduplicate(res):
+    mols = res["mols"]
+    return lambda: canonical.deduplicate(mols), len(mols)
+
+
+@benchmark("substructure.equal.pairwise")
+def bench_equal_pairwise(res):
+    # Reference of canonical.deduplicate
+    mols = res["mols"]
+
+    def run():
+        unique = []
+        for m in mols:
+            if not any(substructure.equal(u, m) for u in unique):
+                unique.append(m)
+    return run, len(mols)
+
+
+@benchmark("mcsdr.DescriptorArray")
+def bench_descriptor_array(res):
+    mols = res["mols"]
+    return lambda: [mcsdr.DescriptorArray(m) for m in mols], len(mols)
+
+
+@benchmark("mcsdr.McsdrGls.cython")
+def bench_mcsdr_cython(res):
+    arrs = res["arrays"]
+    pairs = [(a, b) for i, a in enumerate(arrs) for b in arrs[i + 1:]]
+    return (lambda: [mcsdr.McsdrGls(a, b).local_sim() for a, b in pairs]), \
+        len(pairs)
+
+
+def product_graphs(arrs):
+    graphs = []
+    for i, a in enumerate(arrs):
+        for b in arrs[i + 1:]:
+            cg = mcsdr.comparison_graph(a.array, b.array, timeout=10)
+            g = nx.Graph()
+            g.add_nodes_from(cg["decoder"])
+            g.add_edges_from(cg["edges"].tolist())
+            graphs.append((cg, g))
+    return graphs
+
+
+@benchmark("mcsdr.max_clique.cython")
+def bench_clique_cython(res):
+    graphs = product_graphs(res["arrays"][:12])
+    return (lambda: [mcsdr.find_cliques(cg["decoder"].keys(), cg["edges"],
+                                        timeout=10) for cg, _ in graphs]), \
+        len(graphs)
+
+
+@benchmark("mcsdr.max_clique.python")
+def bench_clique_python(res):
+    # networkx clique enumeration is the pure Python fallback of the kernel
+    graphs = product_graphs(res["arrays"][:12])
+    return (lambda: [max(nx.find_cliques(g), key=len, default=[])
+                     for _, g in graphs]), len(graphs)
+
+
+class TimeLimit(Exception):
+    pass
+
+
+def finishes(func, seconds):
+    """Whether func finishes in time (always True if SIGALRM is not
+    available)"""
+    if not hasattr(signal, "SIGALRM"):
+        return True
+
+    def expire(signum, frame):
+        raise TimeLimit()
+    handler = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        func()
+    except TimeLimit:
+        return False
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, handler)
+    return True
+
+
+@benchmark("calc2dcoords")
+def bench_coords(res):
+    # calc2dcoords does not terminate for some fused/bridged ring systems.
+    # They are excluded by a trial run (see "items" of the result).
+    mols = [molutil.clone(m) for m in res["mols"]]
+    mols = [m for m in mols if finishes(lambda: calc2dcoords(m), 1)]
+    return lambda: [calc2dcoords(m) for m in mols], len(mols)
+
+
+@benchmark("svg.mol_to_svg", number=3)
+def bench_svg(res):
+    mols = res["mols"]
+    return lambda: [mol_to_svg(m) for m in mols], len(mols)
+
+
+def measure(func, number, repeat):
+    """Timing distribution (ms per call) and peak memory (bytes)"""
+    times = [t / number * 1000
+             for t in timeit.repeat(func, number=number, repeat=repeat)]
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "unit": "ms",
+        "number": number,
+        "repeat": repeat,
+        "times": [round(t, 4) for t in times],
+        "min": round(min(times), 4),
+        "median": round(statistics.median(times), 4),
+        "mean": round(statistics.mean(times), 4),
+        "stdev": round(statistics.stdev(times), 4) if repeat > 1 else 0,
+        "peak_memory": peak
+    }
+
+
+def git_revision():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def environment():
+    return {
+        "revision": git_revision(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "networkx": nx.__version__,
+        "cython_available": mcsdr.CYTHON_AVAILABLE
+    }
+
+
+def run(names, repeat):
+    res = resources()
+    results = OrderedDict()
+    for name in names:
+        setup, number = BENCHMARKS[name]
+        func, items = setup(res)
+        r = measure(func, number, repeat)
+        r["items"] = items
+        results[name] = r
+        print("{:40} {:10.2f} ms  (median {:.2f}, {} items, peak {:.1f} MB)"
+              .format(name, r["min"], r["median"], items,
+                      r["peak_memory"] / 2 ** 20), file=sys.stderr)
+    return {"environment": environment(), "results": results}
+
+
+def compare(result, base):
+    """Print speed ratio of the result to the base result (>1: faster)"""
+    print("compared with {}".format(base["environment"].get("revision")),
+          file=sys.stderr)
+    for name, r in result["results"].items():
+        b = base["results"].get(name)
+        if b is None:
+            continue
+        print("{:40} {:6.2f}x time  {:6.2f}x memory".format(
+            name, b["min"] / r["min"],
+            b["peak_memory"] / max(r["peak_memory"], 1)), file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("-o", "--output", help="output JSON file path "
+                        "(default: stdout)")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="number of timing runs of each benchmark")
+    parser.add_argument("-k", "--only", action="append", default=[],
+                        help="run benchmarks whose name contains the text")
+    parser.add_argument("--compare", help="JSON result of a base revision")
+    parser.add_argument("--list", action="store_true",
+                        help="list benchmark names")
+    args = parser.parse_args()
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return
+    names = [n for n in BENCHMARKS
+             if not args.only or any(k in n for k in args.only)]
+    result = run(names, args.repeat)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(result, json.load(f))
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,24 +21,20 @@ metayaml["about"]["license"] = conf["setuppy"]["license"]
 with open(path.join(here, "./conda-recipe/meta.yaml"), "wt") as f:
     json.dump(metayaml, f)
 
-ignore_cython = False
-ext = None
+exts = []
 
+# C++ sources generated by Cython are not distributed, so Cython is
+# required to build the extensions.
 try:
     from Cython.Distutils import build_ext
-    ext = Extension(
-        "chorus.cython.mcsdr", ["chorus/cython/mcsdr.pyx"], language="c++"
-    )
+    for name in ("mcsdr", "vf2"):
+        exts.append(Extension(
+            "chorus.cython." + name, ["chorus/cython/{}.pyx".format(name)],
+            language="c++"
+        ))
 except ImportError:
-    if ignore_cython:
-        from distutils.command.build_ext import build_ext
-        ext = Extension(
-            "chorus.cython.mcsdr", ["chorus/cython/mcsdr.cpp"]
-        )
-        print("Cython is not available. Distribute C++ source files.")
-    else:
-        print("Error: Cython is required.")
-        sys.exit()
+    print("Error: Cython is required.")
+    sys.exit()
 
 # setup
 setup_dict = conf["setuppy"]
@@ -49,7 +45,7 @@ setup_dict["packages"] = find_packages(exclude=["chorus.test*"])
 setup_dict["package_data"] = {
     "": ["*.yaml", "resources/test/*.mol", "resources/DrugBank/*.mol"]
 }
-setup_dict["ext_modules"] = [ext]
+setup_dict["ext_modules"] = exts
 setup_dict["cmdclass"] = {'build_ext': build_ext}
 
 setup(**setup_dict)